@@ -71,6 +71,8 @@ async def run_demo():
         print("\n" + "-"*40 + "\n")
         time.sleep(2)
 
+    await session_memory_manager.aclose()
+
 import argparse
 
 async def replay_demo(session_id):
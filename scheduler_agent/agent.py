@@ -3,7 +3,7 @@ from google.adk.tools import load_memory, preload_memory
 from google.adk.agents import LlmAgent
 from google.adk.runners import Runner
 from .auth import get_api_key
-from .datetime_utils import get_current_datetime_context
+from .datetime_utils import add_datetime_context
 from .email_utils import validate_emails
 from .sub_agents import (
     availability_checker_agent,
@@ -38,9 +38,7 @@ root_agent = LlmAgent(
     name="calendar_coordinator",
     model="gemini-2.5-flash",
     description="Coordinates calendar scheduling by delegating to specialized sub-agents, with mandatory location collection and smart holiday checking.",
-    instruction=f"""
-    {get_current_datetime_context()}
-
+    instruction="""
     You are the **Calendar Coordinator** - the main orchestrator for scheduling meetings.
     You coordinate specialized sub-agents and use tools for validation and holiday checking.
     
@@ -205,6 +203,7 @@ root_agent = LlmAgent(
         load_memory,
         preload_memory,
     ],
+    before_model_callback=add_datetime_context,
     after_agent_callback=auto_save_session_to_memory,
 )
 
@@ -1,6 +1,7 @@
 # auth.py
 import os
 import pathlib
+import threading
 from dotenv import load_dotenv
 
 # Google OAuth libraries
@@ -80,9 +81,28 @@ def get_credentials():
 # ---------------------------------------------------
 #   Calendar API service
 # ---------------------------------------------------
+# Built once per thread and reused: building the client (and loading
+# credentials) costs far more than the API calls it makes. httplib2, which
+# the client uses, isn't thread-safe, so threads don't share one.
+_service_local = threading.local()
+_credentials = None
+_credentials_lock = threading.Lock()
+
+
+def _cached_credentials():
+    global _credentials
+    with _credentials_lock:
+        if _credentials is None:
+            # Expired tokens are refreshed by the client on its next request
+            _credentials = get_credentials()
+        return _credentials
+
+
 def get_calendar_service():
-    creds = get_credentials()
-    service = build("calendar", "v3", credentials=creds)
+    service = getattr(_service_local, "service", None)
+    if service is None:
+        service = build("calendar", "v3", credentials=_cached_credentials())
+        _service_local.service = service
     return service
 
 
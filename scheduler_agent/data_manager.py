@@ -1,120 +1,110 @@
 import json
-import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 
 class DataManager:
     def __init__(self, users_file: str, facilities_file: str):
-        self.users_df = self._load_users(users_file)
-        self.facilities_df = self._load_facilities(facilities_file)
+        self.users = self._load_users(users_file)
+        self.facilities = self._load_facilities(facilities_file)
+        self._build_indexes()
 
-    def _load_users(self, filepath: str) -> pd.DataFrame:
+    def _load_users(self, filepath: str) -> List[Dict[str, Any]]:
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
             # Normalize 'users' key if present, otherwise assume list
             users_list = data.get('users', data) if isinstance(data, dict) else data
-            return pd.DataFrame(users_list)
+            return list(users_list)
         except Exception as e:
             print(f"Error loading users: {e}")
-            return pd.DataFrame()
+            return []
 
-    def _load_facilities(self, filepath: str) -> pd.DataFrame:
+    def _load_facilities(self, filepath: str) -> List[Dict[str, Any]]:
         try:
             with open(filepath, 'r') as f:
                 data = json.load(f)
-            return pd.DataFrame(data)
+            return list(data)
         except Exception as e:
             print(f"Error loading facilities: {e}")
-            return pd.DataFrame()
+            return []
+
+    def _build_indexes(self) -> None:
+        """
+        Index the loaded records by their (lower-cased) lookup keys so each
+        query is a dict lookup instead of a scan. The first record wins when
+        two share a key.
+        """
+        self._team_to_emails: Dict[str, List[str]] = {}
+        self._users_by_email: Dict[str, Dict[str, Any]] = {}
+        self._users_by_name: Dict[str, Dict[str, Any]] = {}
+        for user in self.users:
+            teams = user.get('teams')
+            if isinstance(teams, list) and 'email' in user:
+                # A user listed twice in one team still counts once
+                for team in dict.fromkeys(t.lower() for t in teams):
+                    self._team_to_emails.setdefault(team, []).append(user['email'])
+            if isinstance(user.get('email'), str):
+                self._users_by_email.setdefault(user['email'].lower(), user)
+            if isinstance(user.get('username'), str):
+                self._users_by_name.setdefault(user['username'].lower(), user)
+
+        self._facility_by_name: Dict[str, Dict[str, Any]] = {}
+        # Amenity -> positions in self.facilities, so results keep file order
+        self._amenity_to_facilities: Dict[str, Set[int]] = {}
+        for i, facility in enumerate(self.facilities):
+            if isinstance(facility.get('name'), str):
+                self._facility_by_name.setdefault(facility['name'].lower(), facility)
+            amenities = facility.get('amenities')
+            if isinstance(amenities, list):
+                for amenity in amenities:
+                    self._amenity_to_facilities.setdefault(amenity.lower(), set()).add(i)
 
     def get_team_members(self, team_name: str) -> List[str]:
         """
         Returns a list of email addresses for members of the specified team.
         Case-insensitive match on team name.
         """
-        if self.users_df.empty:
-            return []
-        
-        # Explode teams column if it's a list, or check string containment
-        # Assuming 'teams' is a list of strings based on file preview
-        
-        # Filter users where team_name is in their 'teams' list
-        # We use apply because 'teams' is a list object in the cell
-        try:
-            team_members = self.users_df[
-                self.users_df['teams'].apply(
-                    lambda teams: any(t.lower() == team_name.lower() for t in teams) 
-                    if isinstance(teams, list) else False
-                )
-            ]
-            return team_members['email'].tolist()
-        except KeyError:
-            return []
+        return list(self._team_to_emails.get(team_name.lower(), []))
 
     def get_user_details(self, email_or_name: str) -> Optional[Dict[str, Any]]:
         """
         Returns full details for a specific user by email or username.
         Case-insensitive match.
         """
-        if self.users_df.empty:
-            return None
-            
         query = email_or_name.lower()
         
-        # Try matching by email first
-        match = self.users_df[self.users_df['email'].str.lower() == query]
-        
-        # If no match, try username
-        if match.empty:
-            match = self.users_df[self.users_df['username'].str.lower() == query]
-            
-        if not match.empty:
-            return match.iloc[0].to_dict()
-        return None
+        # Try matching by email first, then username
+        user = self._users_by_email.get(query) or self._users_by_name.get(query)
+        return dict(user) if user is not None else None
 
     def get_facility_info(self, facility_name: str) -> Optional[Dict[str, Any]]:
         """
         Returns details for a specific facility by name.
         """
-        if self.facilities_df.empty:
-            return None
-            
-        match = self.facilities_df[
-            self.facilities_df['name'].str.lower() == facility_name.lower()
-        ]
-        
-        if not match.empty:
-            return match.iloc[0].to_dict()
-        return None
+        facility = self._facility_by_name.get(facility_name.lower())
+        return dict(facility) if facility is not None else None
 
     def find_facility(self, capacity: int = 0, amenities: List[str] = None) -> List[Dict[str, Any]]:
         """
         Finds facilities matching minimum capacity and containing ALL specified amenities.
         """
-        if self.facilities_df.empty:
-            return []
-            
-        df = self.facilities_df.copy()
-        
-        # Filter by capacity
-        if capacity > 0:
-            df = df[df['capacity'] >= capacity]
-            
-        # Filter by amenities
         if amenities:
-            # Normalize amenities to lower case for comparison
-            required_amenities = [a.lower() for a in amenities]
-            
-            def has_all_amenities(facility_amenities):
-                if not isinstance(facility_amenities, list):
-                    return False
-                fac_amenities_lower = [a.lower() for a in facility_amenities]
-                return all(req in fac_amenities_lower for req in required_amenities)
-                
-            df = df[df['amenities'].apply(has_all_amenities)]
-            
-        return df.to_dict('records')
+            # Facilities having every required amenity (case-insensitive)
+            candidates = set.intersection(*(
+                self._amenity_to_facilities.get(a.lower(), set()) for a in amenities
+            ))
+            positions = sorted(candidates)
+        else:
+            positions = range(len(self.facilities))
+
+        matches = []
+        for i in positions:
+            facility = self.facilities[i]
+            # Filter by capacity
+            if capacity > 0 and not (facility.get('capacity') or 0) >= capacity:
+                continue
+            matches.append(dict(facility))
+        return matches
 
 # Global instance (can be initialized later)
 _data_manager = None
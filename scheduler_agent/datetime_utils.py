@@ -1,20 +1,24 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 def get_local_timezone():
     """
     Auto-detect the system's local timezone.
     Returns a timezone object (ZoneInfo or datetime.timezone).
+    Not cached: the result is a fixed UTC offset, which changes with DST.
     """
     # Get local timezone using datetime
     local_tz = datetime.now().astimezone().tzinfo
     return local_tz
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
     """
     Accepts DD-MM-YYYY or YYYY-MM-DD
     Returns Python datetime.date
+    Results are cached: the same few dates are parsed over and over.
     """
     try:
         return datetime.strptime(date_str, "%d-%m-%Y").date()
@@ -22,6 +26,7 @@ def parse_date(date_str):
         return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
+@lru_cache(maxsize=4096)
 def parse_time(time_str):
     """
     Accepts:
@@ -30,7 +35,7 @@ def parse_time(time_str):
         "2h"
         "30min"
         "1h 30m"
-    Returns timedelta OR time object
+    Returns timedelta OR time object (cached, like parse_date)
     """
 
     time_str = time_str.lower().strip()
@@ -52,6 +57,24 @@ def parse_time(time_str):
     raise ValueError("Invalid time format.")
 
 
+@lru_cache(maxsize=128)
+def _zone(name):
+    return ZoneInfo(name)
+
+
+def resolve_timezone(tz=None):
+    """
+    Return a tzinfo for a timezone name, tzinfo object or None (system timezone).
+    Names are resolved once and the ZoneInfo reused, so callers converting
+    several times can resolve up front and pass the object along.
+    """
+    if tz is None:
+        return get_local_timezone()
+    if isinstance(tz, str):
+        return _zone(tz)
+    return tz
+
+
 def to_iso(date_obj=None, time_obj=None, local_tz=None):
     """
     Convert date + time or datetime into ISO string in UTC (RFC3339 format).
@@ -74,7 +97,7 @@ def to_iso(date_obj=None, time_obj=None, local_tz=None):
     if isinstance(date_obj, datetime) and isinstance(time_obj, str):
         local_dt = date_obj
         tz_name = time_obj
-        tz = ZoneInfo(tz_name)
+        tz = resolve_timezone(tz_name)
         local = local_dt.replace(tzinfo=tz)
         utc = local.astimezone(timezone.utc)
         return utc.isoformat()
@@ -83,13 +106,8 @@ def to_iso(date_obj=None, time_obj=None, local_tz=None):
     if isinstance(time_obj, timedelta):
         raise ValueError("Duration cannot be converted to ISO start time.")
     
-    # Auto-detect timezone if not provided
-    if local_tz is None:
-        local_tz = get_local_timezone()
-    
-    # Handle timezone as string (convert to ZoneInfo)
-    if isinstance(local_tz, str):
-        local_tz = ZoneInfo(local_tz)
+    # Auto-detect timezone if not provided; names become ZoneInfo objects
+    local_tz = resolve_timezone(local_tz)
     
     # Combine date and time into naive datetime
     dt = datetime.combine(date_obj, time_obj)
@@ -106,7 +124,21 @@ def to_iso(date_obj=None, time_obj=None, local_tz=None):
 
 def get_current_datetime_context():
     """Get current date/time information for the agent."""
-    now = datetime.now()
+    # The text only has minute resolution, so it is rebuilt at most once a minute.
+    return _datetime_context_for(datetime.now().replace(second=0, microsecond=0))
+
+
+def add_datetime_context(callback_context, llm_request):
+    """
+    before_model_callback that adds the current date/time context to the
+    system instruction, so it is fresh on every model call rather than fixed
+    when the agent module was imported.
+    """
+    llm_request.append_instructions([get_current_datetime_context()])
+
+
+@lru_cache(maxsize=1)
+def _datetime_context_for(now):
     return f"""
 Current date and time: {now.strftime('%Y-%m-%d %H:%M')} ({now.strftime('%A, %B %d, %Y')})
 
@@ -5,11 +5,28 @@ This package contains specialized sub-agents that can run in parallel
 to improve performance and capabilities.
 """
 
-from .availability_checker import AvailabilityCheckerAgent
-from .parallel_coordinator import ParallelAvailabilityCoordinator
+import importlib
+
 from .policy_engine import PolicyEngine, PolicyViolation, PolicySeverity
 from .validation_agent import ConflictValidationAgent, ValidationDimension, ValidationResult
 
+# The availability modules import the Google API client, so they are only
+# loaded when first accessed.
+_LAZY_IMPORTS = {
+    'AvailabilityCheckerAgent': '.availability_checker',
+    'ParallelAvailabilityCoordinator': '.parallel_coordinator',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Stage 1: Parallel Availability Checking
     'AvailabilityCheckerAgent',
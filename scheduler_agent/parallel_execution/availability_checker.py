@@ -6,10 +6,135 @@ allowing for parallel execution when checking multiple attendees.
 """
 
 import asyncio
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from time import monotonic
+from typing import Dict, Any, List, Optional, Tuple
 from ..auth import get_calendar_service
-from ..datetime_utils import parse_date, parse_time, to_iso, get_local_timezone
+from ..datetime_utils import parse_date, parse_time, to_iso, get_local_timezone, resolve_timezone
+
+
+# Google's per-user FreeBusy quota: 500 queries per 100 seconds.
+FREEBUSY_QUOTA_PER_SECOND = 5.0
+FREEBUSY_QUOTA_BURST = 500
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing bursts of up to ``burst`` calls, refilled at
+    ``rate_per_sec`` calls per second.
+    
+    Each acquire() takes its token immediately (the count may go negative)
+    and sleeps until the token would have been available, so waiters are
+    served in call order. A waiter that is cancelled (e.g. by a timeout)
+    gives its token back. No asyncio primitives are held, so one bucket can
+    be shared across event loops.
+    """
+    
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate_per_sec = rate_per_sec
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before using it"""
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate_per_sec
+    
+    def _refund(self) -> None:
+        """Return a token taken by _reserve() that will not be used"""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+    
+    async def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._refund()
+                raise
+
+
+# Shared by every checker: the quota is per user, not per agent.
+_freebusy_bucket = TokenBucket(FREEBUSY_QUOTA_PER_SECOND, FREEBUSY_QUOTA_BURST)
+
+# Recent per-attendee answers, keyed by (email, timeMin, timeMax). Meetings
+# are often re-checked for the same people and slot; creating an event
+# clears the cache (see tools.availability.clear_availability_cache).
+FREEBUSY_CACHE_TTL_SECONDS = 30
+FREEBUSY_CACHE_MAX_SIZE = 2048
+_freebusy_cache = OrderedDict()
+_freebusy_cache_lock = threading.Lock()
+
+
+def clear_freebusy_cache() -> None:
+    """Forget cached FreeBusy answers (called after calendars change)."""
+    with _freebusy_cache_lock:
+        _freebusy_cache.clear()
+
+
+def _cached_freebusy(emails: List[str], start_iso: str, end_iso: str) -> Dict[str, Dict[str, Any]]:
+    """Recent answers for whichever of emails have one, keyed by email"""
+    now = monotonic()
+    results = {}
+    with _freebusy_cache_lock:
+        for email in emails:
+            key = (email, start_iso, end_iso)
+            entry = _freebusy_cache.get(key)
+            if entry is not None and entry[0] > now:
+                _freebusy_cache.move_to_end(key)
+                results[email] = dict(entry[1])
+    return results
+
+
+@lru_cache(maxsize=256)
+def _freebusy_window(date: str, start_time: str, end_time: str, timezone: Optional[str]) -> Tuple[str, str]:
+    """
+    timeMin/timeMax for a slot.
+    
+    Cached because every attendee of a meeting is checked against the same
+    slot; parsing errors are raised (and not cached) as before.
+    """
+    # Get timezone
+    if timezone is None:
+        tz = get_local_timezone()
+        if hasattr(tz, 'zone'):
+            timezone = tz.zone
+        else:
+            timezone = 'UTC'
+
+    # Parse date and times
+    date_obj = parse_date(date)
+    start_t = parse_time(start_time)
+    end_t = parse_time(end_time)
+
+    if isinstance(start_t, timedelta):
+        raise ValueError("Start time cannot be a duration")
+
+    # Convert duration to end time if needed
+    if isinstance(end_t, timedelta):
+        dt_start = datetime.combine(date_obj, start_t)
+        dt_end = dt_start + end_t
+        end_t = dt_end.time()
+        date_obj_end = dt_end.date()
+    else:
+        date_obj_end = date_obj
+
+    # Convert to UTC ISO format for API
+    # Resolve the timezone once for both conversions
+    tz = resolve_timezone(timezone)
+    start_iso = to_iso(date_obj, start_t, tz)
+    end_iso = to_iso(date_obj_end, end_t, tz)
+    return start_iso, end_iso
 
 
 class AvailabilityCheckerAgent:
@@ -29,21 +154,27 @@ class AvailabilityCheckerAgent:
         )
     """
     
-    def __init__(self, timeout_seconds: int = 3):
+    def __init__(self, timeout_seconds: Optional[float] = 3):
         """
         Initialize the availability checker sub-agent.
         
         Args:
-            timeout_seconds: Maximum time to wait for API response
+            timeout_seconds: Maximum time to wait for API response. None means
+                no per-call timeout, for callers that enforce one deadline
+                over many checks.
         """
         self.timeout_seconds = timeout_seconds
+        # Set to use a specific service; otherwise each worker thread uses its own
         self.service = None
     
     def _get_service(self):
-        """Lazy load calendar service"""
-        if self.service is None:
-            self.service = get_calendar_service()
-        return self.service
+        """Calendar service for the current worker thread"""
+        # Not cached on the agent: checks run on executor threads, and the
+        # client can't be shared between them. get_calendar_service() already
+        # builds one client per thread and loads the credentials only once.
+        if self.service is not None:
+            return self.service
+        return get_calendar_service()
     
     async def check_availability(
         self,
@@ -75,11 +206,12 @@ class AvailabilityCheckerAgent:
         start_exec = datetime.now()
         
         try:
-            # Run the check with timeout
-            result = await asyncio.wait_for(
-                self._check_availability_impl(email, date, start_time, end_time, timezone),
-                timeout=self.timeout_seconds
-            )
+            check = self._check_availability_impl(email, date, start_time, end_time, timezone)
+            if self.timeout_seconds is None:
+                result = await check
+            else:
+                # Run the check with timeout
+                result = await asyncio.wait_for(check, timeout=self.timeout_seconds)
             
             execution_time = (datetime.now() - start_exec).total_seconds()
             result["execution_time"] = execution_time
@@ -116,97 +248,163 @@ class AvailabilityCheckerAgent:
         
         This is wrapped by check_availability() for timeout handling.
         """
-        # Run the blocking I/O in a thread pool to not block the event loop
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None,
-            self._check_freebusy,
-            email, date, start_time, end_time, timezone
-        )
-        return result
+        results = await self._check_availability_batch_impl([email], date, start_time, end_time, timezone)
+        return results[0]
     
-    def _check_freebusy(
+    async def check_availability_batch(
         self,
-        email: str,
+        emails: List[str],
         date: str,
         start_time: str,
         end_time: str,
         timezone: str = None
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """
-        Check FreeBusy status using Google Calendar API.
+        Check several attendees with a single FreeBusy request.
         
-        This is a synchronous function that will be run in a thread pool.
+        The FreeBusy API accepts multiple calendars per query, so this costs one
+        HTTP round-trip regardless of the number of attendees (the API caps a
+        query at 50 calendars; callers should batch accordingly).
+        
+        Args:
+            emails: Attendee email addresses
+            date: Date string (DD-MM-YYYY or YYYY-MM-DD)
+            start_time: Start time "HH:MM"
+            end_time: End time "HH:MM" or duration "2hr"
+            timezone: Timezone name (e.g., 'Asia/Singapore'). If None, uses system timezone
+        
+        Returns:
+            One result per email, in input order, shaped like check_availability()
         """
-        service = self._get_service()
+        start_exec = datetime.now()
         
-        # Get timezone
-        if timezone is None:
-            tz = get_local_timezone()
-            if hasattr(tz, 'zone'):
-                timezone = tz.zone
-            else:
-                timezone = 'UTC'
-        
-        # Parse date and times
-        date_obj = parse_date(date)
-        start_t = parse_time(start_time)
-        end_t = parse_time(end_time)
-        
-        if isinstance(start_t, timedelta):
-            raise ValueError("Start time cannot be a duration")
-        
-        # Convert duration to end time if needed
-        if isinstance(end_t, timedelta):
-            dt_start = datetime.combine(date_obj, start_t)
-            dt_end = dt_start + end_t
-            end_t = dt_end.time()
-            date_obj_end = dt_end.date()
-        else:
-            date_obj_end = date_obj
+        try:
+            results = await asyncio.wait_for(
+                self._check_availability_batch_impl(emails, date, start_time, end_time, timezone),
+                timeout=self.timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            return [
+                {
+                    "email": email,
+                    "available": False,
+                    "conflicts": [],
+                    "error": f"Timeout after {self.timeout_seconds} seconds",
+                    "execution_time": self.timeout_seconds
+                }
+                for email in emails
+            ]
+        except Exception as e:
+            results = [
+                {
+                    "email": email,
+                    "available": False,
+                    "conflicts": [],
+                    "error": str(e)
+                }
+                for email in emails
+            ]
+        
+        execution_time = (datetime.now() - start_exec).total_seconds()
+        for result in results:
+            result["execution_time"] = execution_time
+        return results
+    
+    async def _check_availability_batch_impl(
+        self,
+        emails: List[str],
+        date: str,
+        start_time: str,
+        end_time: str,
+        timezone: str = None
+    ) -> List[Dict[str, Any]]:
+        """Rate-limited batch query, wrapped by check_availability_batch() for timeout handling"""
+        start_iso, end_iso = _freebusy_window(date, start_time, end_time, timezone)
+        
+        # Reuse recent answers; only the remaining emails are queried, and a
+        # fully cached check takes no quota token
+        results = _cached_freebusy(emails, start_iso, end_iso)
+        missing = [email for email in emails if email not in results]
+        if missing:
+            await _freebusy_bucket.acquire()
+            # Run the blocking I/O in a thread pool to not block the event loop
+            loop = asyncio.get_event_loop()
+            results.update(await loop.run_in_executor(
+                None,
+                self._query_freebusy,
+                missing, start_iso, end_iso
+            ))
+        return [results[email] for email in emails]
+    
+    def _query_freebusy(
+        self,
+        missing: List[str],
+        start_iso: str,
+        end_iso: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Query FreeBusy for all emails at once, keyed by email.
         
-        # Convert to UTC ISO format for API
-        start_iso = to_iso(date_obj, start_t, timezone)
-        end_iso = to_iso(date_obj_end, end_t, timezone)
+        This is a synchronous function that will be run in a thread pool.
+        """
+        results = {}
+        service = self._get_service()
         
-        # Query FreeBusy API for this specific email
+        # Query FreeBusy API for all emails in one request
         try:
             body = {
                 "timeMin": start_iso,
                 "timeMax": end_iso,
                 "timeZone": "UTC",
-                "items": [{"id": email}]
+                "items": [{"id": email} for email in missing]
             }
             
             freebusy_result = service.freebusy().query(body=body).execute()
-            
-            # Parse result
-            calendar_info = freebusy_result.get('calendars', {}).get(email, {})
+        except Exception as e:
+            for email in missing:
+                results[email] = {
+                    "email": email,
+                    "available": False,
+                    "conflicts": [],
+                    "error": f"API error: {str(e)}"
+                }
+            return results
+        
+        calendars = freebusy_result.get('calendars', {})
+        
+        for email in missing:
+            calendar_info = calendars.get(email, {})
             
             # Check for errors (e.g., calendar not accessible)
             if 'errors' in calendar_info:
                 error_msg = calendar_info['errors'][0].get('reason', 'Unknown error')
-                return {
+                results[email] = {
                     "email": email,
                     "available": False,
                     "conflicts": [],
                     "error": f"Calendar access error: {error_msg}"
                 }
+                continue
             
             # Get busy times
             busy_times = calendar_info.get('busy', [])
             
-            return {
+            results[email] = {
                 "email": email,
                 "available": len(busy_times) == 0,
                 "conflicts": busy_times,
                 "error": None
             }
-            
-        except Exception as e:
-            return {
-                "email": email,
-                "available": False,
-                "conflicts": [],
-                "error": f"API error: {str(e)}"
-            }
+        
+        # Only answers are cached; errors are retried on the next check
+        expires_at = monotonic() + FREEBUSY_CACHE_TTL_SECONDS
+        with _freebusy_cache_lock:
+            for email in missing:
+                if results[email]["error"] is None:
+                    key = (email, start_iso, end_iso)
+                    _freebusy_cache[key] = (expires_at, dict(results[email]))
+                    _freebusy_cache.move_to_end(key)
+            while len(_freebusy_cache) > FREEBUSY_CACHE_MAX_SIZE:
+                _freebusy_cache.popitem(last=False)
+        
+        return results
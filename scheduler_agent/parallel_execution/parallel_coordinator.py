@@ -7,7 +7,7 @@ them in parallel to dramatically speed up multi-attendee availability checking.
 
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Awaitable, Callable, List, Dict, Any, Optional
 from .availability_checker import AvailabilityCheckerAgent
 
 # Optional integration with ReasoningEngine
@@ -42,19 +42,52 @@ class ParallelAvailabilityCoordinator:
         self,
         timeout_seconds: int = 3,
         max_parallel: int = 50,
-        reasoning_engine: Optional['ReasoningEngine'] = None
+        reasoning_engine: Optional['ReasoningEngine'] = None,
+        batch_freebusy: bool = True
     ):
         """
         Initialize the parallel availability coordinator.
         
         Args:
-            timeout_seconds: Maximum time to wait per attendee
-            max_parallel: Maximum number of parallel checks (safety limit)
+            timeout_seconds: Maximum time to wait for a set of checks (one
+                FreeBusy query, or all per-attendee sub-agents together)
+            max_parallel: Maximum number of parallel checks (safety limit). In
+                batch mode this is also the number of calendars per FreeBusy query.
             reasoning_engine: Optional ReasoningEngine for observable reasoning
+            batch_freebusy: If True, check up to max_parallel attendees with one
+                FreeBusy request. If False, spawn one sub-agent (and request) per
+                attendee, which allows short_circuit_on_busy to cancel work early.
         """
         self.timeout_seconds = timeout_seconds
         self.max_parallel = max_parallel
         self.reasoning_engine = reasoning_engine
+        self.batch_freebusy = batch_freebusy
+        # Lookups currently running, by query key, with their waiter count;
+        # concurrent identical checks await the same task.
+        self._inflight: Dict[tuple, list] = {}
+    
+    def _shared(self, key: tuple, make_check: Callable[[], Awaitable]) -> asyncio.Future:
+        """
+        Return a future for key's lookup, joining one already in flight if any.
+        
+        Cancelling the returned future only cancels the lookup itself when no
+        other caller is still waiting on it.
+        """
+        entry = self._inflight.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(make_check())
+            entry = self._inflight[key] = [task, 0]
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        entry[1] += 1
+        waiter = asyncio.shield(entry[0])
+        
+        def release(fut):
+            entry[1] -= 1
+            if fut.cancelled() and entry[1] == 0:
+                entry[0].cancel()
+        
+        waiter.add_done_callback(release)
+        return waiter
     
     def _log_thought(self, content: str, thought_type=None):
         """Log a thought if reasoning engine is available"""
@@ -69,7 +102,8 @@ class ParallelAvailabilityCoordinator:
         date: str,
         start_time: str,
         end_time: str,
-        timezone: str = None
+        timezone: str = None,
+        short_circuit_on_busy: bool = False
     ) -> Dict[str, Any]:
         """
         Check availability for all attendees in parallel.
@@ -80,6 +114,12 @@ class ParallelAvailabilityCoordinator:
             start_time: Start time "HH:MM"
             end_time: End time "HH:MM" or duration "2hr"
             timezone: Timezone name. If None, uses system timezone
+            short_circuit_on_busy: If True, cancel the remaining checks as soon as
+                one attendee is busy. Use when the caller only needs to know whether
+                the slot works for everyone; cancelled attendees are left out of
+                the per-attendee results and counts. Within a batch this only
+                applies with batch_freebusy=False, since a batched query answers
+                for all attendees at once.
         
         Returns:
             {
@@ -91,6 +131,7 @@ class ParallelAvailabilityCoordinator:
                 "busy_attendees": {email: [conflicts]},
                 "errors": {email: error_msg},
                 "execution_time": float,
+                "first_result_time": float,  # when the earliest answer arrived
                 "parallelization_factor": float  # speedup vs sequential
             }
         """
@@ -107,12 +148,14 @@ class ParallelAvailabilityCoordinator:
                 "busy_attendees": {},
                 "errors": {},
                 "execution_time": 0.0,
+                "first_result_time": 0.0,
                 "parallelization_factor": 1.0
             }
         
-        # Clean and deduplicate attendees
-        attendees = [email.strip() for email in attendees if email.strip()]
-        attendees = list(set(attendees))  # Remove duplicates
+        # Clean and deduplicate attendees (first occurrence wins, order kept)
+        attendees = list(dict.fromkeys(
+            email.strip() for email in attendees if email.strip()
+        ))
         
         num_attendees = len(attendees)
         
@@ -130,68 +173,74 @@ class ParallelAvailabilityCoordinator:
             )
             # Process in batches
             return await self._check_in_batches(
-                attendees, date, start_time, end_time, timezone
+                attendees, date, start_time, end_time, timezone,
+                short_circuit_on_busy
             )
         
-        self._log_thought(
-            f"Spawning {num_attendees} AvailabilityChecker sub-agents",
-            ThoughtType.DECISION if REASONING_AVAILABLE else None
-        )
-        
-        # Create sub-agents
-        agents = [
-            AvailabilityCheckerAgent(timeout_seconds=self.timeout_seconds)
-            for _ in attendees
-        ]
+        if self.batch_freebusy:
+            self._log_thought(
+                f"Querying {num_attendees} calendars with a single FreeBusy request",
+                ThoughtType.DECISION if REASONING_AVAILABLE else None
+            )
+            checker = AvailabilityCheckerAgent(timeout_seconds=self.timeout_seconds)
+            results = await self._shared(
+                ("batch", tuple(attendees), date, start_time, end_time, timezone),
+                lambda: checker.check_availability_batch(
+                    attendees, date, start_time, end_time, timezone
+                )
+            )
+        else:
+            results = await self._check_individually(
+                attendees, date, start_time, end_time, timezone,
+                short_circuit_on_busy
+            )
         
-        #Create tasks for parallel execution
-        tasks = [
-            agent.check_availability(email, date, start_time, end_time, timezone)
-            for agent, email in zip(agents, attendees)
+        # Classify results: one comprehension per bucket
+        checked = [r for r in results if not isinstance(r, Exception)]
+        exceptions = [r for r in results if isinstance(r, Exception)]
+        errors = {r["email"]: r["error"] for r in checked if r["error"]}
+        available_attendees = [
+            r["email"] for r in checked if not r["error"] and r["available"]
         ]
+        busy_attendees = {
+            r["email"]: r["conflicts"]
+            for r in checked if not r["error"] and not r["available"]
+        }
         
-        # Run all checks in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Process results
-        available_attendees = []
-        busy_attendees = {}
-        errors = {}
-        
-        for result in results:
-            # Handle exceptions
-            if isinstance(result, Exception):
-                email = "unknown"
-                errors[email] = str(result)
+        # Per-attendee reasoning is only worth building when someone listens
+        if self.reasoning_engine:
+            for email, error in errors.items():
                 self._log_thought(
-                    f"Sub-agent exception: {str(result)}",
+                    f"{email}: Error - {error}",
                     ThoughtType.CONCERN if REASONING_AVAILABLE else None
                 )
-                continue
-            
-            email = result["email"]
-            
-            if result["error"]:
-                errors[email] = result["error"]
+            for exc in exceptions:
                 self._log_thought(
-                    f"{email}: Error - {result['error']}",
+                    f"Sub-agent exception: {str(exc)}",
                     ThoughtType.CONCERN if REASONING_AVAILABLE else None
                 )
-            elif result["available"]:
-                available_attendees.append(email)
+            for email in available_attendees:
                 self._log_thought(
                     f"{email}: Available",
                     ThoughtType.VALIDATION if REASONING_AVAILABLE else None
                 )
-            else:
-                busy_attendees[email] = result["conflicts"]
+            for email, conflicts in busy_attendees.items():
                 self._log_thought(
-                    f"{email}: Busy ({len(result['conflicts'])} conflict(s))",
+                    f"{email}: Busy ({len(conflicts)} conflict(s))",
                     ThoughtType.CONCERN if REASONING_AVAILABLE else None
                 )
         
+        if exceptions:
+            errors["unknown"] = str(exceptions[-1])
+        
         # Calculate metrics
         execution_time = (datetime.now() - start_time_exec).total_seconds()
+        # Each result carries its own elapsed time; per-attendee checks are
+        # handled as they complete, so the earliest one was usable this soon
+        first_result_time = min(
+            (r.get("execution_time", execution_time) for r in checked),
+            default=execution_time
+        )
         available_count = len(available_attendees)
         busy_count = len(busy_attendees)
         error_count = len(errors)
@@ -217,21 +266,117 @@ class ParallelAvailabilityCoordinator:
             "busy_attendees": busy_attendees,
             "errors": errors,
             "execution_time": execution_time,
+            "first_result_time": first_result_time,
             "parallelization_factor": parallelization_factor
         }
     
+    async def _check_individually(
+        self,
+        attendees: List[str],
+        date: str,
+        start_time: str,
+        end_time: str,
+        timezone: str = None,
+        short_circuit_on_busy: bool = False
+    ) -> List[Any]:
+        """
+        Spawn one AvailabilityChecker sub-agent per attendee and run them in parallel.
+        
+        The sub-agents run without their own timeouts; one deadline of
+        timeout_seconds covers the whole set, and attendees still unanswered
+        when it passes are reported as timed out.
+        
+        Returns the per-attendee results (or exceptions) in completion order.
+        """
+        self._log_thought(
+            f"Spawning {len(attendees)} AvailabilityChecker sub-agents",
+            ThoughtType.DECISION if REASONING_AVAILABLE else None
+        )
+        
+        # Create sub-agents
+        agents = [
+            AvailabilityCheckerAgent(timeout_seconds=None)
+            for _ in attendees
+        ]
+        
+        #Create tasks for parallel execution
+        tasks = {
+            self._shared(
+                ("one", email, date, start_time, end_time, timezone),
+                lambda agent=agent, email=email: agent.check_availability(
+                    email, date, start_time, end_time, timezone
+                )
+            ): email
+            for agent, email in zip(agents, attendees)
+        }
+        
+        # Run all checks in parallel, handling each result as it completes
+        results = []
+        try:
+            for next_result in asyncio.as_completed(tasks, timeout=self.timeout_seconds):
+                try:
+                    result = await next_result
+                except asyncio.TimeoutError:
+                    raise
+                except Exception as e:
+                    result = e
+                results.append(result)
+                
+                if (
+                    short_circuit_on_busy
+                    and isinstance(result, dict)
+                    and not result["error"]
+                    and not result["available"]
+                ):
+                    pending = [task for task in tasks if not task.done()]
+                    if pending:
+                        self._log_thought(
+                            f"{result['email']} is busy - cancelling {len(pending)} remaining check(s)",
+                            ThoughtType.DECISION if REASONING_AVAILABLE else None
+                        )
+                        for task in pending:
+                            task.cancel()
+                        await asyncio.gather(*pending, return_exceptions=True)
+                    break
+        except asyncio.TimeoutError:
+            pending = [task for task in tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            results.extend(
+                {
+                    "email": tasks[task],
+                    "available": False,
+                    "conflicts": [],
+                    "error": f"Timeout after {self.timeout_seconds} seconds",
+                    "execution_time": self.timeout_seconds
+                }
+                for task in pending
+            )
+        finally:
+            # If the caller is cancelled or something unexpected escapes,
+            # don't leave the remaining lookups running unobserved
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        return results
+    
     async def _check_in_batches(
         self,
         attendees: List[str],
         date: str,
         start_time: str,
         end_time: str,
-        timezone: str = None
+        timezone: str = None,
+        short_circuit_on_busy: bool = False
     ) -> Dict[str, Any]:
         """
         Check attendees in batches when number exceeds max_parallel.
         
         This prevents overwhelming the system with too many concurrent requests.
+        With short_circuit_on_busy, no further batches are started once an
+        attendee is found busy.
         """
         all_results = {
             "all_available": True,
@@ -242,38 +387,54 @@ class ParallelAvailabilityCoordinator:
             "busy_attendees": {},
             "errors": {},
             "execution_time": 0.0,
+            "first_result_time": 0.0,
             "parallelization_factor": 1.0
         }
         
         start_time_exec = datetime.now()
         
+        # Read the limit once: max_parallel may be changed for later meetings
+        # while this one is still running
+        batch_size = self.max_parallel
+        
         # Process in batches
-        for i in range(0, len(attendees), self.max_parallel):
-            batch = attendees[i:i + self.max_parallel]
+        for i in range(0, len(attendees), batch_size):
+            batch = attendees[i:i + batch_size]
+            batch_start = datetime.now()
             
             self._log_thought(
-                f"Processing batch {i//self.max_parallel + 1} ({len(batch)} attendees)",
+                f"Processing batch {i//batch_size + 1} ({len(batch)} attendees)",
                 ThoughtType.PLANNING if REASONING_AVAILABLE else None
             )
             
             # Create temporary coordinator for this batch
             batch_coordinator = ParallelAvailabilityCoordinator(
                 timeout_seconds=self.timeout_seconds,
-                max_parallel=self.max_parallel,
-                reasoning_engine=None  # Avoid duplicate logging
+                max_parallel=batch_size,
+                reasoning_engine=None,  # Avoid duplicate logging
+                batch_freebusy=self.batch_freebusy
             )
             
             batch_result = await batch_coordinator.check_all_attendees(
-                batch, date, start_time, end_time, timezone
+                batch, date, start_time, end_time, timezone,
+                short_circuit_on_busy=short_circuit_on_busy
             )
             
             # Merge results
+            if i == 0:
+                all_results["first_result_time"] = (
+                    (batch_start - start_time_exec).total_seconds()
+                    + batch_result["first_result_time"]
+                )
             all_results["available_count"] += batch_result["available_count"]
             all_results["busy_count"] += batch_result["busy_count"]
             all_results["error_count"] += batch_result["error_count"]
             all_results["available_attendees"].extend(batch_result["available_attendees"])
             all_results["busy_attendees"].update(batch_result["busy_attendees"])
             all_results["errors"].update(batch_result["errors"])
+            
+            if short_circuit_on_busy and batch_result["busy_count"] > 0:
+                break
         
         all_results["all_available"] = (
             all_results["busy_count"] == 0 and all_results["error_count"] == 0
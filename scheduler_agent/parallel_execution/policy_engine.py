@@ -6,9 +6,11 @@ including duration limits, attendee counts, business hours, etc.
 """
 
 import json
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -44,6 +46,26 @@ class PolicyViolation:
         return f"{emoji} [{self.severity.value.upper()}] {self.policy_name}: {self.message}"
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso_date(date_str: str) -> datetime:
+    """datetime.strptime(date_str, '%Y-%m-%d'), memoized: checks reuse a few dates."""
+    return datetime.strptime(date_str, '%Y-%m-%d')
+
+
+@lru_cache(maxsize=8)
+def _load_policies_cached(path_str: str, mtime: float) -> Tuple[Dict[str, Any], ...]:
+    """
+    Load and parse a policies JSON file.
+    
+    Cached by (path, mtime) so engines constructed per request share one parse,
+    while edits to the file on disk are still picked up. Engines must copy the
+    entries before use (see PolicyEngine._load_policies).
+    """
+    with open(path_str, 'r') as f:
+        data = json.load(f)
+        return tuple(data.get('policies', []))
+
+
 class PolicyEngine:
     """
     Manages and checks organizational policies for event scheduling.
@@ -53,7 +75,7 @@ class PolicyEngine:
     
     Usage:
         engine = PolicyEngine()
-        violations = await engine.check_policies({
+        violations = engine.check_policies_sync({
             "date": "2025-11-30",
             "start_time": "14:00",
             "end_time": "18:30",
@@ -64,6 +86,18 @@ class PolicyEngine:
             print("Cannot create event - policy violations!")
     """
     
+    # Checker method for each known policy ID; unknown policies are ignored
+    _CHECKERS = {
+        'max_meeting_duration': '_check_max_duration',
+        'buffer_time': '_check_buffer_time',
+        'business_hours': '_check_business_hours',
+        'large_meeting_approval': '_check_large_meeting',
+        'weekend_scheduling': '_check_weekend',
+        'late_night_meetings': '_check_late_night',
+        'early_morning_meetings': '_check_early_morning',
+        'minimum_attendees': '_check_minimum_attendees',
+    }
+    
     def __init__(self, policies_file: str = None):
         """
         Initialize policy engine.
@@ -78,6 +112,13 @@ class PolicyEngine:
         
         self.policies_file = Path(policies_file)
         self.policies = self._load_policies()
+        # Enabled policies paired with their checkers, resolved once here
+        # rather than by policy id on every check
+        self._checks = [
+            (policy, getattr(self, self._CHECKERS[policy.get('id')]))
+            for policy in self.policies
+            if policy.get('enabled', True) and policy.get('id') in self._CHECKERS
+        ]
     
     def _load_policies(self) -> List[Dict[str, Any]]:
         """Load policies from JSON file"""
@@ -85,11 +126,22 @@ class PolicyEngine:
             # Return empty list if file doesn't exist
             return []
         
-        with open(self.policies_file, 'r') as f:
-            data = json.load(f)
-            return data.get('policies', [])
+        # Each engine gets its own copy, so editing one engine's policies
+        # can't change another's
+        return deepcopy(list(_load_policies_cached(
+            str(self.policies_file), self.policies_file.stat().st_mtime
+        )))
     
     async def check_policies(self, event_details: Dict[str, Any]) -> List[PolicyViolation]:
+        """
+        Async wrapper around check_policies_sync() kept for API compatibility.
+        
+        None of the policy checkers perform I/O, so in-process callers should
+        prefer check_policies_sync() and skip the coroutine overhead.
+        """
+        return self.check_policies_sync(event_details)
+    
+    def check_policies_sync(self, event_details: Dict[str, Any]) -> List[PolicyViolation]:
         """
         Check all enabled policies against event details.
         
@@ -107,33 +159,14 @@ class PolicyEngine:
         """
         violations = []
         
-        for policy in self.policies:
-            if not policy.get('enabled', True):
-                continue
-            
-            # Route to appropriate checker based on policy ID
-            policy_id = policy.get('id')
-            
-            if policy_id == 'max_meeting_duration':
-                violation = self._check_max_duration(policy, event_details)
-            elif policy_id == 'buffer_time':
-                violation = self._check_buffer_time(policy, event_details)
-            elif policy_id == 'business_hours':
-                violation = self._check_business_hours(policy, event_details)
-            elif policy_id == 'large_meeting_approval':
-                violation = self._check_large_meeting(policy, event_details)
-            elif policy_id == 'weekend_scheduling':
-                violation = self._check_weekend(policy, event_details)
-            elif policy_id == 'late_night_meetings':
-                violation = self._check_late_night(policy, event_details)
-            elif policy_id == 'early_morning_meetings':
-                violation = self._check_early_morning(policy, event_details)
-            elif policy_id == 'minimum_attendees':
-                violation = self._check_minimum_attendees(policy, event_details)
-            else:
-                # Unknown policy type
-                continue
-            
+        # Normalize attendees once so individual checkers don't re-split
+        event_details = dict(
+            event_details,
+            _parsed_attendees=self._parse_attendees(event_details.get('attendees', []))
+        )
+        
+        for policy, check in self._checks:
+            violation = check(policy, event_details)
             if violation:
                 violations.append(violation)
         
@@ -141,10 +174,12 @@ class PolicyEngine:
     
     def _parse_attendees(self, attendees: Any) -> List[str]:
         """Parse attendees into list of emails"""
-        if isinstance(attendees, str):
-            return [email.strip() for email in attendees.split(',') if email.strip()]
-        elif isinstance(attendees, list):
+        if isinstance(attendees, list):
             return attendees
+        if isinstance(attendees, str):
+            # Deferred: importing the tools package loads the Google API client
+            from ..tools._parsing import split_attendees
+            return split_attendees(attendees)
         return []
     
     def _calculate_duration_hours(self, start_time: str, end_time: str) -> float:
@@ -227,8 +262,7 @@ class PolicyEngine:
         """Check if meeting exceeds attendee limit requiring approval"""
         min_attendees = policy.get('min_attendees', 20)
         
-        attendees = self._parse_attendees(event.get('attendees', []))
-        attendee_count = len(attendees)
+        attendee_count = len(event['_parsed_attendees'])
         
         if attendee_count >= min_attendees:
             return PolicyViolation(
@@ -251,7 +285,7 @@ class PolicyEngine:
             return None
         
         try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+            date_obj = _parse_iso_date(date_str)
             # 5 = Saturday, 6 = Sunday
             if date_obj.weekday() >= 5:
                 return PolicyViolation(
@@ -312,8 +346,7 @@ class PolicyEngine:
         """Check if meeting has minimum required attendees"""
         min_attendees = policy.get('min_attendees', 2)
         
-        attendees = self._parse_attendees(event.get('attendees', []))
-        attendee_count = len(attendees)
+        attendee_count = len(event['_parsed_attendees'])
         
         if attendee_count < min_attendees:
             return PolicyViolation(
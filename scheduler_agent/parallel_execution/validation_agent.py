@@ -7,50 +7,62 @@ This sub-agent performs multi-dimensional validation across:
 - Timezone violations
 - Policy violations
 
-All validations run in parallel for maximum performance.
+Attendee calendars are checked in parallel; the CPU-only checks run inline.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
-from enum import Enum
+import time
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Any, List, Optional, Union
+from enum import IntEnum
 from dataclasses import dataclass
 
 from .policy_engine import PolicyEngine, PolicyViolation
-from .parallel_coordinator import ParallelAvailabilityCoordinator
 
-from ..reasoning_engine import ReasoningEngine, ThoughtType
-REASONING_AVAILABLE = True
+from ..reasoning_engine import ThoughtType
 
+if TYPE_CHECKING:
+    from ..reasoning_engine import ReasoningEngine
 
-class ValidationDimension(Enum):
-    """Types of validation checks"""
-    CALENDAR_CONFLICTS = "calendar_conflicts"
-    ROOM_AVAILABILITY = "room_availability"
-    TIMEZONE_VIOLATIONS = "timezone_violations"
-    POLICY_VIOLATIONS = "policy_violations"
+
+class ValidationDimension(IntEnum):
+    """Types of validation checks, numbered to index the validations list"""
+    CALENDAR_CONFLICTS = 0
+    ROOM_AVAILABILITY = 1
+    TIMEZONE_VIOLATIONS = 2
+    POLICY_VIOLATIONS = 3
+    
+    @property
+    def label(self) -> str:
+        """Display name, e.g. "calendar_conflicts"."""
+        return self.name.lower()
 
 
 @dataclass
 class ValidationResult:
-    """Result from a single validation dimension"""
+    """
+    Result from a single validation dimension.
+    
+    Issues and warnings are messages, or PolicyViolation objects for the policy
+    dimension; the latter are only formatted when converted with str().
+    """
     dimension: ValidationDimension
     passed: bool
-    issues: List[str]
-    warnings: List[str]
+    issues: List[Union[str, PolicyViolation]]
+    warnings: List[Union[str, PolicyViolation]]
     metadata: Optional[Dict[str, Any]] = None
     execution_time: float = 0.0
     
     def __str__(self) -> str:
         status = "✅ PASSED" if self.passed else "❌ FAILED"
-        return f"[{self.dimension.value}] {status}: {len(self.issues)} issues, {len(self.warnings)} warnings"
+        return f"[{self.dimension.label}] {status}: {len(self.issues)} issues, {len(self.warnings)} warnings"
 
 
 class ConflictValidationAgent:
     """
     Sub-agent that performs comprehensive event validation across multiple dimensions.
     
-    Runs all validation checks in parallel for optimal performance.
+    Attendee availability is checked in parallel; the remaining checks are
+    cheap CPU work and run inline.
     
     Usage:
         validator = ConflictValidationAgent()
@@ -69,6 +81,9 @@ class ConflictValidationAgent:
             print(f"Blocking issues: {result['blocking_issues']}")
     """
     
+    # Policy engines shared across instances, keyed by policy file path
+    _POLICY_CACHE: Dict[Optional[str], PolicyEngine] = {}
+    
     def __init__(
         self,
         policy_file: str = None,
@@ -81,19 +96,28 @@ class ConflictValidationAgent:
             policy_file: Path to policies JSON. If None, uses default.
             reasoning_engine: Optional ReasoningEngine for observable reasoning
         """
-        self.policy_engine = PolicyEngine(policies_file=policy_file)
+        policy_engine = self._POLICY_CACHE.get(policy_file)
+        if policy_engine is None:
+            policy_engine = self._POLICY_CACHE[policy_file] = PolicyEngine(policies_file=policy_file)
+        self.policy_engine = policy_engine
+        # Deferred: the coordinator pulls in the Google API client
+        from .parallel_coordinator import ParallelAvailabilityCoordinator
+        self.coordinator = ParallelAvailabilityCoordinator()
         self.reasoning_engine = reasoning_engine
     
-    def _log_thought(self, content: str, thought_type=None):
+    def _log_thought(self, content: str, thought_type: ThoughtType = ThoughtType.PLANNING):
         """Log a thought if reasoning engine is available"""
         if self.reasoning_engine is not None:
-            if thought_type is None:
-                thought_type = ThoughtType.PLANNING
             self.reasoning_engine.think(content, thought_type)
     
+    def _log_thoughts(self, thoughts: List[tuple]):
+        """Log several (content, ThoughtType) pairs with one timestamp"""
+        if self.reasoning_engine is not None and thoughts:
+            self.reasoning_engine.think_many(thoughts)
+    
     async def validate_event(self, event_details: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Validate event across all dimensions in parallel.
+        Validate event across all dimensions.
         
         Args:
             event_details: Dictionary with event information:
@@ -110,85 +134,96 @@ class ConflictValidationAgent:
                 "valid": bool,  # True if no blocking issues
                 "blocking_issues": [list of critical errors],
                 "warnings": [list of non-blocking concerns],
-                "validations": {dimension: ValidationResult},
+                "validations": [ValidationResult indexed by ValidationDimension],
                 "execution_time": float
             }
         """
-        start_time = datetime.now()
-        
-        self._log_thought(
-            "Running comprehensive validation checks in parallel",
-            ThoughtType.PLANNING if REASONING_AVAILABLE else None
-        )
-        
-        self._log_thought(
-            f"Validating: calendar, room, timezone, policies",
-            ThoughtType.DECISION if REASONING_AVAILABLE else None
-        )
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        
+        self._log_thoughts([
+            ("Running comprehensive validation checks", ThoughtType.PLANNING),
+            ("Validating: calendar, room, timezone, policies", ThoughtType.DECISION),
+        ])
+        
+        # Parse shared fields once for all validators
+        parsed = self._parse_event(event_details)
+        attendee_count = parsed['attendee_count']
+        
+        # Dimensions that cannot produce issues for this event pass without running.
+        # Only the calendar check does I/O; the others are plain CPU work and run
+        # inline instead of being scheduled as tasks.
+        results = []
+        
+        if attendee_count:
+            results.append(await self._run_guarded(
+                ValidationDimension.CALENDAR_CONFLICTS,
+                self._validate_calendar_conflicts(event_details, parsed)
+            ))
+        else:
+            results.append(self._passed_result(ValidationDimension.CALENDAR_CONFLICTS))
         
-        # Run all validations in parallel
-        validation_tasks = [
-            self._validate_calendar_conflicts(event_details),
-            self._validate_room_availability(event_details),
-            self._validate_timezone(event_details),
-            self._validate_policies(event_details)
-        ]
+        if attendee_count >= 3 and not event_details.get('location'):
+            results.append(self._run_guarded_sync(
+                ValidationDimension.ROOM_AVAILABILITY,
+                self._validate_room_availability_sync, event_details, parsed
+            ))
+        else:
+            results.append(self._passed_result(ValidationDimension.ROOM_AVAILABILITY))
         
-        results = await asyncio.gather(*validation_tasks, return_exceptions=True)
+        results.append(self._run_guarded_sync(
+            ValidationDimension.TIMEZONE_VIOLATIONS,
+            self._validate_timezone_sync, event_details, parsed
+        ))
+        results.append(self._run_guarded_sync(
+            ValidationDimension.POLICY_VIOLATIONS,
+            self._validate_policies_sync, event_details, parsed
+        ))
         
         # Process results
-        validations = {}
+        validations: List[Optional[ValidationResult]] = [None] * len(ValidationDimension)
         blocking_issues = []
         warnings = []
+        thoughts = []
         
         for result in results:
-            if isinstance(result, Exception):
-                # Handle exception
-                self._log_thought(
-                    f"Validation error: {str(result)}",
-                    ThoughtType.CONCERN if REASONING_AVAILABLE else None
-                )
-                continue
+            validations[result.dimension] = result
             
-            if isinstance(result, ValidationResult):
-                validations[result.dimension] = result
-                
-                # Log result
-                if result.passed:
-                    self._log_thought(
-                        f"{result.dimension.value}: No issues found",
-                        ThoughtType.VALIDATION if REASONING_AVAILABLE else None
-                    )
-                else:
-                    self._log_thought(
-                        f"{result.dimension.value}: {len(result.issues)} issue(s) detected",
-                        ThoughtType.CONCERN if REASONING_AVAILABLE else None
-                    )
-                
-                # Collect issues and warnings
-                blocking_issues.extend(result.issues)
-                warnings.extend(result.warnings)
+            # Log result
+            if result.passed:
+                thoughts.append((
+                    f"{result.dimension.label}: No issues found",
+                    ThoughtType.VALIDATION
+                ))
+            else:
+                thoughts.append((
+                    f"{result.dimension.label}: {len(result.issues)} issue(s) detected",
+                    ThoughtType.CONCERN
+                ))
+            
+            # Collect issues and warnings as display strings
+            blocking_issues.extend(map(str, result.issues))
+            warnings.extend(map(str, result.warnings))
         
         # Calculate metrics
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = loop.time() - start_time
         valid = len(blocking_issues) == 0
         
-        # Log summary
+        # Log per-dimension results and summary together
         if valid:
-            self._log_thought(
+            thoughts.append((
                 f"Validation passed with {len(warnings)} warning(s)",
-                ThoughtType.VALIDATION if REASONING_AVAILABLE else None
-            )
+                ThoughtType.VALIDATION
+            ))
         else:
-            self._log_thought(
+            thoughts.append((
                 f"Validation failed: {len(blocking_issues)} blocking issue(s)",
-                ThoughtType.WARNING if REASONING_AVAILABLE else None
+                ThoughtType.WARNING
+            ))
+            thoughts.extend(
+                (f"Blocking: {issue}", ThoughtType.CONCERN) for issue in blocking_issues
             )
-            for issue in blocking_issues:
-                self._log_thought(
-                    f"Blocking: {issue}",
-                    ThoughtType.CONCERN if REASONING_AVAILABLE else None
-                )
+        self._log_thoughts(thoughts)
         
         return {
             "valid": valid,
@@ -198,50 +233,119 @@ class ConflictValidationAgent:
             "execution_time": execution_time
         }
     
-    async def _validate_calendar_conflicts(self, event: Dict) -> ValidationResult:
+    async def _run_guarded(
+        self,
+        dimension: ValidationDimension,
+        validation: Awaitable[ValidationResult]
+    ) -> ValidationResult:
+        """Await a validation, turning an unexpected exception into a warning"""
+        try:
+            return await validation
+        except Exception as e:
+            return self._failed_result(dimension, e)
+    
+    def _run_guarded_sync(
+        self,
+        dimension: ValidationDimension,
+        validator: Callable[[Dict, Dict], ValidationResult],
+        event: Dict,
+        parsed: Dict
+    ) -> ValidationResult:
+        """Run a synchronous validator, turning an unexpected exception into a warning"""
+        try:
+            return validator(event, parsed)
+        except Exception as e:
+            return self._failed_result(dimension, e)
+    
+    def _failed_result(self, dimension: ValidationDimension, error: Exception) -> ValidationResult:
+        """Result for a dimension whose validator raised unexpectedly"""
+        self._log_thought(
+            f"Validation error: {str(error)}",
+            ThoughtType.CONCERN
+        )
+        return ValidationResult(
+            dimension=dimension,
+            passed=True,
+            issues=[],
+            warnings=[f"{dimension.label} check failed: {str(error)}"]
+        )
+    
+    @staticmethod
+    def _parse_event(event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive the structured fields that several validators need.
+        
+        Returns:
+            {
+                "attendee_list": [emails],
+                "attendee_count": int,
+                "start_hour": int | None  # None if missing or unparseable
+            }
+        """
+        attendees = event.get('attendees', '')
+        if isinstance(attendees, str):
+            # Deferred: importing the tools package loads the Google API client
+            from ..tools._parsing import split_attendees
+            attendee_list = split_attendees(attendees)
+        else:
+            attendee_list = list(attendees or [])
+        
+        try:
+            start_hour = int(event.get('start_time', '').split(':')[0])
+        except (AttributeError, ValueError):
+            start_hour = None
+        
+        return {
+            'attendee_list': attendee_list,
+            'attendee_count': len(attendee_list),
+            'start_hour': start_hour,
+        }
+    
+    @staticmethod
+    def _passed_result(dimension: ValidationDimension) -> ValidationResult:
+        """Result for a dimension skipped because it trivially passes"""
+        return ValidationResult(
+            dimension=dimension,
+            passed=True,
+            issues=[],
+            warnings=[]
+        )
+    
+    async def _validate_calendar_conflicts(self, event: Dict, parsed: Dict) -> ValidationResult:
         """
         Check for calendar conflicts (organizer and attendees).
         
         Uses the ParallelAvailabilityCoordinator from Stage 1.
         """
-        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
         issues = []
         warnings = []
         
         try:
-            # Check attendee availability using parallel coordinator
-            attendees = event.get('attendees', '')
-            if attendees:
-                coordinator = ParallelAvailabilityCoordinator()
+            # Check attendee availability using parallel coordinator. Recent
+            # answers come from its FreeBusy cache, which creating an event clears.
+            attendee_list = parsed['attendee_list']
+            if attendee_list:
+                result = await self.coordinator.check_all_attendees(
+                    attendees=attendee_list,
+                    date=event['date'],
+                    start_time=event['start_time'],
+                    end_time=event['end_time']
+                )
                 
-                # Parse attendees
-                if isinstance(attendees, str):
-                    attendee_list = [email.strip() for email in attendees.split(',') if email.strip()]
-                else:
-                    attendee_list = attendees
+                # Check for conflicts
+                for email, conflicts in result['busy_attendees'].items():
+                    issues.append(f"Attendee {email} has {len(conflicts)} conflict(s)")
                 
-                if attendee_list:
-                    result = await coordinator.check_all_attendees(
-                        attendees=attendee_list,
-                        date=event['date'],
-                        start_time=event['start_time'],
-                        end_time=event['end_time']
-                    )
-                    
-                    # Check for conflicts
-                    if result['busy_count'] > 0:
-                        for email, conflicts in result['busy_attendees'].items():
-                            issues.append(f"Attendee {email} has {len(conflicts)} conflict(s)")
-                    
-                    # Check for errors
-                    if result['error_count'] > 0:
-                        for email, error in result['errors'].items():
-                            warnings.append(f"Could not check {email}: {error}")
+                # Check for errors
+                for email, error in result['errors'].items():
+                    warnings.append(f"Could not check {email}: {error}")
         
         except Exception as e:
             warnings.append(f"Calendar conflict check failed: {str(e)}")
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = loop.time() - start_time
         
         return ValidationResult(
             dimension=ValidationDimension.CALENDAR_CONFLICTS,
@@ -251,14 +355,14 @@ class ConflictValidationAgent:
             execution_time=execution_time
         )
     
-    async def _validate_room_availability(self, event: Dict) -> ValidationResult:
+    def _validate_room_availability_sync(self, event: Dict, parsed: Dict) -> ValidationResult:
         """
         Check room availability.
         
         Note: This is a placeholder. Full implementation would check
         room calendars via Google Calendar API.
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
         issues = []
         warnings = []
         
@@ -266,17 +370,11 @@ class ConflictValidationAgent:
         
         # Placeholder: In real implementation, check room calendar
         # For now, just validate that a location is specified for multi-person meetings
-        attendees = event.get('attendees', '')
-        if attendees:
-            if isinstance(attendees, str):
-                attendee_count = len([e for e in attendees.split(',') if e.strip()])
-            else:
-                attendee_count = len(attendees)
-            
-            if attendee_count >= 3 and not location:
-                warnings.append(f"Meeting with {attendee_count} attendees has no location specified")
+        attendee_count = parsed['attendee_count']
+        if attendee_count >= 3 and not location:
+            warnings.append(f"Meeting with {attendee_count} attendees has no location specified")
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.monotonic() - start_time
         
         return ValidationResult(
             dimension=ValidationDimension.ROOM_AVAILABILITY,
@@ -286,7 +384,7 @@ class ConflictValidationAgent:
             execution_time=execution_time
         )
     
-    async def _validate_timezone(self, event: Dict) -> ValidationResult:
+    def _validate_timezone_sync(self, event: Dict, parsed: Dict) -> ValidationResult:
         """
         Check for timezone-related issues.
         
@@ -294,28 +392,27 @@ class ConflictValidationAgent:
         - Meeting not at inappropriate hours for any timezone
         - Attendees across multiple timezones get reasonable times
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
         issues = []
         warnings = []
         
-        try:
-            # Check if meeting is at reasonable hours
-            start_time_str = event.get('start_time', '')
+        # Check if meeting is at reasonable hours
+        start_time_str = event.get('start_time', '')
+        start_hour = parsed['start_hour']
+        
+        if start_hour is None:
             if start_time_str:
-                start_hour = int(start_time_str.split(':')[0])
-                
-                # Very early morning (before 6 AM)
-                if start_hour < 6:
-                    warnings.append(f"Meeting starts at {start_time_str} - very early for some timezones")
-                
-                # Late night (after 10 PM)
-                elif start_hour >= 22:
-                    warnings.append(f"Meeting starts at {start_time_str} - late night for some timezones")
+                warnings.append(f"Timezone validation failed: invalid start time {start_time_str!r}")
         
-        except Exception as e:
-            warnings.append(f"Timezone validation failed: {str(e)}")
+        # Very early morning (before 6 AM)
+        elif start_hour < 6:
+            warnings.append(f"Meeting starts at {start_time_str} - very early for some timezones")
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        # Late night (after 10 PM)
+        elif start_hour >= 22:
+            warnings.append(f"Meeting starts at {start_time_str} - late night for some timezones")
+        
+        execution_time = time.monotonic() - start_time
         
         return ValidationResult(
             dimension=ValidationDimension.TIMEZONE_VIOLATIONS,
@@ -325,29 +422,31 @@ class ConflictValidationAgent:
             execution_time=execution_time
         )
     
-    async def _validate_policies(self, event: Dict) -> ValidationResult:
+    def _validate_policies_sync(self, event: Dict, parsed: Dict) -> ValidationResult:
         """
         Check organizational policy compliance using PolicyEngine.
         """
-        start_time = datetime.now()
+        start_time = time.monotonic()
         issues = []
         warnings = []
         
         try:
             # Check policies
-            violations = await self.policy_engine.check_policies(event)
+            violations = self.policy_engine.check_policies_sync(
+                dict(event, attendees=parsed['attendee_list'])
+            )
             
             # Categorize violations
             for violation in violations:
                 if violation.is_blocking():
-                    issues.append(str(violation))
+                    issues.append(violation)
                 else:
-                    warnings.append(str(violation))
+                    warnings.append(violation)
         
         except Exception as e:
             warnings.append(f"Policy check failed: {str(e)}")
         
-        execution_time = (datetime.now() - start_time).total_seconds()
+        execution_time = time.monotonic() - start_time
         
         return ValidationResult(
             dimension=ValidationDimension.POLICY_VIOLATIONS,
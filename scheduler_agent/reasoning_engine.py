@@ -5,14 +5,35 @@ Provides observable reasoning capabilities for agent transparency.
 Allows logging, streaming, and analyzing agent decision-making processes.
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, Any, List, Callable
-from collections import defaultdict
+from typing import Optional, Dict, Any, Deque, List, Callable, Iterable, Tuple
+from collections import defaultdict, deque
 import json
 
 
+def _json_dumps(obj: Any, pretty: bool) -> str:
+    """json.dumps formatted like orjson: no spaces when compact, UTF-8 unescaped"""
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if pretty else None,
+        separators=(",", ": ") if pretty else (",", ":")
+    )
+
+
+# orjson is optional; with the options above, to_json() returns the same
+# text either way.
+try:
+    import orjson
+
+    def _dumps(obj: Any, pretty: bool) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+except ImportError:
+    _dumps = _json_dumps
+
+
 class ThoughtType(Enum):
     """Categories of agent reasoning steps"""
     ANALYSIS = "analysis"       # Understanding the request
@@ -26,20 +47,29 @@ class ThoughtType(Enum):
     RECOMMENDATION = "recommendation"  # Final recommendations
 
 
-@dataclass
+# ThoughtType -> value, so serialization skips the Enum.value descriptor
+_TYPE_STR: Dict[ThoughtType, str] = {member: member.value for member in ThoughtType}
+
+
+@dataclass(slots=True, frozen=True)
 class Thought:
     """A single reasoning step in the chain-of-thought process"""
     content: str
     thought_type: ThoughtType
     timestamp: datetime
     metadata: Optional[Dict[str, Any]] = None
+    # timestamp.isoformat(), computed once for serialization
+    timestamp_iso: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'timestamp_iso', self.timestamp.isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert thought to dictionary for JSON serialization"""
         return {
             "content": self.content,
-            "type": self.thought_type.value,
-            "timestamp": self.timestamp.isoformat(),
+            "type": _TYPE_STR[self.thought_type],
+            "timestamp": self.timestamp_iso,
             "metadata": self.metadata or {}
         }
     
@@ -49,6 +79,10 @@ class Thought:
         return f"{type_label} {self.content}"
 
 
+def _think_disabled(*args, **kwargs) -> None:
+    """Stand-in for ReasoningEngine.think while the engine is disabled"""
+
+
 class ReasoningEngine:
     """
     Observable reasoning engine for agent transparency.
@@ -63,18 +97,59 @@ class ReasoningEngine:
         
         # Stream thoughts in real-time
         engine.on_thought(lambda thought: print(thought))
+        
+        # Or deliver thoughts to listeners in batches
+        engine = ReasoningEngine(stream_mode=False, batch_size=10)
+        engine.on_thought(lambda thoughts: print(len(thoughts)))
+        engine.flush()
     """
     
-    def __init__(self, enabled: bool = True):
+    def __init__(
+        self,
+        enabled: bool = True,
+        stream_mode: bool = True,
+        batch_size: int = 20,
+        max_thoughts: Optional[int] = 10_000
+    ):
         """
         Initialize reasoning engine.
         
         Args:
             enabled: If False, thoughts are not logged (for production mode)
+            stream_mode: If True, listeners receive each Thought as it is logged.
+                If False, listeners receive lists of thoughts, delivered every
+                batch_size thoughts and on flush()
+            batch_size: Number of pending thoughts that triggers a flush when
+                stream_mode is False
+            max_thoughts: Number of most recent thoughts to retain; older ones
+                are dropped. None keeps everything
         """
+        self.thoughts: Deque[Thought] = deque(maxlen=max_thoughts)
+        # The same thoughts grouped by type, for filtered lookups without a scan
+        self._by_type: Dict[ThoughtType, Deque[Thought]] = defaultdict(deque)
+        # A tuple, replaced rather than mutated, so a listener that registers
+        # another one doesn't change the delivery already in progress
+        self._listeners: Tuple[Callable[[Any], None], ...] = ()
+        self._pending: List[Thought] = []
+        self.stream_mode = stream_mode
+        self.batch_size = batch_size
         self.enabled = enabled
-        self.thoughts: List[Thought] = []
-        self._listeners: List[Callable[[Thought], None]] = []
+    
+    @property
+    def enabled(self) -> bool:
+        """Whether thoughts are being logged"""
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        # Shadow think()/think_many() with a no-op so disabled engines skip all bookkeeping
+        if value:
+            self.__dict__.pop('think', None)
+            self.__dict__.pop('think_many', None)
+        else:
+            self.think = _think_disabled
+            self.think_many = _think_disabled
     
     def think(
         self, 
@@ -98,41 +173,89 @@ class ReasoningEngine:
                 timezone="Asia/Singapore"
             )
         """
-        if not self.enabled:
-            return
-        
-        thought = Thought(
+        self._record(Thought(
             content=content,
             thought_type=thought_type,
             timestamp=datetime.now(),
             metadata=metadata if metadata else None
-        )
+        ))
+    
+    def think_many(self, thoughts: Iterable[Tuple[str, ThoughtType]]) -> None:
+        """
+        Log several reasoning steps that happen at the same moment.
+        
+        All thoughts share one timestamp; their order in the chain is the
+        order given.
         
-        self.thoughts.append(thought)
+        Args:
+            thoughts: (content, thought_type) pairs
+        
+        Example:
+            engine.think_many([
+                ("Checking calendars", ThoughtType.PLANNING),
+                ("Checking policies", ThoughtType.PLANNING),
+            ])
+        """
+        now = datetime.now()
+        for content, thought_type in thoughts:
+            self._record(Thought(content=content, thought_type=thought_type, timestamp=now))
+    
+    def _record(self, thought: Thought) -> None:
+        """Store a thought and hand it to listeners"""
+        thoughts = self.thoughts
+        if thoughts.maxlen is not None and len(thoughts) == thoughts.maxlen:
+            # Appending drops the oldest thought; drop it from its type index too
+            if thoughts:
+                self._by_type[thoughts[0].thought_type].popleft()
+        if thoughts.maxlen != 0:
+            self._by_type[thought.thought_type].append(thought)
+        thoughts.append(thought)
         
         # Notify listeners (for real-time streaming)
-        self._emit(thought)
+        if self.stream_mode:
+            if self._listeners:
+                self._emit(thought)
+        else:
+            self._pending.append(thought)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
     
-    def on_thought(self, listener: Callable[[Thought], None]) -> None:
+    def on_thought(self, listener: Callable[[Any], None]) -> None:
         """
         Register a listener for real-time thought streaming.
         
         Args:
-            listener: Function called when a new thought is logged
+            listener: Function called when a new thought is logged. Receives a
+                single Thought in stream mode, or a list of thoughts otherwise.
+                A listener that raises is removed and not called again.
         
         Example:
             engine.on_thought(lambda t: print(f"[{t.thought_type.value}] {t.content}"))
         """
-        self._listeners.append(listener)
+        self._listeners += (listener,)
     
-    def _emit(self, thought: Thought) -> None:
-        """Emit thought to all registered listeners"""
+    def _emit(self, payload: Any) -> None:
+        """Emit a thought (or batch of thoughts) to all registered listeners"""
+        failed = None
         for listener in self._listeners:
             try:
-                listener(thought)
+                listener(payload)
             except Exception as e:
-                # Don't let listener errors break reasoning
-                print(f"Error in thought listener: {e}")
+                # Don't let listener errors break reasoning; a listener that
+                # raised is not called again
+                print(f"Error in thought listener, removing it: {e}")
+                failed = failed or []
+                failed.append(listener)
+        if failed:
+            self._listeners = tuple(l for l in self._listeners if l not in failed)
+    
+    def flush(self) -> None:
+        """Deliver pending thoughts to listeners as one batch (batch mode only)"""
+        if not self._pending:
+            return
+        
+        batch, self._pending = self._pending, []
+        self._emit(batch)
     
     def get_reasoning_chain(self, thought_type: Optional[ThoughtType] = None) -> List[Thought]:
         """
@@ -142,16 +265,17 @@ class ReasoningEngine:
             thought_type: Optional filter for specific thought types
         
         Returns:
-            List of thoughts, optionally filtered
+            List of thoughts, optionally filtered. Only the most recent
+            max_thoughts are retained, so older thoughts are not included.
         
         Example:
             # Get all concerns
             concerns = engine.get_reasoning_chain(ThoughtType.CONCERN)
         """
         if thought_type is None:
-            return self.thoughts.copy()
+            return list(self.thoughts)
         
-        return [t for t in self.thoughts if t.thought_type == thought_type]
+        return list(self._by_type.get(thought_type, ()))
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -160,15 +284,15 @@ class ReasoningEngine:
         Returns:
             Dictionary with summary statistics
         """
-        type_counts = defaultdict(int)
-        for thought in self.thoughts:
-            type_counts[thought.thought_type.value] += 1
-        
         return {
             "total_thoughts": len(self.thoughts),
-            "thoughts_by_type": dict(type_counts),
-            "first_thought": self.thoughts[0].timestamp.isoformat() if self.thoughts else None,
-            "last_thought": self.thoughts[-1].timestamp.isoformat() if self.thoughts else None
+            "thoughts_by_type": {
+                _TYPE_STR[thought_type]: len(thoughts)
+                for thought_type, thoughts in self._by_type.items()
+                if thoughts
+            },
+            "first_thought": self.thoughts[0].timestamp_iso if self.thoughts else None,
+            "last_thought": self.thoughts[-1].timestamp_iso if self.thoughts else None
         }
     
     def to_json(self, pretty: bool = False) -> str:
@@ -181,13 +305,13 @@ class ReasoningEngine:
         Returns:
             JSON string of all thoughts
         """
-        thoughts_dict = [t.to_dict() for t in self.thoughts]
-        indent = 2 if pretty else None
-        return json.dumps(thoughts_dict, indent=indent)
+        return _dumps([t.to_dict() for t in self.thoughts], pretty)
     
     def clear(self) -> None:
         """Clear all thoughts (useful for starting a new reasoning session)"""
         self.thoughts.clear()
+        self._by_type.clear()
+        self._pending.clear()
     
     def __str__(self) -> str:
         """String representation showing all thoughts"""
@@ -1,20 +1,151 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
 import json
+import queue
+import random
+import re
 import sqlite3
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import groupby
 from pathlib import Path
-from typing import Sequence, Optional, Callable, Any, List, Dict
+from typing import AsyncIterator, Sequence, Optional, Callable, Any, List, Dict, Tuple
 
+from google.adk.errors.already_exists_error import AlreadyExistsError
 from google.adk.memory import BaseMemoryService
 from google.adk.sessions import DatabaseSessionService
 from google.adk.runners import Runner
 from google.genai import types
 
+# orjson is optional; metadata is stored as JSON text either way.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 
 DEFAULT_SESSION_DB_NAME = "calendar_agent_sessions.db"
 DEFAULT_MEMORY_DB_NAME = "calendar_agent_memory.db"
 
+# Background memory writes are grouped into batches of up to this many
+# sessions, collected for at most this long.
+PERSIST_BATCH_SIZE = 16
+PERSIST_BATCH_WINDOW_SECONDS = 0.25
+
+# Writes that still hit a locked database are retried this many times,
+# backing off exponentially with jitter.
+WRITE_RETRY_ATTEMPTS = 3
+
+# Idle read-only connections kept for searches.
+READ_POOL_SIZE = 4
+
+# Owner that every memory was stored under before rows took the session's
+# app and user. Those rows can't be attributed, so every search sees them,
+# as it did before searches were scoped.
+LEGACY_MEMORY_OWNER = ("calendar_agent", "default")
+
+# Applied once to the long-lived memory connection. busy_timeout lets
+# SQLite wait out short lock spikes itself before reporting a conflict.
+_MEMORY_DB_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA busy_timeout=5000;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+"""
+
+# Characters that would break FTS5 query syntax; only alphanumerics and spaces are kept.
+_FTS_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9\s]+')
+
+# Common English words that match almost every memory; they are left out of
+# the FTS index and dropped from queries.
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i if in into is it its me my "
+    "of on or our so that the their them then there these they this to was we "
+    "were what when which who will with you your".split()
+)
+_WORD_RE = re.compile(r'\w+')
+
+# Sanitized queries shorter than this are not worth a database round-trip.
+_MIN_QUERY_LENGTH = 2
+
+# Recent search results are reused for identical queries until a write
+# happens or the entry expires.
+SEARCH_CACHE_MAX_SIZE = 256
+SEARCH_CACHE_TTL_SECONDS = 30.0
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _index_terms(text: Optional[str]) -> str:
+    """Text as stored in the FTS index: the words of ``text`` minus stopwords."""
+    return " ".join(
+        word for word in _WORD_RE.findall(text or "") if word.lower() not in _STOPWORDS
+    )
+
+
+def _match_expression(terms: str) -> str:
+    """FTS5 MATCH expression for sanitized ``terms``: every word must occur,
+    as a quoted token (so AND/OR/NOT/NEAR are plain words) matched by prefix."""
+    return " ".join(f'"{term}"*' for term in terms.split())
+
+
+def _is_lock_error(error: sqlite3.OperationalError) -> bool:
+    message = str(error)
+    return "locked" in message or "busy" in message
+
+
+def _event_text(event: Any) -> Optional[str]:
+    """Text of the event's first content part, or None if it has none."""
+    try:
+        return event.content.parts[0].text
+    except (AttributeError, IndexError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
+class _Part:
+    text: str
+
+
+@dataclass(slots=True)
+class _Content:
+    parts: List[_Part]
+
+
+@dataclass(slots=True)
+class _MemoryResult:
+    """A search hit shaped like the memory entries ADK tools read (content.parts[0].text)."""
+    text: str
+    metadata: Dict[str, Any]
+    created_at: str
+    timestamp: str
+    score: float
+    content: _Content
+    author: Optional[str] = None  # Add author alias for preload_memory_tool
+
+
+@dataclass(slots=True)
+class _MemoryResponse:
+    memories: Sequence[_MemoryResult] = field(default_factory=list)
+
+
+# Shared result for queries that cannot match; the tuple keeps it immutable.
+_EMPTY_MEMORY_RESPONSE = _MemoryResponse(memories=())
+
 
 @dataclass
 class SessionMemoryConfig:
@@ -48,13 +179,43 @@ class SQLiteMemoryService(BaseMemoryService):
     Stores session summaries and structured memories.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, flush_threshold: int = 64):
         super().__init__()
         self.db_path = db_path
-        self._init_db()
+        # Rows waiting to be written together by flush()
+        self._pending: List[tuple] = []
+        self.flush_threshold = flush_threshold
+        # One read-write connection is opened on first use and reused, so
+        # SQLite's page cache stays warm. Queries run in a worker thread; the
+        # lock serializes access to the shared connection.
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_lock = threading.Lock()
+        # Searches use separate read-only connections and never take the
+        # writer lock; WAL lets them run alongside writes.
+        self._readers: "queue.SimpleQueue[sqlite3.Connection]" = queue.SimpleQueue()
+        # (data_version, app_name, user_id, query, limit) -> (expires_at, results).
+        # data_version changes on every write, so older entries stop matching.
+        self._search_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._data_version = 0
+        # Searches currently running, by cache key; concurrent identical
+        # searches await the same task instead of querying again.
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def initialize(self) -> None:
+        """
+        Create the schema and open the shared connection in a worker thread.
+
+        Optional: the first read or write does the same lazily, but calling this
+        at startup keeps that disk I/O off the first request.
+        """
+        await asyncio.to_thread(self._open)
+
+    def _open(self) -> None:
+        with self._conn_lock:
+            self._connection()
 
-    def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        with conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS memories (
@@ -64,49 +225,131 @@ class SQLiteMemoryService(BaseMemoryService):
                     session_id TEXT,
                     content TEXT,
                     metadata TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    content_hash TEXT
                 )
                 """
             )
-            # Simple full-text search support
+            # Databases created before content_hash existed
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(memories)")}
+            if "content_hash" not in columns:
+                conn.execute("ALTER TABLE memories ADD COLUMN content_hash TEXT")
+            # Saving the same exchange again (e.g. on every callback) is a no-op
+            conn.execute(
+                """
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_mem_hash ON memories(app_name, user_id, content_hash)
+                """
+            )
+            # Indexes built before stopword removal are dropped here and
+            # rebuilt from memories below.
+            trigger_sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type='trigger' AND name='memories_ai'"
+            ).fetchone()
+            rebuild = trigger_sql is None or "fts_terms" not in trigger_sql[0]
+            if rebuild:
+                conn.execute("DROP TABLE IF EXISTS memories_fts")
+                for trigger in ("memories_ai", "memories_ad", "memories_au"):
+                    conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            # Full-text index only; searches join back to memories for the text,
+            # so the FTS table stores no copy of it (contentless).
             conn.execute(
                 """
-                CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(content, content='memories')
+                CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+                    content, content='', tokenize='unicode61 remove_diacritics 2'
+                )
                 """
             )
             conn.execute(
                 """
                 CREATE TRIGGER IF NOT EXISTS memories_ai AFTER INSERT ON memories BEGIN
-                  INSERT INTO memories_fts(rowid, content) VALUES (new.id, new.content);
+                  INSERT INTO memories_fts(rowid, content) VALUES (new.id, fts_terms(new.content));
+                END;
+                """
+            )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS memories_ad AFTER DELETE ON memories BEGIN
+                  INSERT INTO memories_fts(memories_fts, rowid, content)
+                  VALUES ('delete', old.id, fts_terms(old.content));
                 END;
                 """
             )
+            conn.execute(
+                """
+                CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE OF content ON memories BEGIN
+                  INSERT INTO memories_fts(memories_fts, rowid, content)
+                  VALUES ('delete', old.id, fts_terms(old.content));
+                  INSERT INTO memories_fts(rowid, content) VALUES (new.id, fts_terms(new.content));
+                END;
+                """
+            )
+            if rebuild:
+                conn.execute(
+                    "INSERT INTO memories_fts(rowid, content) SELECT id, fts_terms(content) FROM memories"
+                )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_mem_user ON memories(app_name, user_id, created_at DESC)
+                """
+            )
 
     async def add_session_to_memory(self, session: Any) -> None:
         """
         Persist relevant parts of the session to memory.
         For this simple implementation, we'll extract the last turn or summary.
+
+        The row is buffered and written with others once flush_threshold rows
+        are pending or flush() is called; searches flush first.
         """
+        row = self._memory_row(session)
+        if row is not None:
+            self._pending.append(row)
+            if len(self._pending) >= self.flush_threshold:
+                await self.flush()
+
+    async def add_sessions_to_memory(self, sessions: Sequence[Any]) -> None:
+        """Persist several sessions to memory in a single transaction."""
+        self._pending.extend(row for row in map(self._memory_row, sessions) if row is not None)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered memories in a single transaction."""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        for attempt in range(WRITE_RETRY_ATTEMPTS):
+            try:
+                await asyncio.to_thread(self._insert_memories, rows)
+                break
+            except sqlite3.OperationalError as e:
+                if not _is_lock_error(e):
+                    raise
+                if attempt == WRITE_RETRY_ATTEMPTS - 1:
+                    # Keep the rows buffered so the next flush tries again.
+                    self._pending[:0] = rows
+                    raise
+                print(f"DEBUG: Memory database busy, retrying write: {e}")
+                await asyncio.sleep(random.uniform(0.01, 0.1) * 2 ** attempt)
+        self._data_version += 1
+
+    def _memory_row(self, session: Any) -> Optional[tuple]:
+        """Build the (app_name, user_id, session_id, content, metadata) row for a session."""
         # In a real implementation, we might use an LLM to summarize the session
         # or extract key facts. Here we just store the raw text of the last few turns.
-        if not hasattr(session, "events"):
-            return
-
-        events = list(session.events)
+        events = getattr(session, "events", None)
         if not events:
-            return
+            return None
 
         # Simple extraction: Store the last user-model exchange as a memory unit
         # This is a naive implementation for demonstration.
-        content_parts = []
-        for event in events[-2:]: # Last 2 events
-            text = self._extract_text(event)
-            if text:
-                role = getattr(event, "author", "unknown")
-                content_parts.append(f"{role}: {text}")
+        content_parts = [
+            f"{getattr(event, 'author', 'unknown')}: {text}"
+            for event in events[-2:]  # Last 2 events
+            if (text := _event_text(event))
+        ]
         
         if not content_parts:
-            return
+            return None
 
         memory_content = "\n".join(content_parts)
         
@@ -116,78 +359,162 @@ class SQLiteMemoryService(BaseMemoryService):
             "event_count": len(events)
         }
 
-        self._insert_memory(
-            app_name="calendar_agent", # Should ideally come from config/context
-            user_id="default", # Should come from context
-            session_id=getattr(session, "id", "unknown"),
-            content=memory_content,
-            metadata=metadata
+        return (
+            getattr(session, "app_name", LEGACY_MEMORY_OWNER[0]),
+            getattr(session, "user_id", LEGACY_MEMORY_OWNER[1]),
+            getattr(session, "id", "unknown"),
+            memory_content,
+            metadata,
         )
 
-    def _insert_memory(self, app_name: str, user_id: str, session_id: str, content: str, metadata: Dict[str, Any]):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
-                "INSERT INTO memories (app_name, user_id, session_id, content, metadata) VALUES (?, ?, ?, ?, ?)",
-                (app_name, user_id, session_id, content, json.dumps(metadata))
+    def _connection(self) -> sqlite3.Connection:
+        # Callers must hold _conn_lock. Runs in a worker thread, so opening the
+        # file and creating the schema never block the event loop.
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            # Used by the FTS triggers; insert and delete must see the same terms.
+            conn.create_function("fts_terms", 1, _index_terms, deterministic=True)
+            conn.executescript(_MEMORY_DB_PRAGMAS)
+            self._init_db(conn)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Write buffered memories, then close all connections; they are reopened on next use."""
+        with self._conn_lock:
+            if self._pending:
+                self._write_memories(self._pending)
+                self._pending = []
+                self._data_version += 1
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+        if self._conn is None:
+            # The writer connection creates the schema and enables WAL
+            self._open()
+        conn = sqlite3.connect(
+            f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.execute("PRAGMA query_only=1")
+        return conn
+
+    def _release_reader(self, conn: sqlite3.Connection) -> None:
+        if self._readers.qsize() < READ_POOL_SIZE:
+            self._readers.put(conn)
+        else:
+            conn.close()
+
+    def _insert_memories(self, rows: Sequence[tuple]) -> None:
+        with self._conn_lock:
+            self._write_memories(rows)
+
+    def _write_memories(self, rows: Sequence[tuple]) -> None:
+        # Callers must hold _conn_lock.
+        conn = self._connection()
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO memories (app_name, user_id, session_id, content, metadata, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (app_name, user_id, content_hash) DO NOTHING
+                """,
+                [
+                    (*row[:4], _dumps(row[4]), _content_hash(row[3]))
+                    for row in rows
+                ]
             )
 
+    def _search_rows(self, app_name: str, user_id: str, safe_query: str, limit: int) -> List[tuple]:
+        conn = self._acquire_reader()
+        try:
+            # Walk the FTS matches in rank (bm25) order, look each row up by
+            # primary key and stop once LIMIT rows pass the owner filter.
+            # Legacy rows belong to every owner.
+            return conn.execute(
+                """
+                SELECT m.content, m.metadata, m.created_at, f.rank
+                FROM memories_fts f JOIN memories m ON m.id = f.rowid
+                WHERE memories_fts MATCH ?
+                  AND ((m.app_name = ? AND m.user_id = ?) OR (m.app_name = ? AND m.user_id = ?))
+                ORDER BY f.rank
+                LIMIT ?
+                """,
+                (_match_expression(safe_query), app_name, user_id, *LEGACY_MEMORY_OWNER, limit)
+            ).fetchall()
+        finally:
+            self._release_reader(conn)
+
     async def search_memory(self, app_name: str, user_id: str, query: str, limit: int = 5) -> Any:
         """Search memories using FTS."""
         # Return a structure compatible with what the agent expects (e.g. list of objects with 'text' attribute)
         # The base class or agent might expect a specific return type. 
         # For now, returning a simple object wrapper.
         
-        # Sanitize query for FTS5 (remove special characters that might break syntax)
-        # We keep alphanumeric and spaces.
-        import re
-        safe_query = re.sub(r'[^a-zA-Z0-9\s]', '', query)
+        # Sanitize query for FTS5 (special characters become token separators)
+        safe_query = _index_terms(_FTS_SANITIZE_RE.sub(' ', query))
         
-        # If query becomes empty after sanitization, return empty results
-        if not safe_query.strip():
-             return type('MemoryResponse', (), {'memories': []})
+        # If almost nothing is left after sanitization, skip the database
+        if len(safe_query) < _MIN_QUERY_LENGTH:
+            return _EMPTY_MEMORY_RESPONSE
 
-        results = []
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            await self.flush()
+
+            cache_key = (self._data_version, app_name, user_id, safe_query.lower(), limit)
+            cached = self._search_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                self._search_cache.move_to_end(cache_key)
+                return _MemoryResponse(memories=cached[1])
+
+            task = self._inflight.get(cache_key)
+            if task is None:
                 # Use the sanitized query
-                cursor = conn.execute(
-                    """
-                    SELECT content, metadata, created_at FROM memories 
-                    WHERE id IN (SELECT rowid FROM memories_fts WHERE memories_fts MATCH ? ORDER BY rank)
-                    LIMIT ?
-                    """,
-                    (safe_query, limit)
+                task = asyncio.ensure_future(
+                    self._fetch_memories(cache_key, app_name, user_id, safe_query, limit)
                 )
-                for row in cursor:
-                    # Construct a mock object that mimics the expected structure
-                    # memory.content.parts[0].text
-                    # memory.timestamp
-                    
-                    part = type('Part', (), {'text': row[0]})
-                    content = type('Content', (), {'parts': [part]})
-                    
-                    results.append(type('MemoryResult', (), {
-                        'text': row[0], 
-                        'metadata': json.loads(row[1]), 
-                        'created_at': row[2],
-                        'timestamp': row[2],
-                        'content': content,
-                        'author': None # Add author alias for preload_memory_tool
-                    }))
+                self._inflight[cache_key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+            # shield: one caller being cancelled must not cancel the others' query
+            results = await asyncio.shield(task)
         except Exception as e:
             print(f"DEBUG: Error in search_memory: {e}")
             # Return empty list on error to prevent crash
-            return type('MemoryResponse', (), {'memories': []})
-        
-        return type('MemoryResponse', (), {'memories': results})
+            return _EMPTY_MEMORY_RESPONSE
+
+        return _MemoryResponse(memories=results)
+
+    async def _fetch_memories(
+        self, cache_key: tuple, app_name: str, user_id: str, safe_query: str, limit: int
+    ) -> Tuple[_MemoryResult, ...]:
+        rows = await asyncio.to_thread(self._search_rows, app_name, user_id, safe_query, limit)
+        results = tuple(
+            _MemoryResult(
+                text=content,
+                metadata=_loads(metadata),
+                created_at=created_at,
+                timestamp=created_at,
+                score=score,
+                content=_Content(parts=[_Part(text=content)]),
+            )
+            for content, metadata, created_at, score in rows
+        )
 
-    def _extract_text(self, event: Any) -> Optional[str]:
-        # Helper to extract text from event object
-        content = getattr(event, "content", None)
-        if not content or not getattr(content, "parts", None):
-            return None
-        part = content.parts[0]
-        return getattr(part, "text", None)
+        self._search_cache[cache_key] = (time.monotonic() + SEARCH_CACHE_TTL_SECONDS, results)
+        self._search_cache.move_to_end(cache_key)
+        if len(self._search_cache) > SEARCH_CACHE_MAX_SIZE:
+            self._search_cache.popitem(last=False)
+        return results
 
 
 def build_persistent_session_service(config: SessionMemoryConfig) -> DatabaseSessionService:
@@ -222,9 +549,13 @@ async def auto_save_session_to_memory(callback_context: Any) -> None:
 
     try:
         await memory_service.add_session_to_memory(session)
-    except Exception:
-        # Even though we want persistence, memory failures should not stop the agent.
-        pass
+        # Write the buffered row now rather than waiting for a full batch.
+        flush = getattr(memory_service, "flush", None)
+        if flush is not None:
+            await flush()
+    except sqlite3.OperationalError as e:
+        # Even though we want persistence, database trouble should not stop the agent.
+        print(f"DEBUG: Failed to save session to memory: {e}")
 
 
 class SessionMemoryManager:
@@ -241,21 +572,54 @@ class SessionMemoryManager:
         self.session_service = session_service
         self.memory_service = memory_service
         self.config = config
+        # Sessions already fetched or created, keyed by session id, so repeat
+        # run_session calls skip the database round-trips.
+        self._session_cache: Dict[str, Any] = {}
+        # Memory writes are queued and drained by one background worker.
+        self._persist_queue: Optional[asyncio.Queue] = None
+        self._persist_worker: Optional[asyncio.Task] = None
+
+    async def _get_session(self, session_id: Optional[str] = None, refresh: bool = False):
+        target_session = session_id or self.config.default_session_id
+        if not refresh and target_session in self._session_cache:
+            return self._session_cache[target_session]
+
+        session = await self.session_service.get_session(
+            app_name=self.config.app_name,
+            user_id=self.config.user_id,
+            session_id=target_session,
+        )
+        if session is None:
+            try:
+                session = await self.session_service.create_session(
+                    app_name=self.config.app_name,
+                    user_id=self.config.user_id,
+                    session_id=target_session,
+                )
+            except AlreadyExistsError:
+                # Created concurrently between our lookup and create call.
+                session = await self.session_service.get_session(
+                    app_name=self.config.app_name,
+                    user_id=self.config.user_id,
+                    session_id=target_session,
+                )
 
-    async def _get_session(self, session_id: Optional[str] = None):
+        self._session_cache[target_session] = session
+        return session
+
+    async def delete_session(self, session_id: Optional[str] = None) -> None:
+        """Delete a session from storage and drop it from the local cache."""
         target_session = session_id or self.config.default_session_id
-        try:
-            return await self.session_service.create_session(
-                app_name=self.config.app_name,
-                user_id=self.config.user_id,
-                session_id=target_session,
-            )
-        except Exception:
-            return await self.session_service.get_session(
-                app_name=self.config.app_name,
-                user_id=self.config.user_id,
-                session_id=target_session,
-            )
+        self._session_cache.pop(target_session, None)
+        await self.session_service.delete_session(
+            app_name=self.config.app_name,
+            user_id=self.config.user_id,
+            session_id=target_session,
+        )
+
+    def clear_session_cache(self) -> None:
+        """Forget cached sessions so the next call re-reads them from storage."""
+        self._session_cache.clear()
 
     async def run_session(
         self,
@@ -263,19 +627,49 @@ class SessionMemoryManager:
         session_id: Optional[str] = None,
         on_response: Optional[Callable[[str], Any]] = None,
         print_output: bool = True,
-    ) -> List[str]:
-        """Run a sequence of user queries inside a single session."""
-        if not user_queries:
-            return []
+        collect: bool = False,
+    ) -> Optional[List[str]]:
+        """Run a sequence of user queries inside a single session.
+
+        Responses are handed to ``on_response`` / printed as they arrive and
+        only kept in a list (and returned) when ``collect`` is True.
+        """
+        responses: Optional[List[str]] = [] if collect else None
+
+        async for author, text in self.iter_session(user_queries, session_id):
+            if responses is not None:
+                responses.append(text)
+            if on_response:
+                on_response(text)
+            if print_output:
+                print(f"{author} > {text}")
+
+        return responses
+
+    async def run_session_iter(
+        self,
+        user_queries: Sequence[str] | str,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Yield response texts as they arrive without buffering them."""
+        async for _, text in self.iter_session(user_queries, session_id):
+            yield text
+
+    async def iter_session(
+        self,
+        user_queries: Sequence[str] | str,
+        session_id: Optional[str] = None,
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """Yield (author, text) for each text response as the agent produces it."""
+        queries = self._runnable_queries(
+            [user_queries] if isinstance(user_queries, str) else user_queries or ()
+        )
+        if not queries:
+            return
 
         session = await self._get_session(session_id)
-        queries = [user_queries] if isinstance(user_queries, str) else list(user_queries)
-        responses: List[str] = []
 
         for query in queries:
-            if not query:
-                continue
-
             query_content = types.Content(role="user", parts=[types.Part(text=query)])
 
             async for event in self.runner.run_async(
@@ -283,36 +677,87 @@ class SessionMemoryManager:
                 session_id=session.id,
                 new_message=query_content,
             ):
-                text = self._extract_text(event)
+                text = _event_text(event)
                 if not text:
                     continue
 
-                responses.append(text)
-                if on_response:
-                    on_response(text)
+                yield event.author or event.content.role or "model", text
 
-                if print_output:
-                    author = getattr(event, "author", None) or getattr(event.content, "role", "model")
-                    print(f"{author} > {text}")
+        self._schedule_persist(session.id)
 
-        await self._persist_session_to_memory(session)
-        return responses
+    @staticmethod
+    def _runnable_queries(queries: Sequence[str]) -> List[str]:
+        """Drop blank queries and collapse consecutive repeats (e.g. retries)."""
+        return [query for query, _ in groupby(queries) if query and query.strip()]
 
-    async def _persist_session_to_memory(self, session: Any) -> None:
+    async def aclose(self) -> None:
+        """
+        Wait for queued memory writes, stop the worker and drop cached sessions
+        (call before shutdown).
+        """
+        worker = self._persist_worker
+        if worker is not None:
+            await self._persist_queue.join()
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+            self._persist_queue = self._persist_worker = None
+        self.clear_session_cache()
+
+    def _schedule_persist(self, session_id: str) -> None:
         if not self.memory_service:
             return
+        worker = self._persist_worker
+        if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            self._persist_queue = asyncio.Queue()
+            self._persist_worker = asyncio.create_task(self._run_persist_worker(self._persist_queue))
+        self._persist_queue.put_nowait(session_id)
+
+    async def _run_persist_worker(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + PERSIST_BATCH_WINDOW_SECONDS
+            while len(batch) < PERSIST_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._persist_sessions_to_memory(batch)
+            except Exception as e:
+                # Nobody awaits this task, so report the failure and keep
+                # serving the queue rather than dying with items unprocessed.
+                loop.call_exception_handler({
+                    "message": "Background memory persistence failed",
+                    "exception": e,
+                })
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _persist_sessions_to_memory(self, session_ids: Sequence[str]) -> None:
         try:
-            await self.memory_service.add_session_to_memory(session)
-        except Exception:
-            pass
+            # Re-read so the stored memory includes each run's events
+            sessions = [
+                await self._get_session(session_id, refresh=True)
+                for session_id in dict.fromkeys(session_ids)
+            ]
+            add_sessions = getattr(self.memory_service, "add_sessions_to_memory", None)
+            if add_sessions is not None:
+                await add_sessions(sessions)
+            else:
+                for session in sessions:
+                    await self.memory_service.add_session_to_memory(session)
+        except sqlite3.OperationalError as e:
+            print(f"DEBUG: Failed to persist sessions to memory: {e}")
 
     @staticmethod
     def _extract_text(event: Any) -> Optional[str]:
-        content = getattr(event, "content", None)
-        if not content or not getattr(content, "parts", None):
-            return None
-        part = content.parts[0]
-        return getattr(part, "text", None)
+        return _event_text(event)
 
     async def search_memory(self, query: str, limit: int = 5) -> List[Any]:
         """Return raw memory entries that match the query."""
@@ -328,12 +773,17 @@ class SessionMemoryManager:
             query=query,
             limit=limit,
         )
-        return getattr(response, "memories", [])
+        return list(getattr(response, "memories", []))
+
+    async def iter_session_events(self, session_id: Optional[str] = None) -> AsyncIterator[Any]:
+        """Yield the raw events of a session one at a time without copying them."""
+        session = await self._get_session(session_id, refresh=True)
+        for event in getattr(session, "events", None) or ():
+            yield event
 
     async def get_session_events(self, session_id: Optional[str] = None) -> List[Any]:
-        """Retrieve raw events for a given session."""
-        session = await self._get_session(session_id)
-        return list(getattr(session, "events", []))
+        """Retrieve raw events for a given session as a list."""
+        return [event async for event in self.iter_session_events(session_id)]
 
 
 __all__ = [
@@ -1,14 +1,12 @@
 from google.adk.agents import LlmAgent
 from ..tools import check_attendees_availability, get_team_members
-from ..datetime_utils import get_current_datetime_context
+from ..datetime_utils import add_datetime_context
 
 availability_checker_agent = LlmAgent(
     name="availability_checker",
     model="gemini-2.0-flash",
     description="Checks calendar availability for meeting attendees and resolves team names to individual emails",
-    instruction=f"""
-    {get_current_datetime_context()}
-    
+    instruction="""
     You are an **Availability Checker Agent**.
     
     Your responsibilities:
@@ -52,4 +50,5 @@ availability_checker_agent = LlmAgent(
         check_attendees_availability,
         get_team_members,
     ],
+    before_model_callback=add_datetime_context,
 )
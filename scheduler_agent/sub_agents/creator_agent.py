@@ -1,15 +1,13 @@
 from google.adk.agents import LlmAgent
 from ..tools import create_event
 from ..email_utils import validate_emails
-from ..datetime_utils import get_current_datetime_context
+from ..datetime_utils import add_datetime_context
 
 event_creator_agent = LlmAgent(
     name="event_creator",
     model="gemini-2.0-flash",
     description="Creates calendar events after validation, ensuring all details are correct",
-    instruction=f"""
-    {get_current_datetime_context()}
-    
+    instruction="""
     You are an **Event Creator Agent**.
     
     Your responsibilities:
@@ -68,4 +66,5 @@ event_creator_agent = LlmAgent(
         create_event,
         validate_emails,
     ],
+    before_model_callback=add_datetime_context,
 )
@@ -1,6 +1,6 @@
 from google.adk.agents import LlmAgent
 from ..tools import check_conflict, check_policies
-from ..datetime_utils import get_current_datetime_context
+from ..datetime_utils import add_datetime_context
 
 
 
@@ -10,9 +10,7 @@ event_validator_agent = LlmAgent(
     name="event_validator",
     model="gemini-2.0-flash",
     description="Validates events against organizational policies and checks for calendar conflicts",
-    instruction=f"""
-    {get_current_datetime_context()}
-    
+    instruction="""
     You are an **Event Validator Agent**.
     
     Your responsibilities:
@@ -68,4 +66,5 @@ event_validator_agent = LlmAgent(
         check_policies,
         check_conflict,
     ],
+    before_model_callback=add_datetime_context,
 )
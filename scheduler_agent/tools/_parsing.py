@@ -0,0 +1,59 @@
+import re
+from datetime import date, datetime, time, timedelta
+from typing import List, Tuple
+
+from ..datetime_utils import parse_date, parse_time
+
+# Comma plus any surrounding whitespace, so one split also strips every item.
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+# Attendee strings may separate emails with commas, semicolons or whitespace
+_ATTENDEE_SPLIT = re.compile(r'[\s,;]+')
+
+def split_csv(value: str) -> List[str]:
+    """
+    Split a comma-separated tool argument into its non-empty, stripped items.
+
+    Repeats are dropped, keeping the first occurrence.
+    """
+    if not value:
+        return []
+    return list(dict.fromkeys(item for item in _CSV_SPLIT.split(value.strip()) if item))
+
+
+def split_attendees(value: str) -> List[str]:
+    """
+    Split an attendee string into emails; every tool and validator uses
+    this one rule.
+
+    Like split_csv, empty items are dropped and repeats are dropped keeping
+    the first occurrence, so an attendee listed in two expanded teams is
+    only checked and invited once.
+    """
+    if not value:
+        return []
+    return list(dict.fromkeys(item for item in _ATTENDEE_SPLIT.split(value) if item))
+
+
+def parse_slot(date_str: str, start_time: str, end_time: str) -> Tuple[date, time, time, date]:
+    """
+    Parse a tool's date/start/end arguments once.
+
+    end_time may be a duration ("2hr"); it becomes a clock time, and the
+    end date moves to the next day if the meeting runs past midnight.
+
+    Returns:
+        (date_obj, start_t, end_t, end_date)
+    """
+    date_obj = parse_date(date_str)
+    start_t = parse_time(start_time)
+    if isinstance(start_t, timedelta):
+        raise ValueError("Start time cannot be a duration.")
+
+    end_t = parse_time(end_time)
+    end_date = date_obj
+    if isinstance(end_t, timedelta):
+        dt_end = datetime.combine(date_obj, start_t) + end_t
+        end_t = dt_end.time()
+        end_date = dt_end.date()
+    return date_obj, start_t, end_t, end_date
@@ -1,10 +1,43 @@
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from ..auth import get_calendar_service
-from ..datetime_utils import get_local_timezone, parse_date, parse_time, to_iso
+from ..datetime_utils import get_local_timezone, to_iso, resolve_timezone
 from ..parallel_execution import ParallelAvailabilityCoordinator
+from ..parallel_execution.availability_checker import clear_freebusy_cache
 
+from ._parsing import parse_slot, split_attendees
 from .holidays import is_working_time
 
+# Upper bound on concurrent working-hours/holiday checks per call.
+WORKING_TIME_MAX_WORKERS = 32
+
+# Slot searches probe the same attendees and windows repeatedly; results
+# are reused for a short while. Creating an event clears the cache.
+AVAILABILITY_CACHE_TTL_SECONDS = 30
+AVAILABILITY_CACHE_MAX_SIZE = 256
+_availability_cache = OrderedDict()
+
+def clear_availability_cache() -> None:
+    """
+    Forget cached availability results (called after calendars change).
+
+    Clears both this module's results and the coordinator's FreeBusy cache,
+    which the validation agent reads through.
+    """
+    _availability_cache.clear()
+    clear_freebusy_cache()
+
+@lru_cache(maxsize=1)
+def _local_tz_name() -> str:
+    local_tz = get_local_timezone()
+    # Convert to string if it's a timezone object
+    if hasattr(local_tz, 'zone'):
+        return local_tz.zone
+    return 'UTC'
+
 def check_attendees_availability(attendees: str, date: str, start_time: str, end_time: str, organizer_tz: str = None):
     """
     Check if attendees are available during the specified time slot using Google Calendar FreeBusy API.
@@ -27,40 +60,26 @@ def check_attendees_availability(attendees: str, date: str, start_time: str, end
             "end": iso_string
         }
     """
+    return _check_attendees_availability_parsed(
+        attendees, *parse_slot(date, start_time, end_time), organizer_tz
+    )
+
+def _check_attendees_availability_parsed(attendees: str, date_obj, start_t, end_t, date_obj_end, organizer_tz: str = None):
+    """check_attendees_availability for an already parsed slot (see parse_slot)."""
     service = get_calendar_service()
     
     # Get timezone
     if organizer_tz is None:
-        organizer_tz = get_local_timezone()
-        # Convert to string if it's a timezone object
-        if hasattr(organizer_tz, 'zone'):
-            organizer_tz = organizer_tz.zone
-        else:
-            organizer_tz = 'UTC'
-    
-    # Parse inputs
-    date_obj = parse_date(date)
-    start_t = parse_time(start_time)
-    end_t = parse_time(end_time)
-    
-    if isinstance(start_t, timedelta):
-        raise ValueError("Start time cannot be a duration.")
-    
-    # Convert duration to end time if needed
-    if isinstance(end_t, timedelta):
-        dt_start = datetime.combine(date_obj, start_t)
-        dt_end = dt_start + end_t
-        end_t = dt_end.time()
-        date_obj_end = dt_end.date()
-    else:
-        date_obj_end = date_obj
+        organizer_tz = _local_tz_name()
     
     # Convert to UTC ISO format for API
-    start_iso = to_iso(date_obj, start_t, organizer_tz)
-    end_iso = to_iso(date_obj_end, end_t, organizer_tz)
+    # Resolve the timezone once for both conversions
+    tz = resolve_timezone(organizer_tz)
+    start_iso = to_iso(date_obj, start_t, tz)
+    end_iso = to_iso(date_obj_end, end_t, tz)
     
     # Parse attendees
-    attendee_emails = [email.strip() for email in attendees.split(",") if email.strip()]
+    attendee_emails = split_attendees(attendees)
     
     if not attendee_emails:
         return {
@@ -71,6 +90,13 @@ def check_attendees_availability(attendees: str, date: str, start_time: str, end
             "end": end_iso
         }
     
+    cache_key = (frozenset(attendee_emails), start_iso, end_iso)
+    cached = _availability_cache.get(cache_key)
+    if cached is not None and cached[0] > time.monotonic():
+        _availability_cache.move_to_end(cache_key)
+        # Callers get their own copy; changing it must not alter the cache
+        return deepcopy(cached[1])
+
     # Query FreeBusy API
     body = {
         "timeMin": start_iso,
@@ -84,48 +110,62 @@ def check_attendees_availability(attendees: str, date: str, start_time: str, end
     # Parse results
     busy_attendees = {}
     free_attendees = []
+    calendars = freebusy_result.get('calendars', {})
+
+    # Same slot for everyone: format it once, and look each country's
+    # holiday status up once rather than once per attendee.
+    date_str = date_obj.strftime("%Y-%m-%d")
+    start_time_str = start_t.strftime("%H:%M")
+    end_time_str = end_t.strftime("%H:%M")
+    holidays = {}
+
+    def working_status(email):
+        return is_working_time(date_str, start_time_str, end_time_str, email, holidays)
+
+    # Working hours / holidays only matter for attendees whose calendar is
+    # free. Holiday checks may search the web, so run them side by side.
+    need_check = [
+        email for email in attendee_emails
+        if not calendars.get(email, {}).get('busy')
+    ]
+    if len(need_check) > 1:
+        with ThreadPoolExecutor(max_workers=min(WORKING_TIME_MAX_WORKERS, len(need_check))) as executor:
+            working_statuses = dict(zip(need_check, executor.map(working_status, need_check)))
+    else:
+        working_statuses = {email: working_status(email) for email in need_check}
     
     for email in attendee_emails:
         # 1. Check Calendar Busy/Free
-        calendar_info = freebusy_result.get('calendars', {}).get(email, {})
-        busy_times = calendar_info.get('busy', [])
-        
-        is_busy = False
+        busy_times = calendars.get(email, {}).get('busy', [])
         if busy_times:
             busy_attendees[email] = busy_times
-            is_busy = True
+            continue
             
         # 2. Check Working Hours / Holidays (Logic Check)
-        # Only check if not already busy from calendar
-        if not is_busy:
-            # Format date and times for is_working_time check
-            date_str = date_obj.strftime("%Y-%m-%d")
-            start_time_str = start_t.strftime("%H:%M")
-            end_time_str = end_t.strftime("%H:%M")
-            
-            working_status = is_working_time(date_str, start_time_str, end_time_str, email)
-            if not working_status["is_working"]:
-                is_busy = True
-                if email not in busy_attendees:
-                    busy_attendees[email] = []
-                
-                # Add a synthetic busy block
-                busy_attendees[email].append({
-                    "start": start_iso,
-                    "end": end_iso,
-                    "details": working_status["reason"]
-                })
+        working = working_statuses[email]
+        if not working["is_working"]:
+            # Add a synthetic busy block
+            busy_attendees.setdefault(email, []).append({
+                "start": start_iso,
+                "end": end_iso,
+                "details": working["reason"]
+            })
+            continue
         
-        if not is_busy:
-            free_attendees.append(email)
+        free_attendees.append(email)
     
-    return {
+    result = {
         "all_free": len(busy_attendees) == 0,
         "busy_attendees": busy_attendees,
         "free_attendees": free_attendees,
         "start": start_iso,
         "end": end_iso
     }
+    _availability_cache[cache_key] = (time.monotonic() + AVAILABILITY_CACHE_TTL_SECONDS, deepcopy(result))
+    _availability_cache.move_to_end(cache_key)
+    if len(_availability_cache) > AVAILABILITY_CACHE_MAX_SIZE:
+        _availability_cache.popitem(last=False)
+    return result
 
 
 def all_attendees_free(availability_result: dict) -> bool:
@@ -179,7 +219,7 @@ async def check_attendees_availability_parallel(
     """
     
     # Parse attendees
-    attendee_list = [email.strip() for email in attendees.split(",") if email.strip()]
+    attendee_list = split_attendees(attendees)
     
     if not attendee_list:
         return {
@@ -1,8 +1,29 @@
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from ..auth import get_calendar_service
-from ..datetime_utils import get_local_timezone, parse_date, parse_time, to_iso
-from .validation import check_conflict
-from .availability import check_attendees_availability
+from ..datetime_utils import get_local_timezone, to_iso
+from ._parsing import parse_slot, split_attendees
+from .validation import _check_conflict_parsed
+from .availability import _check_attendees_availability_parsed, clear_availability_cache
+
+# Calendar metadata (the writable calendar list, the organizer's address)
+# rarely changes, so lookups are reused for this long.
+CALENDAR_CACHE_TTL_SECONDS = 60
+_calendar_cache = {}
+
+def _cached(key: str, fetch, ttl: float = CALENDAR_CACHE_TTL_SECONDS):
+    entry = _calendar_cache.get(key)
+    now = time.monotonic()
+    if entry is not None and entry[0] > now:
+        return entry[1]
+    value = fetch()
+    _calendar_cache[key] = (now + ttl, value)
+    return value
+
+def clear_calendar_cache() -> None:
+    """Forget cached calendar metadata (e.g. after adding a calendar)."""
+    _calendar_cache.clear()
+
 
 def get_calendar_id(service, calendar_name: str) -> str:
     """
@@ -13,8 +34,10 @@ def get_calendar_id(service, calendar_name: str) -> str:
         return 'primary'
 
     # List all calendars
-    calendar_list = service.calendarList().list(minAccessRole='writer').execute()
-    items = calendar_list.get('items', [])
+    items = _cached(
+        "writable_calendars",
+        lambda: service.calendarList().list(minAccessRole='writer').execute().get('items', [])
+    )
 
     for cal in items:
         if cal.get('summary', '').lower() == calendar_name.lower():
@@ -40,33 +63,20 @@ def create_event(title: str, date: str, start_time: str, end_time: str, attendee
     Returns:
         Dictionary with event details including UTC timestamps
     """
+    return _create_event_parsed(title, *parse_slot(date, start_time, end_time), attendees, calendar_name)
+
 
+def _create_event_parsed(title: str, date_obj, start_t, end_t, end_date, attendees: str = "", calendar_name: str = "primary"):
+    """create_event for an already parsed slot (see parse_slot)."""
     service = get_calendar_service()
     target_calendar_id = get_calendar_id(service, calendar_name)
     
     # Get local timezone for interpreting naive times
     local_tz = get_local_timezone()
 
-    # Parse date
-    date_obj = parse_date(date)
-
-    # Parse start time (always absolute)
-    start_t = parse_time(start_time)
-    if isinstance(start_t, timedelta):
-        raise ValueError("Start time cannot be a duration.")
-
-    # Handle end time (duration OR absolute)
-    end_t = parse_time(end_time)
-
-    if isinstance(end_t, timedelta):
-        # duration → convert into end clock time
-        dt_start = datetime.combine(date_obj, start_t)
-        dt_end = dt_start + end_t
-        end_t = dt_end.time()
-
     # Convert to ISO in UTC
     start_iso = to_iso(date_obj, start_t, local_tz)
-    end_iso = to_iso(date_obj, end_t, local_tz)
+    end_iso = to_iso(end_date, end_t, local_tz)
 
     # Validate that event is not in the past
     dt_start_local = datetime.combine(date_obj, start_t)
@@ -89,29 +99,38 @@ def create_event(title: str, date: str, start_time: str, end_time: str, attendee
     
     # Add attendees if provided
     if attendees and attendees.strip():
-        # Get organizer's email to prevent duplicates
-        primary_cal = service.calendars().get(calendarId='primary').execute()
-        organizer_email = primary_cal.get('id', '')
+        # Get organizer's email to prevent duplicates. The credentials are
+        # loaded once per process, so the organizer never changes.
+        organizer = _cached(
+            "organizer_email",
+            lambda: service.calendars().get(calendarId='primary').execute().get('id', ''),
+            ttl=float("inf")
+        ).lower()
         
-        # Parse comma-separated email addresses and filter out organizer
-        attendee_list = [
-            email.strip() for email in attendees.split(",") 
-            if email.strip() and email.strip().lower() != organizer_email.lower()
+        # Parse attendee email addresses and filter out organizer
+        event_attendees = [
+            {"email": email}
+            for email in split_attendees(attendees)
+            if email.lower() != organizer
         ]
         
-        if attendee_list:
-            event_body["attendees"] = [{"email": email} for email in attendee_list]
+        if event_attendees:
+            event_body["attendees"] = event_attendees
 
     event = service.events().insert(
         calendarId=target_calendar_id, 
         body=event_body,
         sendUpdates="all"  # Send email notifications to all attendees
     ).execute()
+    # Attendees are now busy in this slot
+    clear_availability_cache()
 
     return {
         "status": "success",
         "event_id": event.get("id"),
         "calendar_id": target_calendar_id,
+        # insert() returns the full event, link included
+        "event_link": event.get("htmlLink"),
         "start": start_iso,
         "end": end_iso,
         "attendees": attendees if attendees else "none"
@@ -148,8 +167,11 @@ def create_event_with_attendees(title: str, date: str, start_time: str, end_time
             "event_link": "..."  # if created successfully
         }
     """
+    # Parse once and share the slot between the three steps
+    slot = parse_slot(date, start_time, end_time)
+
     # Step 1: Check organizer's calendar
-    organizer_conflict = check_conflict(date, start_time, end_time)
+    organizer_conflict = _check_conflict_parsed(*slot)
     
     if organizer_conflict["conflict"]:
         return {
@@ -162,7 +184,7 @@ def create_event_with_attendees(title: str, date: str, start_time: str, end_time
     
     # Step 2: Check attendees availability (if requested)
     if check_availability and attendees and attendees.strip():
-        availability = check_attendees_availability(attendees, date, start_time, end_time, organizer_tz)
+        availability = _check_attendees_availability_parsed(attendees, *slot, organizer_tz)
         
         if not availability["all_free"]:
             busy_details = []
@@ -179,19 +201,13 @@ def create_event_with_attendees(title: str, date: str, start_time: str, end_time
             }
     
     # Step 3: All clear - create the event
-    event_result = create_event(title, date, start_time, end_time, attendees, calendar_name=calendar_name)
-    
-    # Get event link from the API
-    service = get_calendar_service()
-    event_id = event_result["event_id"]
-    target_cal_id = event_result.get("calendar_id", "primary")
-    event = service.events().get(calendarId=target_cal_id, eventId=event_id).execute()
+    event_result = _create_event_parsed(title, *slot, attendees, calendar_name=calendar_name)
     
     return {
         "status": "success",
-        "message": f"Event '{title}' created successfully with {len(attendees.split(',')) if attendees else 0} attendee(s).",
-        "event_id": event_id,
-        "event_link": event.get("htmlLink"),
+        "message": f"Event '{title}' created successfully with {len(split_attendees(attendees))} attendee(s).",
+        "event_id": event_result["event_id"],
+        "event_link": event_result["event_link"],
         "start": event_result["start"],
         "end": event_result["end"],
         "attendees": attendees
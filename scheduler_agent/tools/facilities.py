@@ -1,5 +1,21 @@
 import json
+from typing import Any
 from ..data_manager import get_data_manager
+from ._parsing import split_csv
+
+def _json_dumps(obj: Any) -> str:
+    """json.dumps formatted like orjson: no spaces, UTF-8 unescaped"""
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+# orjson is optional; with the options above, the output is the same
+# compact text either way.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = _json_dumps
 
 def find_facility(capacity: int = 0, amenities: str = "") -> str:
     """
@@ -11,14 +27,14 @@ def find_facility(capacity: int = 0, amenities: str = "") -> str:
         JSON string of matching facilities.
     """
     dm = get_data_manager()
-    amenity_list = [a.strip() for a in amenities.split(",")] if amenities else []
+    amenity_list = split_csv(amenities)
     facilities = dm.find_facility(capacity=capacity, amenities=amenity_list)
     
     if not facilities:
         return "No matching facilities found."
     
     # Return simplified info to save tokens
-    return json.dumps([{
+    return _dumps([{
         "name": f['name'],
         "capacity": f['capacity'],
         "amenities": f['amenities']
@@ -31,5 +47,5 @@ def get_facility_info(facility_name: str) -> str:
     dm = get_data_manager()
     info = dm.get_facility_info(facility_name)
     if info:
-        return json.dumps(info)
+        return _dumps(info)
     return "Facility not found."
@@ -1,4 +1,9 @@
-from datetime import datetime, time
+import re
+import threading
+from collections import OrderedDict
+from datetime import date, time
+from functools import lru_cache
+from time import monotonic
 from typing import Optional
 import os
 
@@ -13,57 +18,165 @@ try:
 except ImportError:
     _search_tool = None
 
+# The holidays package is optional; it answers most countries offline, and
+# the web search above is only used for countries it doesn't know.
+try:
+    import holidays as _holidays_lib
+except ImportError:
+    _holidays_lib = None
+
 from .search import get_user_details
 from ..datetime_utils import parse_date, parse_time
 
-_holiday_cache = {}
+# Bounded so long-running sessions don't accumulate every date ever checked.
+HOLIDAY_CACHE_MAX_SIZE = 2048
+
+# Search answers can be corrected, so they are only trusted for about a day.
+HOLIDAY_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# (country, YYYY-MM-DD) -> (expires_at, is_holiday) for web search answers.
+# Holiday checks run on worker threads, hence the lock.
+_search_answers: "OrderedDict[tuple, tuple]" = OrderedDict()
+_search_answers_lock = threading.Lock()
+
+def clear_holiday_cache() -> None:
+    """Forget cached holiday search answers."""
+    with _search_answers_lock:
+        _search_answers.clear()
+
+@lru_cache(maxsize=HOLIDAY_CACHE_MAX_SIZE)
+def _normalize_date(date_str: str) -> str:
+    """Return date_str as YYYY-MM-DD, or unchanged if it can't be parsed."""
+    try:
+        return parse_date(date_str).strftime("%Y-%m-%d")
+    except:
+        return date_str
+
+# Country names as they appear in user profiles -> ISO 3166 alpha-2 codes
+# understood by the holidays package. Unlisted names are tried as codes.
+_COUNTRY_CODES = {
+    "australia": "AU",
+    "canada": "CA",
+    "china": "CN",
+    "france": "FR",
+    "germany": "DE",
+    "india": "IN",
+    "indonesia": "ID",
+    "japan": "JP",
+    "malaysia": "MY",
+    "pakistan": "PK",
+    "philippines": "PH",
+    "singapore": "SG",
+    "uk": "GB",
+    "united kingdom": "GB",
+    "united states": "US",
+    "usa": "US",
+}
 
 def is_holiday(date_str: str, country: str) -> bool:
     """
-    Checks if a date is a public holiday in a specific country using Google Search.
+    Checks if a date is a public holiday in a specific country, from the
+    holidays package when available, otherwise using Google Search.
     """
-    if not country or not _search_tool:
+    if not country:
         return False
-        
-    # Normalize date
-    try:
-        dt = parse_date(date_str)
-        formatted_date = dt.strftime("%Y-%m-%d")
-    except:
-        formatted_date = date_str
-        
-    key = f"{country}:{formatted_date}"
-    if key in _holiday_cache:
-        return _holiday_cache[key]
-        
-    query = f"Is {formatted_date} a public holiday in {country}?"
+    formatted_date = _normalize_date(date_str)
+    known = _offline_holiday(country, formatted_date)
+    if known is not None:
+        return known
+    if not _search_tool:
+        return False
+    key = (country, formatted_date)
+    with _search_answers_lock:
+        entry = _search_answers.get(key)
+        if entry is not None and entry[0] > monotonic():
+            _search_answers.move_to_end(key)
+            return entry[1]
     try:
-        # Search returns a string summary
-        results = _search_tool.search(query)
-        lower_res = results.lower()
-        
-        # Heuristic check for holiday confirmation
-        is_hol = (
-            "public holiday" in lower_res or 
-            "national holiday" in lower_res or 
-            "bank holiday" in lower_res or
-            "federal holiday" in lower_res
-        )
-        
-        # Negative check
-        if "not a public holiday" in lower_res or "not a holiday" in lower_res:
-            is_hol = False
-            
-        _holiday_cache[key] = is_hol
-        return is_hol
+        answer = _search_holiday(country, formatted_date)
     except Exception as e:
+        # Not cached: a transient failure must not pin "not a holiday"
         print(f"Holiday check error: {e}")
         return False
+    # Each answer is kept for the full TTL from when it was fetched
+    with _search_answers_lock:
+        _search_answers[key] = (monotonic() + HOLIDAY_CACHE_TTL_SECONDS, answer)
+        _search_answers.move_to_end(key)
+        while len(_search_answers) > HOLIDAY_CACHE_MAX_SIZE:
+            _search_answers.popitem(last=False)
+    return answer
+
+def _offline_holiday(country: str, formatted_date: str) -> Optional[bool]:
+    """Answer from the holidays package, or None if it can't."""
+    try:
+        day = date.fromisoformat(formatted_date)
+    except ValueError:
+        return None
+    dates = _country_holidays(country, day.year)
+    return None if dates is None else day in dates
 
-def is_working_time(date_str: str, start_time_str: str, end_time_str: str, user_email: str) -> dict:
+@lru_cache(maxsize=256)
+def _country_holidays(country: str, year: int) -> Optional[frozenset]:
+    """All holiday dates of a country in a year, fetched in one go."""
+    if _holidays_lib is None:
+        return None
+    code = _COUNTRY_CODES.get(country.lower(), country.upper())
+    try:
+        return frozenset(_holidays_lib.country_holidays(code, years=year))
+    except NotImplementedError:
+        # Country not supported by the package
+        return None
+
+# Phrases in a search summary that confirm or deny a holiday.
+_HOLIDAY_POS = re.compile(r'(public|national|bank|federal)\s+holiday', re.I)
+_HOLIDAY_NEG = re.compile(r'not a (public\s+)?holiday', re.I)
+
+def _search_holiday(country: str, formatted_date: str) -> bool:
+    """Ask the web search whether a date is a holiday; errors propagate."""
+    query = f"Is {formatted_date} a public holiday in {country}?"
+    # Search returns a string summary
+    results = _search_tool.search(query)
+    
+    # Heuristic check for holiday confirmation, overridden by a negative
+    return bool(_HOLIDAY_POS.search(results)) and not _HOLIDAY_NEG.search(results)
+
+# Bit i is set for weekday i (Monday = 0), matching date.weekday().
+_DAY_BITS = {
+    day: 1 << i
+    for i, day in enumerate(
+        ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+    )
+}
+
+@lru_cache(maxsize=128)
+def _working_days_mask(working_days: tuple) -> int:
+    """Bitmask of a working_days preference; unknown day names set no bit."""
+    mask = 0
+    for day in working_days:
+        mask |= _DAY_BITS.get(day, 0)
+    return mask
+
+@lru_cache(maxsize=256)
+def _parse_hhmm(value: str) -> time:
+    """Parse an "HH:MM" preference once; raises ValueError like strptime would."""
+    hours, minutes = value.split(":")
+    return time(int(hours), int(minutes))
+
+def is_working_time(
+    date_str: str,
+    start_time_str: str,
+    end_time_str: str,
+    user_email: str,
+    holidays: Optional[dict] = None,
+) -> dict:
     """
     Checks if the specified time falls within the user's working hours and days.
     Also checks for holidays if the user doesn't work on them.
+
+    Args:
+        holidays: Optional country -> is_holiday(date_str, country) results,
+            shared by callers checking many users on the same date so each
+            country is looked up once. Missing countries are looked up and added.
     
     Returns:
         {
@@ -82,40 +195,41 @@ def is_working_time(date_str: str, start_time_str: str, end_time_str: str, user_
     # Parse inputs
     try:
         date_obj = parse_date(date_str)
-        day_name = date_obj.strftime("%A")
     except:
         return {"is_working": True, "reason": "Invalid date"}
         
     # 1. Check Vacation Dates
     vacation_dates = prefs.get("vacation_dates", [])
     if vacation_dates:
-        try:
-            # Normalize input date
-            dt = parse_date(date_str)
-            formatted_date = dt.strftime("%Y-%m-%d")
-            if formatted_date in vacation_dates:
-                return {"is_working": False, "reason": "User is on Vacation"}
-        except:
-            pass
+        # Normalize input date
+        formatted_date = date_obj.isoformat()
+        if formatted_date in vacation_dates:
+            return {"is_working": False, "reason": "User is on Vacation"}
 
     # 2. Check Working Days
     working_days = prefs.get("working_days", [])
-    if working_days and day_name not in working_days:
-        return {"is_working": False, "reason": f"Non-working day ({day_name})"}
+    if working_days and not (_working_days_mask(tuple(working_days)) >> date_obj.weekday()) & 1:
+        return {"is_working": False, "reason": f"Non-working day ({date_obj.strftime('%A')})"}
         
     # 3. Check Holidays
     work_on_holidays = prefs.get("work_on_holidays", False)
     if not work_on_holidays:
         country = user.get("country")
-        if country and is_holiday(date_str, country):
+        if holidays is None:
+            on_holiday = bool(country) and is_holiday(date_str, country)
+        else:
+            on_holiday = holidays.get(country)
+            if on_holiday is None:
+                on_holiday = holidays[country] = bool(country) and is_holiday(date_str, country)
+        if on_holiday:
             return {"is_working": False, "reason": f"Public Holiday in {country}"}
             
     # 4. Check Working Hours
     working_hours = prefs.get("working_hours", {})
     if working_hours:
         try:
-            start_pref = datetime.strptime(working_hours["start"], "%H:%M").time()
-            end_pref = datetime.strptime(working_hours["end"], "%H:%M").time()
+            start_pref = _parse_hhmm(working_hours["start"])
+            end_pref = _parse_hhmm(working_hours["end"])
             
             meeting_start = parse_time(start_time_str)
             if isinstance(meeting_start, time):
@@ -1,13 +1,18 @@
+from copy import deepcopy
+from functools import lru_cache
+
 from ..data_manager import get_data_manager
 
+# User and team data is loaded once from disk and never changes while the
+# agent runs, so lookups are memoized (including misses).
+USER_CACHE_MAX_SIZE = 4096
+
 def get_team_members(team_name: str) -> str:
     """
     Returns a comma-separated list of email addresses for a given team.
     Useful for resolving "TeamElla" to actual attendees.
     """
-    dm = get_data_manager()
-    emails = dm.get_team_members(team_name)
-    return ", ".join(emails)
+    return _team_members(team_name)
 
 def get_user_details(email_or_name: str) -> dict:
     """
@@ -17,6 +22,23 @@ def get_user_details(email_or_name: str) -> dict:
     Returns:
         Dictionary with user details or empty dict if not found
     """
+    # Deep copy so callers can't change the cached entry, including nested
+    # preferences and teams
+    return deepcopy(_user_details(email_or_name))
+
+@lru_cache(maxsize=USER_CACHE_MAX_SIZE)
+def _team_members(team_name: str) -> str:
+    dm = get_data_manager()
+    emails = dm.get_team_members(team_name)
+    return ", ".join(emails)
+
+@lru_cache(maxsize=USER_CACHE_MAX_SIZE)
+def _user_details(email_or_name: str) -> dict:
     dm = get_data_manager()
     details = dm.get_user_details(email_or_name)
     return details if details else {}
+
+def clear_user_caches() -> None:
+    """Forget memoized user and team lookups (e.g. after reloading data)."""
+    _team_members.cache_clear()
+    _user_details.cache_clear()
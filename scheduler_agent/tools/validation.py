@@ -1,7 +1,10 @@
-from datetime import datetime, timedelta
 from ..auth import get_calendar_service
-from ..datetime_utils import get_local_timezone, parse_date, parse_time, to_iso
+from ..datetime_utils import get_local_timezone, to_iso, resolve_timezone
 from ..parallel_execution import ConflictValidationAgent
+from ._parsing import parse_slot
+
+# FreeBusy accepts at most this many calendars per query.
+FREEBUSY_MAX_CALENDARS = 50
 
 def check_conflict(date: str, start_time: str, end_time: str, timezone: str = None):
     """
@@ -16,7 +19,11 @@ def check_conflict(date: str, start_time: str, end_time: str, timezone: str = No
     Returns:
         Dictionary with conflict status and event details
     """
+    return _check_conflict_parsed(*parse_slot(date, start_time, end_time), timezone)
+
 
+def _check_conflict_parsed(date_obj, start_t, end_t, end_date, timezone: str = None):
+    """check_conflict for an already parsed slot (see parse_slot)."""
     service = get_calendar_service()
     
     # Get local timezone for interpreting naive times
@@ -26,48 +33,73 @@ def check_conflict(date: str, start_time: str, end_time: str, timezone: str = No
     else:
         local_tz = get_local_timezone()
 
-    date_obj = parse_date(date)
-    start_t = parse_time(start_time)
-    end_t = parse_time(end_time)
-
-    # Duration → convert to final time
-    if isinstance(end_t, timedelta):
-        dt_start = datetime.combine(date_obj, start_t)
-        dt_end = dt_start + end_t
-        end_t = dt_end.time()
-
     # Convert both to UTC RFC3339 timestamps
     # to_iso handles both string timezones and timezone objects
-    start_iso = to_iso(date_obj, start_t, local_tz)
-    end_iso = to_iso(date_obj, end_t, local_tz)
+    # Resolve the timezone once for both conversions
+    tz = resolve_timezone(local_tz)
+    start_iso = to_iso(date_obj, start_t, tz)
+    end_iso = to_iso(end_date, end_t, tz)
 
-    # 1. Get all calendars
+    # 1. Get all calendars (hidden ones, selected=False, are skipped)
     calendar_list_result = service.calendarList().list(minAccessRole='reader').execute()
-    calendars = calendar_list_result.get('items', [])
+    summaries = {
+        cal.get('id'): cal.get('summary', 'Unknown Calendar')
+        for cal in calendar_list_result.get('items', [])
+        if cal.get('selected', True)
+    }
+    cal_ids = list(summaries)
 
-    all_conflicts = []
+    # 2. One FreeBusy query finds the calendars with anything in the slot
+    busy_ids = []
+    for i in range(0, len(cal_ids), FREEBUSY_MAX_CALENDARS):
+        chunk = cal_ids[i:i + FREEBUSY_MAX_CALENDARS]
+        freebusy_result = service.freebusy().query(body={
+            "timeMin": start_iso,
+            "timeMax": end_iso,
+            "timeZone": "UTC",
+            "items": [{"id": cal_id} for cal_id in chunk]
+        }).execute()
+        calendars = freebusy_result.get('calendars', {})
+        for cal_id in chunk:
+            info = calendars.get(cal_id, {})
+            # Calendars FreeBusy couldn't read are listed directly below
+            if info.get('busy') or info.get('errors'):
+                busy_ids.append(cal_id)
 
-    # 2. Check each calendar
-    for cal in calendars:
-        cal_id = cal.get('id')
-        # Skip if selected is False (hidden calendars)
-        if not cal.get('selected', True):
-            continue
-
-        events_result = service.events().list(
-            calendarId=cal_id,
-            timeMin=start_iso,
-            timeMax=end_iso,
-            singleEvents=True,
-            orderBy="startTime"
-        ).execute()
-
-        events = events_result.get("items", [])
-        if events:
-            # Add calendar name to event details for clarity
-            for event in events:
-                event['calendarSummary'] = cal.get('summary', 'Unknown Calendar')
-            all_conflicts.extend(events)
+    # 3. Fetch the conflicting events' details, all in one batched HTTP request
+    events_by_cal = {}
+    errors = []
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            events_by_cal[request_id] = response.get("items", [])
+
+    if busy_ids:
+        batch = service.new_batch_http_request(callback=collect)
+        for cal_id in busy_ids:
+            batch.add(
+                service.events().list(
+                    calendarId=cal_id,
+                    timeMin=start_iso,
+                    timeMax=end_iso,
+                    singleEvents=True,
+                    orderBy="startTime"
+                ),
+                request_id=cal_id
+            )
+        batch.execute()
+        if errors:
+            raise errors[0]
+
+    all_conflicts = []
+    for cal_id in busy_ids:
+        events = events_by_cal.get(cal_id, [])
+        # Add calendar name to event details for clarity
+        for event in events:
+            event['calendarSummary'] = summaries[cal_id]
+        all_conflicts.extend(events)
 
     return {
         "conflict": len(all_conflicts) > 0,
@@ -77,6 +109,31 @@ def check_conflict(date: str, start_time: str, end_time: str, timezone: str = No
     }
 
 
+_WEEKEND = frozenset(("Saturday", "Sunday"))
+
+# Policy rules as (applies(duration_hours, attendee_count, start_hour, day_of_week),
+# message template), checked in order. Violations block; warnings don't.
+_POLICY_VIOLATIONS = (
+    # Attendee count - BLOCKING
+    (lambda duration, count, hour, day: count >= 20,
+     "Large meetings ({count} attendees) with 20+ people require executive approval before scheduling."),
+)
+_POLICY_WARNINGS = (
+    (lambda duration, count, hour, day: duration > 4,
+     "Meeting duration ({duration}hrs) exceeds 4 hour recommendation. Consider splitting into multiple sessions."),
+    # Business hours
+    (lambda duration, count, hour, day: not 9 <= hour < 17,
+     "Meeting starts at {hour}:00, outside typical business hours (9 AM - 5 PM). Consider attendee timezones."),
+    (lambda duration, count, hour, day: day in _WEEKEND,
+     "Meeting scheduled on {day}. Ensure all attendees are aware and willing to attend weekend meetings."),
+    # Very early or very late
+    (lambda duration, count, hour, day: hour < 7,
+     "Meeting starts at {hour}:00 - very early morning. Consider timezones."),
+    (lambda duration, count, hour, day: hour >= 20,
+     "Meeting starts at {hour}:00 - late evening. Consider timezones."),
+)
+
+
 def check_policies(
     duration_hours: float,
     attendee_count: int,
@@ -99,30 +156,17 @@ def check_policies(
             "warnings": [...]
         }
     """
+    args = (duration_hours, attendee_count, start_hour, day_of_week)
     violations = []
     warnings = []
-    
-    # Check duration
-    if duration_hours > 4:
-        warnings.append(f"Meeting duration ({duration_hours}hrs) exceeds 4 hour recommendation. Consider splitting into multiple sessions.")
-    
-    # Check attendee count - BLOCKING
-    if attendee_count >= 20:
-        violations.append(f"Large meetings ({attendee_count} attendees) with 20+ people require executive approval before scheduling.")
-    
-    # Check business hours
-    if start_hour < 9 or start_hour >= 17:
-        warnings.append(f"Meeting starts at {start_hour}:00, outside typical business hours (9 AM - 5 PM). Consider attendee timezones.")
-    
-    # Check weekend
-    if day_of_week in ["Saturday", "Sunday"]:
-        warnings.append(f"Meeting scheduled on {day_of_week}. Ensure all attendees are aware and willing to attend weekend meetings.")
-    
-    # Very early or very late
-    if start_hour < 7:
-        warnings.append(f"Meeting starts at {start_hour}:00 - very early morning. Consider timezones.")
-    elif start_hour >= 20:
-        warnings.append(f"Meeting starts at {start_hour}:00 - late evening. Consider timezones.")
+
+    for rules, messages in ((_POLICY_VIOLATIONS, violations), (_POLICY_WARNINGS, warnings)):
+        for applies, template in rules:
+            # Messages are only formatted for rules that fire
+            if applies(*args):
+                messages.append(template.format(
+                    duration=duration_hours, count=attendee_count, hour=start_hour, day=day_of_week
+                ))
     
     return {
         "allowed": len(violations) == 0,
@@ -148,7 +192,7 @@ async def validate_event_comprehensive(
     - Timezone violations
     - Policy compliance
     
-    All validations run in parallel for optimal performance.
+    Attendee availability is checked in parallel across attendees.
     
     Args:
         title: Event title
@@ -165,7 +209,7 @@ async def validate_event_comprehensive(
             "valid": bool,  # True if no blocking issues
             "blocking_issues": [list of critical errors that prevent creation],
             "warnings": [list of non-blocking concerns],
-            "validations": {dimension: ValidationResult},
+            "validations": [ValidationResult indexed by ValidationDimension],
             "execution_time": float
         }
     """
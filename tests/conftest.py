@@ -5,10 +5,64 @@ Pytest configuration and shared fixtures for tests
 import pytest
 import sys
 import os
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
 
 # Add parent directory to Python path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """Drop memoized user/team/holiday/calendar/availability lookups so each test sees its own data."""
+    from scheduler_agent.tools.search import clear_user_caches
+    from scheduler_agent.tools.holidays import _country_holidays, clear_holiday_cache
+    from scheduler_agent.tools.events import clear_calendar_cache
+    from scheduler_agent.tools.availability import clear_availability_cache
+
+    def clear():
+        clear_user_caches()
+        clear_holiday_cache()
+        _country_holidays.cache_clear()
+        clear_calendar_cache()
+        clear_availability_cache()
+
+    clear()
+    yield
+    clear()
+
+def _make_service(calendar_items=(), events_by_calendar=None):
+    """A mock Calendar service with a calendar list and per-calendar event lists."""
+    service = MagicMock()
+    service.calendarList.return_value.list.return_value.execute.return_value = {
+        'items': list(calendar_items)
+    }
+    events_by_calendar = events_by_calendar or {}
+
+    def list_events(calendarId, **kwargs):
+        request = MagicMock()
+        request.execute.return_value = {'items': events_by_calendar.get(calendarId, [])}
+        return request
+
+    service.events.return_value.list.side_effect = list_events
+    return service
+
+@pytest.fixture
+def make_service():
+    """Factory for mock Calendar services: make_service(calendar_items, events_by_calendar)."""
+    return _make_service
+
+@pytest.fixture(scope="session")
+def tomorrow_str():
+    """Tomorrow as YYYY-MM-DD, fixed for the whole run"""
+    return (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+
+@pytest.fixture(scope="session")
+def next_saturday_str():
+    """The next Saturday after today as YYYY-MM-DD"""
+    today = datetime.now()
+    days_until_saturday = (5 - today.weekday()) % 7 or 7
+    return (today + timedelta(days=days_until_saturday)).strftime("%Y-%m-%d")
+
 @pytest.fixture
 def test_date_str():
     """Return test date string (Next Tuesday Dec 2nd 2025)"""
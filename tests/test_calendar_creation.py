@@ -1,33 +1,40 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
-from scheduler_agent.tools import create_event, get_calendar_id
+from scheduler_agent.tools import create_event, get_calendar_id, events
 
 @pytest.fixture
-def mock_service():
-    with patch('scheduler_agent.tools.events.get_calendar_service') as mock:
-        yield mock
+def mock_service(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(events, "get_calendar_service", mock)
+    return mock
 
-def test_get_calendar_id(mock_service):
-    service = mock_service.return_value
-    service.calendarList().list.return_value.execute.return_value = {
-        'items': [
-            {'id': 'primary', 'summary': 'Primary'},
-            {'id': 'team_ella_id', 'summary': 'TeamElla'}
-        ]
-    }
+def _stub_service(calendar_items):
+    """Plain stand-in for a service whose calls aren't asserted on."""
+    request = SimpleNamespace(execute=lambda: {'items': calendar_items})
+    return SimpleNamespace(calendarList=lambda: SimpleNamespace(list=lambda **kwargs: request))
+
+def test_get_calendar_id():
+    service = _stub_service([
+        {'id': 'primary', 'summary': 'Primary'},
+        {'id': 'team_ella_id', 'summary': 'TeamElla'}
+    ])
     
     assert get_calendar_id(service, 'TeamElla') == 'team_ella_id'
     assert get_calendar_id(service, 'teamella') == 'team_ella_id' # Case insensitive
     assert get_calendar_id(service, 'NonExistent') == 'primary'
     assert get_calendar_id(service, '') == 'primary'
 
-def test_create_event_on_specific_calendar(mock_service):
-    service = mock_service.return_value
-    
+def test_get_calendar_id_reuses_calendar_list(make_service):
+    service = make_service([{'id': 'team_ella_id', 'summary': 'TeamElla'}])
+
+    assert get_calendar_id(service, 'TeamElla') == 'team_ella_id'
+    assert get_calendar_id(service, 'TeamElla') == 'team_ella_id'
+    service.calendarList().list.assert_called_once()
+
+def test_create_event_on_specific_calendar(mock_service, make_service):
     # Mock get_calendar_id behavior by mocking calendarList
-    service.calendarList().list.return_value.execute.return_value = {
-        'items': [{'id': 'team_ella_id', 'summary': 'TeamElla'}]
-    }
+    service = mock_service.return_value = make_service([{'id': 'team_ella_id', 'summary': 'TeamElla'}])
     
     # Mock insert
     service.events().insert.return_value.execute.return_value = {
@@ -48,9 +55,8 @@ def test_create_event_on_specific_calendar(mock_service):
     assert call_args['calendarId'] == 'team_ella_id'
     assert result['calendar_id'] == 'team_ella_id'
 
-def test_create_event_default_primary(mock_service):
-    service = mock_service.return_value
-    service.calendarList().list.return_value.execute.return_value = {'items': []}
+def test_create_event_default_primary(mock_service, make_service):
+    service = mock_service.return_value = make_service()
     service.events().insert.return_value.execute.return_value = {'id': 'ev1'}
 
     result = create_event("Meeting", "2025-12-01", "10:00", "11:00")
@@ -58,3 +64,17 @@ def test_create_event_default_primary(mock_service):
     call_args = service.events().insert.call_args[1]
     assert call_args['calendarId'] == 'primary'
     assert result['calendar_id'] == 'primary'
+
+def test_create_event_filters_organizer_with_one_lookup(mock_service):
+    service = mock_service.return_value
+    service.calendars().get.return_value.execute.return_value = {'id': 'Me@example.com'}
+    service.calendars().get.reset_mock()
+    service.events().insert.return_value.execute.return_value = {'id': 'ev1', 'htmlLink': 'http://link'}
+
+    for _ in range(2):
+        result = create_event("Meeting", "2099-12-01", "10:00", "11:00", "me@example.com, a@example.com , ,b@example.com")
+
+    body = service.events().insert.call_args[1]['body']
+    assert body['attendees'] == [{'email': 'a@example.com'}, {'email': 'b@example.com'}]
+    assert result['event_link'] == 'http://link'
+    service.calendars().get.assert_called_once()
@@ -1,44 +1,49 @@
 import pytest
+from datetime import date, time
 from unittest.mock import MagicMock, patch
-from scheduler_agent.tools import check_conflict
+from scheduler_agent.tools import check_attendees_availability, check_conflict, validation
+from scheduler_agent.datetime_utils import parse_date, parse_time
+from scheduler_agent.tools._parsing import parse_slot, split_attendees, split_csv
 
 @pytest.fixture
-def mock_service():
-    with patch('scheduler_agent.tools.validation.get_calendar_service') as mock:
-        yield mock
+def mock_service(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr(validation, "get_calendar_service", mock)
+    return mock
 
-def test_check_conflict_multi_calendar(mock_service):
-    # Setup mock service
-    service = mock_service.return_value
-    
-    # Mock calendar list
-    service.calendarList().list.return_value.execute.return_value = {
-        'items': [
+class FakeBatch:
+    """Runs batched requests one by one, like BatchHttpRequest.execute()."""
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+def test_check_conflict_multi_calendar(mock_service, make_service):
+    # Calendar list, and events for the Work calendar only
+    service = mock_service.return_value = make_service(
+        [
             {'id': 'primary', 'summary': 'Primary', 'selected': True},
             {'id': 'work', 'summary': 'Work', 'selected': True},
             {'id': 'hidden', 'summary': 'Hidden', 'selected': False}
-        ]
-    }
-    
-    # Mock events list
-    # Primary has no events
-    # Work has 1 event
-    # Hidden should not be called
-    
-    def events_list_side_effect(calendarId, **kwargs):
-        mock_list = MagicMock()
-        if calendarId == 'primary':
-            mock_list.execute.return_value = {'items': []}
-        elif calendarId == 'work':
-            mock_list.execute.return_value = {
-                'items': [{'summary': 'Work Meeting', 'start': {}, 'end': {}}]
-            }
-        elif calendarId == 'hidden':
-             # Should not happen if logic is correct
-             mock_list.execute.return_value = {'items': [{'summary': 'Hidden Event'}]}
-        return mock_list
+        ],
+        {'work': [{'summary': 'Work Meeting', 'start': {}, 'end': {}}]}
+    )
+    service.new_batch_http_request.side_effect = FakeBatch
 
-    service.events().list.side_effect = events_list_side_effect
+    # FreeBusy: only Work has something in the slot
+    service.freebusy().query.return_value.execute.return_value = {
+        'calendars': {
+            'primary': {'busy': []},
+            'work': {'busy': [{'start': '2025-12-02T10:00:00Z', 'end': '2025-12-02T10:30:00Z'}]}
+        }
+    }
 
     # Run check_conflict
     result = check_conflict("2025-12-02", "10:00", "11:00")
@@ -52,22 +57,146 @@ def test_check_conflict_multi_calendar(mock_service):
     # Verify service calls
     # Should list calendars
     service.calendarList().list.assert_called_once()
+
+    # One FreeBusy query for the visible calendars
+    body = service.freebusy().query.call_args.kwargs['body']
+    assert body['items'] == [{'id': 'primary'}, {'id': 'work'}]
     
-    # Should list events for primary and work, but not hidden
+    # Should list events only for the busy calendar
     calls = service.events().list.call_args_list
     cal_ids = [c.kwargs['calendarId'] for c in calls]
-    assert 'primary' in cal_ids
-    assert 'work' in cal_ids
-    assert 'hidden' not in cal_ids
-
-def test_check_conflict_no_conflict(mock_service):
-    service = mock_service.return_value
-    service.calendarList().list.return_value.execute.return_value = {
-        'items': [{'id': 'primary', 'selected': True}]
+    assert cal_ids == ['work']
+
+def test_check_conflict_no_conflict(mock_service, make_service):
+    service = mock_service.return_value = make_service([{'id': 'primary', 'selected': True}])
+    service.freebusy().query.return_value.execute.return_value = {
+        'calendars': {'primary': {'busy': []}}
     }
-    service.events().list.return_value.execute.return_value = {'items': []}
     
     result = check_conflict("2025-12-02", "10:00", "11:00")
     
     assert result['conflict'] is False
     assert len(result['events']) == 0
+    service.new_batch_http_request.assert_not_called()
+
+def test_check_attendees_availability_working_time():
+    with patch('scheduler_agent.tools.availability.get_calendar_service') as get_service, \
+         patch('scheduler_agent.tools.availability.is_working_time') as working_time:
+        service = get_service.return_value
+        service.freebusy().query.return_value.execute.return_value = {
+            'calendars': {
+                'busy@example.com': {'busy': [{'start': 's', 'end': 'e'}]},
+                'away@example.com': {'busy': []},
+                'free@example.com': {'busy': []},
+            }
+        }
+        working_time.side_effect = lambda date, start, end, email, holidays: (
+            {"is_working": False, "reason": "User is on Vacation"}
+            if email == 'away@example.com' else {"is_working": True, "reason": ""}
+        )
+
+        result = check_attendees_availability(
+            "busy@example.com, away@example.com, free@example.com", "2025-12-02", "10:00", "11:00", "UTC"
+        )
+
+    assert result['all_free'] is False
+    assert list(result['busy_attendees']) == ['busy@example.com', 'away@example.com']
+    assert result['busy_attendees']['away@example.com'][0]['details'] == "User is on Vacation"
+    assert result['free_attendees'] == ['free@example.com']
+    # Calendar-busy attendees skip the working-hours check
+    assert sorted(c.args[3] for c in working_time.call_args_list) == ['away@example.com', 'free@example.com']
+
+def test_check_attendees_availability_reuses_recent_result():
+    with patch('scheduler_agent.tools.availability.get_calendar_service') as get_service, \
+         patch('scheduler_agent.tools.availability.is_working_time') as working_time:
+        service = get_service.return_value
+        service.freebusy().query.return_value.execute.return_value = {'calendars': {}}
+        service.freebusy().query.reset_mock()
+        working_time.return_value = {"is_working": True, "reason": ""}
+
+        first = check_attendees_availability("a@example.com, b@example.com", "2025-12-02", "10:00", "11:00", "UTC")
+        second = check_attendees_availability("b@example.com, a@example.com", "2025-12-02", "10:00", "11:00", "UTC")
+
+    assert second == first
+    service.freebusy().query.assert_called_once()
+
+def test_check_attendees_availability_cached_result_not_shared():
+    with patch('scheduler_agent.tools.availability.get_calendar_service') as get_service, \
+         patch('scheduler_agent.tools.availability.is_working_time') as working_time:
+        service = get_service.return_value
+        service.freebusy().query.return_value.execute.return_value = {
+            'calendars': {'busy@example.com': {'busy': [{'start': 's', 'end': 'e'}]}}
+        }
+        working_time.return_value = {"is_working": True, "reason": ""}
+
+        first = check_attendees_availability("busy@example.com, free@example.com", "2025-12-02", "10:00", "11:00", "UTC")
+        first['free_attendees'].append('extra@example.com')
+        first['busy_attendees']['busy@example.com'].append({'start': 'x', 'end': 'y'})
+        second = check_attendees_availability("busy@example.com, free@example.com", "2025-12-02", "10:00", "11:00", "UTC")
+        second['busy_attendees'].clear()
+        third = check_attendees_availability("busy@example.com, free@example.com", "2025-12-02", "10:00", "11:00", "UTC")
+
+    service.freebusy().query.assert_called_once()
+    assert third['free_attendees'] == ['free@example.com']
+    assert third['busy_attendees'] == {'busy@example.com': [{'start': 's', 'end': 'e'}]}
+
+def test_check_attendees_availability_after_booking(tomorrow_str):
+    from scheduler_agent.tools import events
+
+    with patch('scheduler_agent.tools.availability.get_calendar_service') as get_service, \
+         patch('scheduler_agent.tools.availability.is_working_time') as working_time, \
+         patch.object(events, 'get_calendar_service', get_service):
+        service = get_service.return_value
+        service.calendars().get().execute.return_value = {'id': 'me@example.com'}
+        service.freebusy().query.return_value.execute.side_effect = [
+            {'calendars': {'a@example.com': {'busy': []}}},
+            {'calendars': {'a@example.com': {'busy': [{'start': 's', 'end': 'e'}]}}},
+        ]
+        working_time.return_value = {"is_working": True, "reason": ""}
+
+        before = check_attendees_availability("a@example.com", tomorrow_str, "10:00", "11:00", "UTC")
+        events.create_event("Sync", tomorrow_str, "10:00", "11:00", "a@example.com")
+        after = check_attendees_availability("a@example.com", tomorrow_str, "10:00", "11:00", "UTC")
+
+    assert before['all_free'] is True
+    assert list(after['busy_attendees']) == ['a@example.com']
+
+def test_split_csv():
+    assert split_csv(" a@example.com ,b@example.com,, c@example.com ") == [
+        "a@example.com", "b@example.com", "c@example.com"
+    ]
+    # Repeats keep their first position
+    assert split_csv("b@example.com, a@example.com,b@example.com") == ["b@example.com", "a@example.com"]
+    assert split_csv("") == []
+    assert split_csv(" , ") == []
+
+def test_split_attendees():
+    assert split_attendees("a@example.com; b@example.com,c@example.com  d@example.com,") == [
+        "a@example.com", "b@example.com", "c@example.com", "d@example.com"
+    ]
+    assert split_attendees("b@example.com, a@example.com;b@example.com") == ["b@example.com", "a@example.com"]
+    assert split_attendees("") == []
+    assert split_attendees(" ;, ") == []
+
+def test_parse_slot():
+    assert parse_slot("2025-12-02", "10:00", "11:30") == (
+        date(2025, 12, 2), time(10, 0), time(11, 30), date(2025, 12, 2)
+    )
+    # A duration past midnight rolls the end over to the next day
+    assert parse_slot("2025-12-02", "23:00", "2hr") == (
+        date(2025, 12, 2), time(23, 0), time(1, 0), date(2025, 12, 3)
+    )
+    with pytest.raises(ValueError):
+        parse_slot("2025-12-02", "1hr", "11:00")
+
+def test_parse_date_and_time_cached():
+    parse_date.cache_clear()
+    parse_time.cache_clear()
+    for _ in range(3):
+        parse_slot("02-12-2025", "10:00", "1hr")
+    assert parse_date.cache_info().misses == 1
+    assert parse_time.cache_info().misses == 2
+    # Bad input still raises every time rather than being cached
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            parse_time("soon")
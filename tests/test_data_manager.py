@@ -1,13 +1,17 @@
 import pytest
 import json
 import os
-import pandas as pd
+from unittest.mock import patch
 from scheduler_agent.data_manager import DataManager
+from scheduler_agent.tools import facilities
 
-@pytest.fixture
-def temp_data_files(tmp_path):
-    users_file = tmp_path / "users.json"
-    facilities_file = tmp_path / "facilities.json"
+# The data is never modified by these tests, so it is written and loaded
+# once per session.
+@pytest.fixture(scope="session")
+def temp_data_files(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("dm")
+    users_file = data_dir / "users.json"
+    facilities_file = data_dir / "facilities.json"
     
     users_data = {
         "users": [
@@ -31,18 +35,15 @@ def temp_data_files(tmp_path):
         
     return str(users_file), str(facilities_file)
 
-def test_load_data(temp_data_files):
-    users_file, facilities_file = temp_data_files
-    dm = DataManager(users_file, facilities_file)
-    assert not dm.users_df.empty
-    assert not dm.facilities_df.empty
-    assert len(dm.users_df) == 3
-    assert len(dm.facilities_df) == 3
+@pytest.fixture(scope="session")
+def dm(temp_data_files):
+    return DataManager(*temp_data_files)
 
-def test_get_team_members(temp_data_files):
-    users_file, facilities_file = temp_data_files
-    dm = DataManager(users_file, facilities_file)
-    
+def test_load_data(dm):
+    assert len(dm.users) == 3
+    assert len(dm.facilities) == 3
+
+def test_get_team_members(dm):
     team_a = dm.get_team_members("TeamA")
     assert len(team_a) == 2
     assert "a@example.com" in team_a
@@ -56,10 +57,7 @@ def test_get_team_members(temp_data_files):
     team_c = dm.get_team_members("TeamC")
     assert len(team_c) == 0
 
-def test_find_facility(temp_data_files):
-    users_file, facilities_file = temp_data_files
-    dm = DataManager(users_file, facilities_file)
-    
+def test_find_facility(dm):
     # Capacity check
     large_rooms = dm.find_facility(capacity=6)
     assert len(large_rooms) == 1
@@ -77,13 +75,25 @@ def test_find_facility(temp_data_files):
     assert len(small_whiteboard) == 1
     assert small_whiteboard[0]['name'] == "Room 1"
 
-def test_get_facility_info(temp_data_files):
-    users_file, facilities_file = temp_data_files
-    dm = DataManager(users_file, facilities_file)
-    
+def test_get_facility_info(dm):
     info = dm.get_facility_info("Room 1")
     assert info is not None
     assert info['capacity'] == 5
     
     info = dm.get_facility_info("NonExistent")
     assert info is None
+
+def test_facility_tools_return_json(dm):
+    with patch('scheduler_agent.tools.facilities.get_data_manager', return_value=dm):
+        rooms = json.loads(facilities.find_facility(capacity=4, amenities="Whiteboard"))
+        assert rooms == [{"name": "Room 1", "capacity": 5, "amenities": ["Projector", "Whiteboard"]}]
+        assert facilities.find_facility(capacity=100) == "No matching facilities found."
+
+        assert json.loads(facilities.get_facility_info("room 2"))["capacity"] == 10
+        assert facilities.get_facility_info("NonExistent") == "Facility not found."
+
+def test_facility_json_same_with_or_without_orjson():
+    room = {"name": "Salle Genève", "capacity": 5, "amenities": ["Projector", "Whiteboard"]}
+    expected = '{"name":"Salle Genève","capacity":5,"amenities":["Projector","Whiteboard"]}'
+    assert facilities._dumps(room) == expected
+    assert facilities._json_dumps(room) == expected
@@ -1,39 +1,43 @@
 import pytest
 from scheduler_agent.email_utils import validate_emails
 
-def test_validate_emails_valid():
-    emails = ["test@gmail.com", "user@yahoo.com"]
-    result = validate_emails(emails)
-    assert len(result["valid"]) == 2
-    assert "test@gmail.com" in result["valid"]
-    assert "user@yahoo.com" in result["valid"]
-    assert len(result["invalid"]) == 0
-    assert len(result["typo_suggestions"]) == 0
-
-def test_validate_emails_typo():
-    emails = ["test@gmai.com"]
-    result = validate_emails(emails)
-    assert len(result["valid"]) == 0
-    assert len(result["typo_suggestions"]) == 1
-    assert result["typo_suggestions"][0]["original"] == "test@gmai.com"
-    assert result["typo_suggestions"][0]["suggestion"] == "test@gmail.com"
-
-def test_validate_emails_disposable():
-    emails = ["test@mailinator.com"]
-    result = validate_emails(emails)
-    assert len(result["valid"]) == 0
-    assert len(result["invalid"]) == 1
-    assert result["invalid"][0]["email"] == "test@mailinator.com"
-    assert "Disposable" in result["invalid"][0]["reason"]
-
-def test_validate_emails_mixed():
-    emails = ["valid@gmail.com", "typo@yaho.com", "junk@mailinator.com"]
-    result = validate_emails(emails)
-    
-    assert "valid@gmail.com" in result["valid"]
-    
-    typos = [t["original"] for t in result["typo_suggestions"]]
-    assert "typo@yaho.com" in typos
-    
-    invalids = [i["email"] for i in result["invalid"]]
-    assert "junk@mailinator.com" in invalids
+# Every case is validated in one call; each test checks its own addresses.
+EMAILS = [
+    "test@gmail.com", "user@yahoo.com",   # valid
+    "test@gmai.com", "typo@yaho.com",     # typos
+    "test@mailinator.com", "junk@mailinator.com",  # disposable
+    "valid@gmail.com",
+]
+
+@pytest.fixture(scope="module")
+def validated():
+    return validate_emails(EMAILS)
+
+def _invalid(result):
+    return {i["email"]: i["reason"] for i in result["invalid"]}
+
+def _typos(result):
+    return {t["original"]: t["suggestion"] for t in result["typo_suggestions"]}
+
+def test_validate_emails_valid(validated):
+    for email in ("test@gmail.com", "user@yahoo.com"):
+        assert email in validated["valid"]
+        assert email not in _invalid(validated)
+        assert email not in _typos(validated)
+
+def test_validate_emails_typo(validated):
+    assert "test@gmai.com" not in validated["valid"]
+    assert _typos(validated)["test@gmai.com"] == "test@gmail.com"
+
+def test_validate_emails_disposable(validated):
+    assert "test@mailinator.com" not in validated["valid"]
+    assert "Disposable" in _invalid(validated)["test@mailinator.com"]
+
+def test_validate_emails_mixed(validated):
+    assert "valid@gmail.com" in validated["valid"]
+    assert "typo@yaho.com" in _typos(validated)
+    assert "junk@mailinator.com" in _invalid(validated)
+
+def test_validate_emails_buckets_are_disjoint(validated):
+    # Each address lands in exactly one bucket
+    assert len(validated["valid"]) + len(validated["invalid"]) + len(validated["typo_suggestions"]) == len(EMAILS)
@@ -1,19 +1,22 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from datetime import datetime
-from scheduler_agent.tools.holidays import is_holiday, is_working_time
+from datetime import date, datetime
+from scheduler_agent.tools import holidays
+from scheduler_agent.tools.holidays import HOLIDAY_CACHE_TTL_SECONDS, is_holiday, is_working_time
 
 # Mock GoogleSearchTool
 @pytest.fixture
-def mock_search_tool():
-    with patch('scheduler_agent.tools.holidays._search_tool') as mock_tool:
-        yield mock_tool
+def mock_search_tool(monkeypatch):
+    mock_tool = MagicMock()
+    monkeypatch.setattr(holidays, "_search_tool", mock_tool)
+    return mock_tool
 
 # Mock get_user_details
 @pytest.fixture
-def mock_get_user_details():
-    with patch('scheduler_agent.tools.holidays.get_user_details') as mock_details:
-        yield mock_details
+def mock_get_user_details(monkeypatch):
+    mock_details = MagicMock()
+    monkeypatch.setattr(holidays, "get_user_details", mock_details)
+    return mock_details
 
 def test_is_holiday_true(mock_search_tool):
     # Setup mock to return a result indicating a holiday
@@ -27,109 +30,108 @@ def test_is_holiday_false(mock_search_tool):
     
     assert is_holiday("2025-12-28", "UK") is False
 
+@patch('scheduler_agent.tools.holidays._holidays_lib', None)
+def test_is_holiday_cached_per_country_and_date(mock_search_tool):
+    mock_search_tool.search.return_value = "Christmas Day is a public holiday in UK."
+
+    # Both date formats normalize to the same key
+    assert is_holiday("2025-12-25", "UK") is True
+    assert is_holiday("25-12-2025", "UK") is True
+    assert mock_search_tool.search.call_count == 1
+
+@patch('scheduler_agent.tools.holidays._holidays_lib', None)
+def test_is_holiday_search_failure_not_cached(mock_search_tool):
+    mock_search_tool.search.side_effect = [
+        RuntimeError("quota exceeded"),
+        "Christmas Day is a public holiday in UK.",
+    ]
+
+    assert is_holiday("2025-12-25", "UK") is False
+    assert is_holiday("2025-12-25", "UK") is True
+    assert mock_search_tool.search.call_count == 2
+
+@patch('scheduler_agent.tools.holidays._holidays_lib', None)
+def test_is_holiday_search_answer_expires(mock_search_tool):
+    mock_search_tool.search.return_value = "Christmas Day is a public holiday in UK."
+    day = HOLIDAY_CACHE_TTL_SECONDS
+
+    # Kept for a full TTL from the fetch, even across a multiple of the TTL
+    with patch('scheduler_agent.tools.holidays.monotonic', return_value=day - 1):
+        assert is_holiday("2025-12-25", "UK") is True
+    with patch('scheduler_agent.tools.holidays.monotonic', return_value=2 * day - 10):
+        assert is_holiday("2025-12-25", "UK") is True
+    assert mock_search_tool.search.call_count == 1
+
+    mock_search_tool.search.return_value = "December 25th is not a public holiday in UK."
+    with patch('scheduler_agent.tools.holidays.monotonic', return_value=2 * day):
+        assert is_holiday("2025-12-25", "UK") is False
+    assert mock_search_tool.search.call_count == 2
+
+def test_is_holiday_from_holidays_package(mock_search_tool):
+    with patch('scheduler_agent.tools.holidays._holidays_lib') as lib:
+        lib.country_holidays.return_value = {date(2026, 1, 26): "Republic Day"}
+
+        assert is_holiday("2026-01-26", "India") is True
+        assert is_holiday("27-01-2026", "India") is False
+
+    # One lookup for the whole year, by ISO code; no web searches
+    lib.country_holidays.assert_called_once_with("IN", years=2026)
+    mock_search_tool.search.assert_not_called()
+
 def test_is_holiday_no_country():
     assert is_holiday("2025-12-25", "") is False
 
-def test_is_working_time_normal(mock_get_user_details):
-    # User works Mon-Fri, 9-5
-    mock_get_user_details.return_value = {
-        "email": "test@example.com",
-        "country": "UK",
-        "preferences": {
-            "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            "working_hours": {"start": "09:00", "end": "17:00"},
-            "work_on_holidays": False
-        }
-    }
-    
-    # Test a Tuesday at 10am (2025-12-02 is a Tuesday)
-    result = is_working_time("2025-12-02", "10:00", "11:00", "test@example.com")
-    assert result["is_working"] is True
-
-def test_is_working_time_weekend(mock_get_user_details):
-    mock_get_user_details.return_value = {
-        "email": "test@example.com",
-        "country": "UK",
-        "preferences": {
-            "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            "working_hours": {"start": "09:00", "end": "17:00"},
-            "work_on_holidays": False
-        }
-    }
-    
-    # Test a Saturday (2025-12-06)
-    result = is_working_time("2025-12-06", "10:00", "11:00", "test@example.com")
-    assert result["is_working"] is False
-    assert "Non-working day" in result["reason"]
-
-def test_is_working_time_outside_hours(mock_get_user_details):
-    mock_get_user_details.return_value = {
-        "email": "test@example.com",
-        "country": "UK",
-        "preferences": {
-            "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            "working_hours": {"start": "09:00", "end": "17:00"},
-            "work_on_holidays": False
-        }
+# User working Mon-Fri, 9-5, in the UK, not on holidays. Shared by
+# reference; tests build variants instead of mutating it.
+_BASE_USER = {
+    "email": "test@example.com",
+    "country": "UK",
+    "preferences": {
+        "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
+        "working_hours": {"start": "09:00", "end": "17:00"},
+        "work_on_holidays": False
     }
-    
-    # Test Tuesday at 8pm
-    result = is_working_time("2025-12-02", "20:00", "21:00", "test@example.com")
-    assert result["is_working"] is False
-    assert "Outside working hours" in result["reason"]
+}
 
-@patch('scheduler_agent.tools.holidays.is_holiday')
-def test_is_working_time_holiday(mock_is_holiday, mock_get_user_details):
-    mock_get_user_details.return_value = {
-        "email": "test@example.com",
-        "country": "UK",
-        "preferences": {
-            "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            "working_hours": {"start": "09:00", "end": "17:00"},
-            "work_on_holidays": False
-        }
-    }
-    
-    # Mock is_holiday to return True
-    mock_is_holiday.return_value = True
-    
-    # Test a working day that is a holiday
-    result = is_working_time("2025-12-25", "10:00", "11:00", "test@example.com")
-    assert result["is_working"] is False
-    assert "Public Holiday" in result["reason"]
+# (date, start, end, preference overrides, is_holiday result,
+#  expected is_working, phrase expected in the reason)
+WORKING_TIME_CASES = [
+    # 2025-12-02 is a Tuesday
+    pytest.param("2025-12-02", "10:00", "11:00", {}, False, True, None, id="normal"),
+    pytest.param("2025-12-06", "10:00", "11:00", {}, False, False, "Non-working day", id="weekend"),
+    pytest.param("2025-12-02", "20:00", "21:00", {}, False, False, "Outside working hours", id="outside_hours"),
+    pytest.param("2025-12-25", "10:00", "11:00", {}, True, False, "Public Holiday", id="holiday"),
+    pytest.param("2025-12-25", "10:00", "11:00", {"work_on_holidays": True}, True, True, None,
+                 id="work_on_holiday"),
+    pytest.param("2025-12-20", "10:00", "11:00", {"vacation_dates": ["2025-12-20", "2025-12-21"]},
+                 False, False, "Vacation", id="vacation"),
+]
+
+@pytest.mark.parametrize("date_str,start,end,overrides,holiday,is_working,reason", WORKING_TIME_CASES)
+def test_is_working_time(mock_get_user_details, date_str, start, end, overrides, holiday,
+                         is_working, reason):
+    mock_get_user_details.return_value = (
+        {**_BASE_USER, "preferences": {**_BASE_USER["preferences"], **overrides}}
+        if overrides else _BASE_USER
+    )
+
+    with patch('scheduler_agent.tools.holidays.is_holiday', return_value=holiday):
+        result = is_working_time(date_str, start, end, "test@example.com")
+
+    assert result["is_working"] is is_working
+    if reason:
+        assert reason in result["reason"]
 
 @patch('scheduler_agent.tools.holidays.is_holiday')
-def test_is_working_time_work_on_holiday(mock_is_holiday, mock_get_user_details):
-    mock_get_user_details.return_value = {
-        "email": "test@example.com",
-        "country": "UK",
-        "preferences": {
-            "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            "working_hours": {"start": "09:00", "end": "17:00"},
-            "work_on_holidays": True  # User works on holidays
-        }
-    }
-    
-    # Mock is_holiday to return True
+def test_is_working_time_shares_holiday_lookups(mock_is_holiday, mock_get_user_details):
+    mock_get_user_details.return_value = _BASE_USER
     mock_is_holiday.return_value = True
-    
-    # Test a working day that is a holiday
-    result = is_working_time("2025-12-25", "10:00", "11:00", "test@example.com")
-    assert result["is_working"] is True
-
-def test_is_working_time_vacation(mock_get_user_details):
-    mock_get_user_details.return_value = {
-        "email": "test@example.com",
-        "country": "UK",
-        "preferences": {
-            "working_days": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"],
-            "working_hours": {"start": "09:00", "end": "17:00"},
-            "work_on_holidays": False,
-            "vacation_dates": ["2025-12-20", "2025-12-21"]
-        }
-    }
-    
-    # Test a vacation date
-    result = is_working_time("2025-12-20", "10:00", "11:00", "test@example.com")
-    assert result["is_working"] is False
-    assert "Vacation" in result["reason"]
+
+    # Several attendees from the same country on the same date
+    holidays = {}
+    for email in ("a@example.com", "b@example.com", "c@example.com"):
+        result = is_working_time("2025-12-25", "10:00", "11:00", email, holidays)
+        assert result["is_working"] is False
+
+    mock_is_holiday.assert_called_once_with("2025-12-25", "UK")
+    assert holidays == {"UK": True}
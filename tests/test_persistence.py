@@ -2,11 +2,18 @@ import pytest
 import sqlite3
 import json
 import asyncio
+from contextlib import closing
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Any
 
-from scheduler_agent.session_memory import SQLiteMemoryService
+from scheduler_agent import session_memory
+from scheduler_agent.session_memory import (
+    SQLiteMemoryService,
+    SessionMemoryConfig,
+    SessionMemoryManager,
+    _index_terms,
+)
 
 # Mock classes for Session and Event
 @dataclass
@@ -30,6 +37,32 @@ class MockSession:
     app_name: str = "test_app"
     user_id: str = "test_user"
 
+class FakeSessionService:
+    """In-memory stand-in for DatabaseSessionService that counts calls."""
+
+    def __init__(self):
+        self.sessions = {}
+        self.calls = []
+
+    async def get_session(self, app_name, user_id, session_id):
+        self.calls.append("get")
+        return self.sessions.get(session_id)
+
+    async def create_session(self, app_name, user_id, session_id):
+        self.calls.append("create")
+        session = MockSession(id=session_id, events=[], app_name=app_name, user_id=user_id)
+        self.sessions[session_id] = session
+        return session
+
+    async def delete_session(self, app_name, user_id, session_id):
+        self.calls.append("delete")
+        self.sessions.pop(session_id, None)
+
+def read_db(db_path, sql):
+    """Run one query on a short-lived read-only connection and return all rows."""
+    with closing(sqlite3.connect(f"{Path(db_path).as_uri()}?mode=ro", uri=True)) as conn:
+        return conn.execute(sql).fetchall()
+
 @pytest.fixture
 def memory_db_path(tmp_path):
     """Fixture to provide a temporary database path."""
@@ -44,19 +77,16 @@ def memory_service(memory_db_path):
 async def test_init_db(memory_db_path):
     """Test that the database and tables are created upon initialization."""
     service = SQLiteMemoryService(db_path=memory_db_path)
+    assert not memory_db_path.exists()
     
+    await service.initialize()
     assert memory_db_path.exists()
     
-    with sqlite3.connect(memory_db_path) as conn:
-        cursor = conn.cursor()
-        
-        # Check memories table
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='memories'")
-        assert cursor.fetchone() is not None
-        
-        # Check FTS table
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='memories_fts'")
-        assert cursor.fetchone() is not None
+    # Check memories table
+    assert read_db(memory_db_path, "SELECT name FROM sqlite_master WHERE type='table' AND name='memories'")
+    
+    # Check FTS table
+    assert read_db(memory_db_path, "SELECT name FROM sqlite_master WHERE type='table' AND name='memories_fts'")
 
 @pytest.mark.asyncio
 async def test_add_session_to_memory(memory_service, memory_db_path):
@@ -71,24 +101,21 @@ async def test_add_session_to_memory(memory_service, memory_db_path):
     session = MockSession(id="session_123", events=events)
     
     await memory_service.add_session_to_memory(session)
+    await memory_service.flush()
     
     # Verify data in DB
-    with sqlite3.connect(memory_db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT content, metadata FROM memories")
-        row = cursor.fetchone()
-        
-        assert row is not None
-        content, metadata_json = row
-        
-        # Check content (should contain last 2 turns)
-        assert "My favorite color is blue" in content
-        assert "Noted, blue." in content
-        
-        # Check metadata
-        metadata = json.loads(metadata_json)
-        assert metadata["session_id"] == "session_123"
-        assert metadata["event_count"] == 4
+    rows = read_db(memory_db_path, "SELECT content, metadata FROM memories")
+    assert len(rows) == 1
+    content, metadata_json = rows[0]
+    
+    # Check content (should contain last 2 turns)
+    assert "My favorite color is blue" in content
+    assert "Noted, blue." in content
+    
+    # Check metadata
+    metadata = json.loads(metadata_json)
+    assert metadata["session_id"] == "session_123"
+    assert metadata["event_count"] == 4
 
 @pytest.mark.asyncio
 async def test_search_memory(memory_service):
@@ -124,14 +151,481 @@ async def test_search_memory(memory_service):
     assert len(memories) >= 1
     assert "sushi" in memories[0].text.lower()
 
+@pytest.mark.asyncio
+async def test_search_memory_matches_prefixes_and_operator_words(memory_service):
+    """Test that query words match by prefix and FTS keywords are searched literally."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="Meeting NEAR the lobby")]))])
+    await memory_service.add_session_to_memory(session)
+
+    result = await memory_service.search_memory("test_app", "test_user", "meet")
+    assert len(result.memories) == 1
+    assert "Meeting" in result.memories[0].text
+
+    result = await memory_service.search_memory("test_app", "test_user", "NEAR lobby")
+    assert len(result.memories) == 1
+
+@pytest.mark.asyncio
+async def test_add_session_buffers_until_threshold(memory_db_path):
+    """Test that rows are written together once the flush threshold is reached."""
+    service = SQLiteMemoryService(db_path=memory_db_path, flush_threshold=3)
+    await service.initialize()
+
+    def stored():
+        return read_db(memory_db_path, "SELECT count(*) FROM memories")[0][0]
+
+    for i in range(3):
+        session = MockSession(id=f"s{i}", events=[MockEvent(content=MockContent(parts=[MockPart(text=f"hi {i}")]))])
+        await service.add_session_to_memory(session)
+        assert stored() == (3 if i == 2 else 0)
+
+@pytest.mark.asyncio
+async def test_search_memory_ranked_by_relevance(memory_service):
+    """Test that the limit keeps the best bm25 matches, most relevant first."""
+    texts = ["lunch plans", "standup standup standup notes", "standup moved"]
+    for i, text in enumerate(texts):
+        session = MockSession(id=f"s{i}", events=[MockEvent(content=MockContent(parts=[MockPart(text=text)]))])
+        await memory_service.add_session_to_memory(session)
+
+    result = await memory_service.search_memory("test_app", "test_user", "standup", limit=1)
+
+    assert len(result.memories) == 1
+    assert "standup standup standup" in result.memories[0].text
+    assert result.memories[0].score < 0
+
+@pytest.mark.asyncio
+async def test_connection_reused_in_wal_mode(memory_service, memory_db_path):
+    """Test that one WAL-mode connection serves both writes and searches."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="I like tea")]))])
+    await memory_service.add_session_to_memory(session)
+    await memory_service.flush()
+    conn = memory_service._conn
+
+    await memory_service.search_memory("test_app", "test_user", "tea")
+
+    assert memory_service._conn is conn
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    memory_service.close()
+    assert memory_service._conn is None
+
+@pytest.mark.asyncio
+async def test_search_memory_scoped_to_user(memory_service):
+    """Test that searches only return memories for the requested app and user."""
+    mine = MockSession(id="mine", events=[MockEvent(content=MockContent(parts=[MockPart(text="budget review")]))])
+    theirs = MockSession(
+        id="theirs",
+        events=[MockEvent(content=MockContent(parts=[MockPart(text="budget review")]))],
+        user_id="someone_else",
+    )
+    await memory_service.add_sessions_to_memory([mine, theirs])
+
+    result = await memory_service.search_memory("test_app", "test_user", "budget")
+
+    assert [m.metadata["session_id"] for m in result.memories] == ["mine"]
+    assert result.memories[0].content.parts[0].text == result.memories[0].text
+
+@pytest.mark.asyncio
+async def test_search_memory_finds_legacy_rows(memory_service, memory_db_path):
+    """Test that rows stored before owners were recorded are still found."""
+    await memory_service.initialize()
+    with closing(sqlite3.connect(memory_db_path)) as conn, conn:
+        conn.create_function("fts_terms", 1, _index_terms)
+        conn.execute(
+            "INSERT INTO memories (app_name, user_id, session_id, content, metadata, content_hash) "
+            "VALUES ('calendar_agent', 'default', 'old', 'user: quarterly review', '{\"session_id\": \"old\"}', 'h1')"
+        )
+
+    result = await memory_service.search_memory("test_app", "test_user", "quarterly")
+
+    assert [m.metadata["session_id"] for m in result.memories] == ["old"]
+    assert "quarterly review" in result.memories[0].text
+
+@pytest.mark.asyncio
+async def test_search_memory_trivial_query_skips_database(memory_service):
+    """Test that queries with nothing searchable return without touching SQLite."""
+    for query in ("", "   ", "?!", "a"):
+        result = await memory_service.search_memory("test_app", "test_user", query)
+        assert list(result.memories) == []
+    assert memory_service._conn is None
+
+@pytest.mark.asyncio
+async def test_search_memory_cached_until_write(memory_service):
+    """Test that repeat searches are served from cache and writes invalidate it."""
+    first = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="quarterly planning")]))])
+    await memory_service.add_sessions_to_memory([first])
+
+    calls = []
+    original = memory_service._search_rows
+
+    def counting_search_rows(*args):
+        calls.append(args)
+        return original(*args)
+
+    memory_service._search_rows = counting_search_rows
+
+    await memory_service.search_memory("test_app", "test_user", "planning")
+    result = await memory_service.search_memory("test_app", "test_user", "Planning")
+    assert len(calls) == 1
+    assert len(result.memories) == 1
+
+    second = MockSession(id="s2", events=[MockEvent(content=MockContent(parts=[MockPart(text="planning offsite")]))])
+    await memory_service.add_sessions_to_memory([second])
+    result = await memory_service.search_memory("test_app", "test_user", "planning")
+    assert len(calls) == 2
+    assert len(result.memories) == 2
+
+@pytest.mark.asyncio
+async def test_fts_index_follows_deletes_and_updates(memory_service, memory_db_path):
+    """Test that the contentless FTS index stays in sync with the memories table."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="retro notes")]))])
+    await memory_service.add_sessions_to_memory([session])
+
+    def fts_hits(term):
+        with memory_service._conn_lock:
+            conn = memory_service._connection()
+            return conn.execute(
+                "SELECT count(*) FROM memories_fts WHERE memories_fts MATCH ?", (term,)
+            ).fetchone()[0]
+
+    with memory_service._conn_lock:
+        conn = memory_service._connection()
+        with conn:
+            conn.execute("UPDATE memories SET content = 'demo notes'")
+    assert fts_hits("retro") == 0
+    assert fts_hits("demo") == 1
+
+    with memory_service._conn_lock:
+        conn = memory_service._connection()
+        with conn:
+            conn.execute("DELETE FROM memories")
+    assert fts_hits("demo") == 0
+
+@pytest.mark.asyncio
+async def test_fts_index_skips_stopwords(memory_service):
+    """Test that stopwords are neither indexed nor required by queries."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="the launch is on Friday")]))])
+    await memory_service.add_sessions_to_memory([session])
+
+    with memory_service._conn_lock:
+        conn = memory_service._connection()
+        assert conn.execute("SELECT count(*) FROM memories_fts WHERE memories_fts MATCH 'the'").fetchone()[0] == 0
+
+    result = await memory_service.search_memory("test_app", "test_user", "When is the launch?")
+    assert len(result.memories) == 1
+
+    result = await memory_service.search_memory("test_app", "test_user", "is the")
+    assert result.memories == ()
+
+
+@pytest.mark.asyncio
+async def test_old_fts_index_is_rebuilt(memory_db_path):
+    """Test that an index with the old layout is rebuilt from existing memories."""
+    with sqlite3.connect(memory_db_path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE memories (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, app_name TEXT, user_id TEXT,
+                session_id TEXT, content TEXT, metadata TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.execute("CREATE VIRTUAL TABLE memories_fts USING fts5(content, content='memories', content_rowid='id')")
+        conn.execute(
+            "INSERT INTO memories (app_name, user_id, session_id, content, metadata) "
+            "VALUES ('test_app', 'test_user', 's1', 'user: offsite agenda', '{}')"
+        )
+
+    service = SQLiteMemoryService(db_path=memory_db_path)
+    await service.initialize()
+    result = await service.search_memory("test_app", "test_user", "offsite")
+    assert [memory.text for memory in result.memories] == ["user: offsite agenda"]
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_close_writes_pending_memories(memory_service, memory_db_path):
+    """Test that memories still buffered at close() are saved, not dropped."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="offsite agenda")]))])
+    await memory_service.add_session_to_memory(session)
+    memory_service.close()
+
+    reopened = SQLiteMemoryService(db_path=memory_db_path)
+    result = await reopened.search_memory("test_app", "test_user", "offsite")
+    reopened.close()
+
+    assert len(result.memories) == 1
+    assert read_db(memory_db_path, "SELECT session_id FROM memories") == [("s1",)]
+
+@pytest.mark.asyncio
+async def test_duplicate_memories_collapse(memory_service, memory_db_path):
+    """Test that saving the same last exchange twice stores one row."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="ship it")]))])
+    await memory_service.add_sessions_to_memory([session])
+    await memory_service.add_sessions_to_memory([session])
+
+    assert read_db(memory_db_path, "SELECT count(*) FROM memories") == [(1,)]
+    assert read_db(memory_db_path, "SELECT count(*) FROM memories_fts WHERE memories_fts MATCH 'ship'") == [(1,)]
+
+@pytest.mark.asyncio
+async def test_search_does_not_wait_for_writer(memory_service):
+    """Test that searches use read-only connections instead of the writer lock."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="hiring plan")]))])
+    await memory_service.add_sessions_to_memory([session])
+
+    with memory_service._conn_lock:
+        result = await asyncio.wait_for(
+            memory_service.search_memory("test_app", "test_user", "hiring"), timeout=5
+        )
+
+    assert len(result.memories) == 1
+    reader = memory_service._readers.get_nowait()
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("DELETE FROM memories")
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_share_one_query(memory_service, monkeypatch):
+    """Test that identical searches running at the same time hit the database once."""
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="budget review")]))])
+    await memory_service.add_sessions_to_memory([session])
+
+    calls = []
+    search_rows = memory_service._search_rows
+
+    def counting_search_rows(*args):
+        calls.append(args)
+        return search_rows(*args)
+
+    monkeypatch.setattr(memory_service, "_search_rows", counting_search_rows)
+    results = await asyncio.gather(
+        *(memory_service.search_memory("test_app", "test_user", "budget") for _ in range(5))
+    )
+
+    assert len(calls) == 1
+    assert all(len(result.memories) == 1 for result in results)
+    assert memory_service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_flush_retries_locked_writes(memory_service, monkeypatch):
+    """Test that locked writes are retried and kept buffered when retries run out."""
+    monkeypatch.setattr(session_memory.random, "uniform", lambda a, b: 0)
+    calls = []
+    insert = memory_service._insert_memories
+
+    def flaky_insert(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        insert(rows)
+
+    monkeypatch.setattr(memory_service, "_insert_memories", flaky_insert)
+    session = MockSession(id="s1", events=[MockEvent(content=MockContent(parts=[MockPart(text="retry me")]))])
+    await memory_service.add_sessions_to_memory([session])
+    assert calls == [1, 1]
+    assert memory_service._pending == []
+
+    def locked_insert(rows):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(memory_service, "_insert_memories", locked_insert)
+    session = MockSession(id="s2", events=[MockEvent(content=MockContent(parts=[MockPart(text="still locked")]))])
+    with pytest.raises(sqlite3.OperationalError):
+        await memory_service.add_sessions_to_memory([session])
+    assert len(memory_service._pending) == 1
+
 @pytest.mark.asyncio
 async def test_empty_session_ignored(memory_service, memory_db_path):
     """Test that empty sessions are not persisted."""
+    await memory_service.initialize()
     session = MockSession(id="empty", events=[])
     await memory_service.add_session_to_memory(session)
     
-    with sqlite3.connect(memory_db_path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT count(*) FROM memories")
-        count = cursor.fetchone()[0]
-        assert count == 0
+    assert read_db(memory_db_path, "SELECT count(*) FROM memories") == [(0,)]
+
+@pytest.mark.asyncio
+async def test_session_manager_caches_sessions():
+    """Test that repeat lookups reuse the session instead of hitting storage."""
+    service = FakeSessionService()
+    manager = SessionMemoryManager(
+        runner=None,
+        session_service=service,
+        memory_service=None,
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+
+    first = await manager._get_session("s1")
+    second = await manager._get_session("s1")
+
+    assert first is second
+    assert service.calls == ["get", "create"]
+
+    await manager.delete_session("s1")
+    await manager._get_session("s1")
+    assert service.calls == ["get", "create", "delete", "get", "create"]
+
+    await manager.aclose()
+    await manager._get_session("s1")
+    assert service.calls[-1] == "get"
+
+
+@pytest.mark.asyncio
+async def test_session_manager_propagates_storage_errors():
+    """Test that unexpected storage errors are not masked by a fallback lookup."""
+    class BrokenSessionService(FakeSessionService):
+        async def create_session(self, app_name, user_id, session_id):
+            raise RuntimeError("database is locked")
+
+    manager = SessionMemoryManager(
+        runner=None,
+        session_service=BrokenSessionService(),
+        memory_service=None,
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+
+    with pytest.raises(RuntimeError):
+        await manager._get_session("s1")
+
+
+@pytest.mark.asyncio
+async def test_run_session_collects_only_on_request():
+    """Test that responses are streamed and only buffered when collect=True."""
+    class FakeRunner:
+        async def run_async(self, user_id, session_id, new_message):
+            for text in ("first", "second"):
+                yield MockEvent(content=MockContent(parts=[MockPart(text=text)], role="model"), author="model")
+
+    manager = SessionMemoryManager(
+        runner=FakeRunner(),
+        session_service=FakeSessionService(),
+        memory_service=None,
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+
+    seen = []
+    result = await manager.run_session("hi", on_response=seen.append, print_output=False)
+    assert result is None
+    assert seen == ["first", "second"]
+
+    result = await manager.run_session("hi", print_output=False, collect=True)
+    assert result == ["first", "second"]
+
+    streamed = [text async for text in manager.run_session_iter("hi")]
+    assert streamed == ["first", "second"]
+
+    pairs = [pair async for pair in manager.iter_session("hi")]
+    assert pairs == [("model", "first"), ("model", "second")]
+
+
+@pytest.mark.asyncio
+async def test_run_session_skips_blank_and_repeated_queries():
+    """Test that whitespace-only queries never reach the runner and retries collapse."""
+    class RecordingRunner:
+        def __init__(self):
+            self.messages = []
+
+        async def run_async(self, user_id, session_id, new_message):
+            self.messages.append(new_message.parts[0].text)
+            yield MockEvent(content=MockContent(parts=[MockPart(text="ok")], role="model"), author="model")
+
+    runner = RecordingRunner()
+    service = FakeSessionService()
+    manager = SessionMemoryManager(
+        runner=runner,
+        session_service=service,
+        memory_service=None,
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+
+    await manager.run_session(["  ", "\n"], print_output=False)
+    assert runner.messages == []
+    assert service.calls == []
+
+    await manager.run_session(["hi", "hi", " ", "bye", "hi"], print_output=False)
+    assert runner.messages == ["hi", "bye", "hi"]
+
+
+@pytest.mark.asyncio
+async def test_iter_session_events():
+    """Test that session events can be streamed or collected."""
+    manager = SessionMemoryManager(
+        runner=None,
+        session_service=FakeSessionService(),
+        memory_service=None,
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+    session = await manager._get_session("s1")
+    session.events = ["e1", "e2", "e3"]
+
+    iterator = manager.iter_session_events("s1")
+    assert await iterator.__anext__() == "e1"
+    await iterator.aclose()
+
+    assert await manager.get_session_events("s1") == ["e1", "e2", "e3"]
+
+
+@pytest.mark.asyncio
+async def test_run_session_persists_in_background():
+    """Test that memory writes finish after run_session returns and aclose waits for them."""
+    release = asyncio.Event()
+    stored = []
+
+    class SlowMemoryService:
+        async def add_session_to_memory(self, session):
+            await release.wait()
+            stored.append(session.id)
+
+    class FakeRunner:
+        async def run_async(self, user_id, session_id, new_message):
+            yield MockEvent(content=MockContent(parts=[MockPart(text="ok")], role="model"), author="model")
+
+    manager = SessionMemoryManager(
+        runner=FakeRunner(),
+        session_service=FakeSessionService(),
+        memory_service=SlowMemoryService(),
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+
+    await manager.run_session("hi", session_id="s1", print_output=False)
+    assert stored == []
+
+    release.set()
+    await manager.aclose()
+    assert stored == ["s1"]
+
+
+@pytest.mark.asyncio
+async def test_background_persists_are_batched(memory_service, memory_db_path):
+    """Test that sessions queued close together are written in one batch."""
+    batches = []
+    original = memory_service.add_sessions_to_memory
+
+    async def recording_add_sessions(sessions):
+        batches.append([session.id for session in sessions])
+        await original(sessions)
+
+    memory_service.add_sessions_to_memory = recording_add_sessions
+
+    class FakeRunner:
+        async def run_async(self, user_id, session_id, new_message):
+            yield MockEvent(content=MockContent(parts=[MockPart(text="ok")], role="model"), author="model")
+
+    service = FakeSessionService()
+    for session_id in ("s1", "s2"):
+        await service.create_session("test_app", "default", session_id)
+        service.sessions[session_id].events.append(
+            MockEvent(content=MockContent(parts=[MockPart(text=f"hello from {session_id}")]))
+        )
+
+    manager = SessionMemoryManager(
+        runner=FakeRunner(),
+        session_service=service,
+        memory_service=memory_service,
+        config=SessionMemoryConfig(app_name="test_app"),
+    )
+
+    for session_id in ("s1", "s2", "s1"):
+        await manager.run_session("hi", session_id=session_id, print_output=False)
+    await manager.aclose()
+
+    assert batches == [["s1", "s2"]]
+    assert read_db(memory_db_path, "SELECT count(*) FROM memories") == [(2,)]
@@ -12,6 +12,7 @@ Tests cover:
 
 import pytest
 import json
+from dataclasses import FrozenInstanceError
 from datetime import datetime
 from scheduler_agent.reasoning_engine import ReasoningEngine, ThoughtType, Thought
 
@@ -60,6 +61,15 @@ class TestThought:
         assert result["timestamp"] == timestamp.isoformat()
         assert result["metadata"] == {"key": "value"}
     
+    def test_thought_is_immutable(self):
+        """Test that a logged thought cannot be changed afterwards"""
+        timestamp = datetime.now()
+        thought = Thought(content="Test", thought_type=ThoughtType.ANALYSIS, timestamp=timestamp)
+        
+        with pytest.raises(FrozenInstanceError):
+            thought.content = "Changed"
+        assert thought == Thought(content="Test", thought_type=ThoughtType.ANALYSIS, timestamp=timestamp)
+    
     def test_thought_str_representation(self):
         """Test string representation of thought"""
         thought = Thought(
@@ -117,6 +127,60 @@ class TestReasoningEngine:
         
         assert len(engine) == 0
     
+    def test_toggle_enabled(self):
+        """Test that enabling/disabling after creation takes effect"""
+        engine = ReasoningEngine(enabled=True)
+        
+        engine.enabled = False
+        engine.think("Dropped", ThoughtType.ANALYSIS)
+        engine.enabled = True
+        engine.think("Kept", ThoughtType.ANALYSIS)
+        
+        assert len(engine) == 1
+        assert engine.thoughts[0].content == "Kept"
+    
+    def test_think_many(self):
+        """Test logging several thoughts with one shared timestamp"""
+        engine = ReasoningEngine()
+        received = []
+        engine.on_thought(received.append)
+        
+        engine.think_many([
+            ("First", ThoughtType.PLANNING),
+            ("Second", ThoughtType.DECISION),
+        ])
+        
+        assert [t.content for t in engine.thoughts] == ["First", "Second"]
+        assert engine.thoughts[0].timestamp == engine.thoughts[1].timestamp
+        assert len(received) == 2
+        
+        engine.enabled = False
+        engine.think_many([("Dropped", ThoughtType.ANALYSIS)])
+        assert len(engine) == 2
+    
+    def test_max_thoughts_bound(self):
+        """Test that only the most recent thoughts are retained"""
+        engine = ReasoningEngine(max_thoughts=2)
+        
+        for i in range(3):
+            engine.think(f"Thought {i}", ThoughtType.ANALYSIS)
+        
+        assert len(engine) == 2
+        assert [t.content for t in engine.get_reasoning_chain()] == ["Thought 1", "Thought 2"]
+    
+    def test_max_thoughts_bound_filtered(self):
+        """Test that dropped thoughts also leave the per-type results and summary"""
+        engine = ReasoningEngine(max_thoughts=2)
+        
+        engine.think("Analysis 1", ThoughtType.ANALYSIS)
+        engine.think("Decision 1", ThoughtType.DECISION)
+        engine.think("Analysis 2", ThoughtType.ANALYSIS)
+        engine.think("Concern 1", ThoughtType.CONCERN)
+        
+        assert engine.get_reasoning_chain(ThoughtType.DECISION) == []
+        assert [t.content for t in engine.get_reasoning_chain(ThoughtType.ANALYSIS)] == ["Analysis 2"]
+        assert engine.get_summary()["thoughts_by_type"] == {"analysis": 1, "concern": 1}
+    
     def test_get_reasoning_chain_all(self):
         """Test retrieving all thoughts"""
         engine = ReasoningEngine()
@@ -199,6 +263,21 @@ class TestReasoningEngine:
         assert "\n" in json_str
         assert "  " in json_str  # Indentation
     
+    def test_json_output_same_with_or_without_orjson(self):
+        """Test that the orjson and json paths produce identical text"""
+        from scheduler_agent.reasoning_engine import _dumps, _json_dumps
+        
+        thoughts = [{"content": "Café at 10:00", "type": "analysis", "metadata": {"rooms": ["Zürich", 2]}}]
+        
+        compact = '[{"content":"Café at 10:00","type":"analysis","metadata":{"rooms":["Zürich",2]}}]'
+        pretty = (
+            '[\n  {\n    "content": "Café at 10:00",\n    "type": "analysis",\n'
+            '    "metadata": {\n      "rooms": [\n        "Zürich",\n        2\n      ]\n    }\n  }\n]'
+        )
+        for dumps in (_dumps, _json_dumps):
+            assert dumps(thoughts, False) == compact
+            assert dumps(thoughts, True) == pretty
+    
     def test_clear(self):
         """Test clearing thoughts"""
         engine = ReasoningEngine()
@@ -268,6 +347,41 @@ class TestReasoningEngineStreaming:
         assert received_1[0].content == "Thought 1"
         assert received_2[1].content == "Thought 2"
     
+    def test_listener_registered_during_delivery(self):
+        """Test that a listener added by another listener starts with the next thought"""
+        engine = ReasoningEngine()
+        late = []
+        
+        def register_late(thought):
+            if thought.content == "Thought 1":
+                engine.on_thought(late.append)
+        
+        engine.on_thought(register_late)
+        engine.think("Thought 1", ThoughtType.ANALYSIS)
+        engine.think("Thought 2", ThoughtType.ANALYSIS)
+        
+        assert [t.content for t in late] == ["Thought 2"]
+    
+    def test_batch_mode_listener(self):
+        """Test that batch mode delivers thoughts in lists"""
+        engine = ReasoningEngine(stream_mode=False, batch_size=2)
+        
+        batches = []
+        engine.on_thought(lambda thoughts: batches.append(thoughts))
+        
+        engine.think("Thought 1", ThoughtType.ANALYSIS)
+        assert batches == []
+        
+        engine.think("Thought 2", ThoughtType.PLANNING)
+        engine.think("Thought 3", ThoughtType.DECISION)
+        assert len(batches) == 1
+        assert [t.content for t in batches[0]] == ["Thought 1", "Thought 2"]
+        
+        engine.flush()
+        assert len(batches) == 2
+        assert [t.content for t in batches[1]] == ["Thought 3"]
+        assert len(engine) == 3
+    
     def test_listener_exception_handling(self):
         """Test that listener exceptions don't break the engine"""
         engine = ReasoningEngine()
@@ -282,6 +396,25 @@ class TestReasoningEngineStreaming:
         
         # Thought should still be logged
         assert len(engine) == 1
+    
+    def test_failing_listener_is_removed(self):
+        """Test that a listener that raised is skipped from then on"""
+        engine = ReasoningEngine()
+        calls = []
+        received = []
+        
+        def bad_listener(thought):
+            calls.append(thought)
+            raise ValueError("Listener error")
+        
+        engine.on_thought(bad_listener)
+        engine.on_thought(received.append)
+        
+        engine.think("First", ThoughtType.ANALYSIS)
+        engine.think("Second", ThoughtType.ANALYSIS)
+        
+        assert len(calls) == 1
+        assert [t.content for t in received] == ["First", "Second"]
 
 
 class TestThoughtTypes:
@@ -1,17 +1,20 @@
 import pytest
+import time as time_module
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from datetime import datetime, date, time
 from scheduler_agent.tools.validation import check_conflict
+from scheduler_agent.tools import search
 from scheduler_agent.tools.search import get_user_details
 from scheduler_agent.data_manager import DataManager
+from scheduler_agent.datetime_utils import add_datetime_context, get_current_datetime_context, get_local_timezone, resolve_timezone, to_iso
 
 # Mock DataManager to avoid reading actual files
 @pytest.fixture
-def mock_data_manager():
-    with patch('scheduler_agent.tools.search.get_data_manager') as mock_get_dm:
-        mock_dm = MagicMock()
-        mock_get_dm.return_value = mock_dm
-        yield mock_dm
+def mock_data_manager(monkeypatch):
+    mock_dm = MagicMock()
+    monkeypatch.setattr(search, "get_data_manager", lambda: mock_dm)
+    return mock_dm
 
 def test_get_user_details(mock_data_manager):
     # Setup mock return
@@ -26,55 +29,98 @@ def test_get_user_details(mock_data_manager):
     assert details["country"] == "Japan"
     assert details["timezone"] == "Asia/Tokyo"
 
+def test_get_user_details_is_cached(mock_data_manager):
+    mock_data_manager.get_user_details.return_value = {
+        "email": "test@example.com", "country": "Japan", "preferences": {"vacation_dates": []}
+    }
+
+    first = get_user_details("test@example.com")
+    first["country"] = "changed"
+    first["preferences"]["vacation_dates"].append("2025-12-01")
+    second = get_user_details("test@example.com")
+
+    assert second["country"] == "Japan"
+    assert second["preferences"] == {"vacation_dates": []}
+    mock_data_manager.get_user_details.assert_called_once_with("test@example.com")
+
+def _free_calendar_service(calendar_ids):
+    """Plain stand-in for a service whose calendars are all free; records FreeBusy bodies."""
+    items = {"items": [{"id": cal_id, "selected": True} for cal_id in calendar_ids]}
+    calendars = {"calendars": {cal_id: {"busy": []} for cal_id in calendar_ids}}
+    bodies = []
+
+    def query(body):
+        bodies.append(body)
+        return SimpleNamespace(execute=lambda: calendars)
+
+    return SimpleNamespace(
+        calendarList=lambda: SimpleNamespace(list=lambda **kwargs: SimpleNamespace(execute=lambda: items)),
+        freebusy=lambda: SimpleNamespace(query=query),
+        freebusy_bodies=bodies,
+    )
+
 @patch('scheduler_agent.tools.validation.get_calendar_service')
 @patch('scheduler_agent.tools.validation.get_local_timezone')
 def test_check_conflict_timezone(mock_get_local_tz, mock_get_service):
-    # Setup mocks
-    mock_service = MagicMock()
+    # Setup mocks: one calendar, nothing booked
+    mock_service = _free_calendar_service(["primary"])
     mock_get_service.return_value = mock_service
     mock_get_local_tz.return_value = "UTC" # Default if no tz provided
     
-    # Mock calendar list
-    mock_service.calendarList().list().execute.return_value = {
-        "items": [{"id": "primary", "selected": True}]
-    }
-    
-    # Mock events list
-    mock_service.events().list().execute.return_value = {"items": []}
-    
     # Test with specific timezone (Tokyo is UTC+9)
     # 10:00 AM Tokyo = 1:00 AM UTC
     check_conflict("2025-12-01", "10:00", "11:00", timezone="Asia/Tokyo")
     
-    # Verify events().list was called with correct UTC conversion
+    # Verify the FreeBusy query was made with correct UTC conversion
     # We expect start time to be converted to UTC
     # 2025-12-01 10:00:00+09:00 -> 2025-12-01 01:00:00+00:00
-    call_args = mock_service.events().list.call_args[1]
-    assert "2025-12-01T01:00:00+00:00" in call_args["timeMin"]
-    assert "2025-12-01T02:00:00+00:00" in call_args["timeMax"]
+    body = mock_service.freebusy_bodies[-1]
+    assert "2025-12-01T01:00:00+00:00" in body["timeMin"]
+    assert "2025-12-01T02:00:00+00:00" in body["timeMax"]
 
 @patch('scheduler_agent.tools.validation.get_calendar_service')
 @patch('scheduler_agent.tools.validation.get_local_timezone')
 def test_check_conflict_default_timezone(mock_get_local_tz, mock_get_service):
-    # Setup mocks
-    mock_service = MagicMock()
+    # Setup mocks: one calendar, nothing booked
+    mock_service = _free_calendar_service(["primary"])
     mock_get_service.return_value = mock_service
     mock_get_local_tz.return_value = "Asia/Singapore" # System local is Singapore (UTC+8)
     
-    # Mock calendar list
-    mock_service.calendarList().list().execute.return_value = {
-        "items": [{"id": "primary", "selected": True}]
-    }
-    
-    # Mock events list
-    mock_service.events().list().execute.return_value = {"items": []}
-    
     # Test without timezone argument (should use local default)
     # 10:00 AM Singapore = 2:00 AM UTC
     check_conflict("2025-12-01", "10:00", "11:00")
     
-    # Verify events().list was called with correct UTC conversion
+    # Verify the FreeBusy query was made with correct UTC conversion
     # 2025-12-01 10:00:00+08:00 -> 2025-12-01 02:00:00+00:00
-    call_args = mock_service.events().list.call_args[1]
-    assert "2025-12-01T02:00:00+00:00" in call_args["timeMin"]
-    assert "2025-12-01T03:00:00+00:00" in call_args["timeMax"]
+    body = mock_service.freebusy_bodies[-1]
+    assert "2025-12-01T02:00:00+00:00" in body["timeMin"]
+    assert "2025-12-01T03:00:00+00:00" in body["timeMax"]
+
+def test_resolve_timezone_reuses_zone():
+    tokyo = resolve_timezone("Asia/Tokyo")
+    assert resolve_timezone("Asia/Tokyo") is tokyo
+    assert resolve_timezone(tokyo) is tokyo
+    assert to_iso(date(2025, 12, 1), time(10, 0), tokyo) == to_iso(date(2025, 12, 1), time(10, 0), "Asia/Tokyo")
+
+@pytest.mark.skipif(not hasattr(time_module, "tzset"), reason="needs time.tzset")
+def test_get_local_timezone_follows_offset_change(monkeypatch):
+    try:
+        monkeypatch.setenv("TZ", "Asia/Singapore")
+        time_module.tzset()
+        assert get_local_timezone().utcoffset(None).total_seconds() == 8 * 3600
+        monkeypatch.setenv("TZ", "UTC")
+        time_module.tzset()
+        assert get_local_timezone().utcoffset(None).total_seconds() == 0
+    finally:
+        monkeypatch.undo()
+        time_module.tzset()
+
+def test_datetime_context_added_per_model_call():
+    # Same minute -> cached text; the callback appends it to the system instruction
+    assert get_current_datetime_context() is get_current_datetime_context()
+
+    llm_request = MagicMock()
+    add_datetime_context(None, llm_request)
+
+    (instructions,), _ = llm_request.append_instructions.call_args
+    assert instructions[0].startswith("Current date and time:")
@@ -11,29 +11,80 @@ Tests cover:
 import pytest
 import asyncio
 import json
-from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
 from pathlib import Path
 from scheduler_agent.tools.validation import validate_event_comprehensive, check_policies
 from scheduler_agent.parallel_execution.policy_engine import PolicyEngine, PolicyViolation, PolicySeverity
 from scheduler_agent.parallel_execution.validation_agent import ConflictValidationAgent, ValidationDimension, ValidationResult
+from scheduler_agent.reasoning_engine import ReasoningEngine, ThoughtType
+
+
+# Neither object keeps per-check state, so one of each serves every test
+# that doesn't need its own.
+@pytest.fixture(scope="session")
+def policy_engine():
+    return PolicyEngine()
+
+
+@pytest.fixture(scope="session")
+def conflict_agent():
+    return ConflictValidationAgent()
 
 
 class TestPolicyEngine:
     """Test the Policy Engine"""
     
     @pytest.mark.asyncio
-    async def test_load_policies(self):
+    async def test_load_policies(self, policy_engine):
         """Test loading policies from JSON"""
-        engine = PolicyEngine()
+        engine = policy_engine
         
         assert len(engine.policies) > 0
         assert any(p['id'] == 'max_meeting_duration' for p in engine.policies)
         assert any(p['id'] == 'large_meeting_approval' for p in engine.policies)
     
     @pytest.mark.asyncio
-    async def test_max_duration_violation(self):
+    async def test_policies_cached_across_instances(self):
+        """Test that engines sharing a policies file reuse one parse but not its entries"""
+        from scheduler_agent.parallel_execution.policy_engine import _load_policies_cached
+        
+        first = PolicyEngine()
+        hits = _load_policies_cached.cache_info().hits
+        second = PolicyEngine()
+        assert _load_policies_cached.cache_info().hits == hits + 1
+        
+        first.policies[0]['enabled'] = False
+        first.policies.append({"id": "extra"})
+        
+        assert second.policies[0].get('enabled', True) is True
+        assert second.policies == PolicyEngine().policies
+        assert len(second.policies) == len(first.policies) - 1
+    
+    def test_disabled_and_unknown_policies_skipped(self, tmp_path):
+        """Test that only enabled, known policies are checked"""
+        policies_file = tmp_path / "policies.json"
+        policies_file.write_text(json.dumps({"policies": [
+            {"id": "max_meeting_duration", "name": "Max", "severity": "warning",
+             "message": "Too long", "max_hours": 1, "enabled": False},
+            {"id": "minimum_attendees", "name": "Min", "severity": "warning",
+             "message": "Too few", "min_attendees": 3},
+            {"id": "no_such_policy", "name": "Unknown", "severity": "error", "message": "?"},
+        ]}))
+        engine = PolicyEngine(str(policies_file))
+        
+        violations = engine.check_policies_sync({
+            "date": "2030-01-07",
+            "start_time": "09:00",
+            "end_time": "12:00",
+            "attendees": "alice@example.com"
+        })
+        
+        assert [v.policy_id for v in violations] == ["minimum_attendees"]
+    
+    @pytest.mark.asyncio
+    async def test_max_duration_violation(self, policy_engine):
         """Test meeting duration policy"""
-        engine = PolicyEngine()
+        engine = policy_engine
         
         # 5-hour meeting (exceeds 4-hour limit)
         violations = await engine.check_policies({
@@ -48,10 +99,24 @@ class TestPolicyEngine:
         assert len(duration_violations) > 0
         assert duration_violations[0].severity == PolicySeverity.WARNING
     
+    def test_check_policies_sync(self, policy_engine):
+        """Test the synchronous policy check path"""
+        engine = policy_engine
+        
+        violations = engine.check_policies_sync({
+            "title": "Long Meeting",
+            "date": "2025-11-30",
+            "start_time": "09:00",
+            "end_time": "14:00",
+            "attendees": "alice@example.com"
+        })
+        
+        assert any(v.policy_id == 'max_meeting_duration' for v in violations)
+    
     @pytest.mark.asyncio
-    async def test_large_meeting_approval(self):
+    async def test_large_meeting_approval(self, policy_engine):
         """Test large meeting policy (20+ attendees)"""
-        engine = PolicyEngine()
+        engine = policy_engine
         
         # 25 attendees (requires approval)
         large_team = [f"person{i}@company.com" for i in range(25)]
@@ -70,9 +135,9 @@ class TestPolicyEngine:
         assert approval_violations[0].is_blocking()
     
     @pytest.mark.asyncio
-    async def test_business_hours_violation(self):
+    async def test_business_hours_violation(self, policy_engine):
         """Test business hours policy"""
-        engine = PolicyEngine()
+        engine = policy_engine
         
         # Meeting at 8 PM (outside 9-5)
         violations = await engine.check_policies({
@@ -87,20 +152,13 @@ class TestPolicyEngine:
         assert len(business_violations) > 0
     
     @pytest.mark.asyncio
-    async def test_weekend_violation(self):
+    async def test_weekend_violation(self, policy_engine, next_saturday_str):
         """Test weekend scheduling policy"""
-        engine = PolicyEngine()
-        
-        # Find next Saturday
-        today = datetime.now()
-        days_until_saturday = (5 - today.weekday()) % 7
-        if days_until_saturday == 0:
-            days_until_saturday = 7
-        next_saturday = (today + timedelta(days=days_until_saturday)).strftime("%Y-%m-%d")
+        engine = policy_engine
         
         violations = await engine.check_policies({
             "title": "Weekend Meeting",
-            "date": next_saturday,
+            "date": next_saturday_str,
             "start_time": "10:00",
             "end_time": "11:00",
             "attendees": "alice@example.com"
@@ -110,20 +168,14 @@ class TestPolicyEngine:
         assert len(weekend_violations) > 0
     
     @pytest.mark.asyncio
-    async def test_multiple_violations(self):
+    async def test_multiple_violations(self, policy_engine, next_saturday_str):
         """Test event with multiple policy violations"""
-        engine = PolicyEngine()
+        engine = policy_engine
         
         # Long meeting outside business hours on weekend
-        today = datetime.now()
-        days_until_saturday = (5 - today.weekday()) % 7
-        if days_until_saturday == 0:
-            days_until_saturday = 7
-        next_saturday = (today + timedelta(days=days_until_saturday)).strftime("%Y-%m-%d")
-        
         violations = await engine.check_policies({
             "title": "Weekend Marathon",
-            "date": next_saturday,
+            "date": next_saturday_str,
             "start_time": "08:00",
             "end_time": "18:00",  # 10 hours, before 9 AM, after 5 PM
             "attendees": "alice@example.com"
@@ -137,22 +189,25 @@ class TestConflictValidationAgent:
     """Test the Conflict Validation Agent"""
     
     @pytest.mark.asyncio
-    async def test_agent_creation(self):
+    async def test_agent_creation(self, conflict_agent):
         """Test creating validation agent"""
-        agent = ConflictValidationAgent()
+        agent = conflict_agent
         
         assert agent.policy_engine is not None
+        assert agent.coordinator is not None
+    
+    def test_policy_engine_shared(self):
+        """Test that agents for the same policy file share one PolicyEngine"""
+        assert ConflictValidationAgent().policy_engine is ConflictValidationAgent().policy_engine
     
     @pytest.mark.asyncio
-    async def test_validate_structure(self):
+    async def test_validate_structure(self, conflict_agent, tomorrow_str):
         """Test that validate_event returns correct structure"""
-        agent = ConflictValidationAgent()
-        
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        agent = conflict_agent
         
         result = await agent.validate_event({
             "title": "Test Meeting",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "14:00",
             "end_time": "15:00",
             "attendees": "alice@example.com"
@@ -171,15 +226,13 @@ class TestConflictValidationAgent:
         assert isinstance(result["execution_time"], float)
     
     @pytest.mark.asyncio
-    async def test_valid_event(self):
+    async def test_valid_event(self, conflict_agent, tomorrow_str):
         """Test validation of a simple valid event"""
-        agent = ConflictValidationAgent()
-        
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        agent = conflict_agent
         
         result = await agent.validate_event({
             "title": "Team Standup",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "10:00",
             "end_time": "10:30",
             "attendees": "alice@example.com, bob@example.com",
@@ -191,16 +244,15 @@ class TestConflictValidationAgent:
         assert result["valid"] or len(result["blocking_issues"]) == 0
     
     @pytest.mark.asyncio
-    async def test_large_meeting_blocked(self):
+    async def test_large_meeting_blocked(self, conflict_agent, tomorrow_str):
         """Test that large meetings are blocked"""
-        agent = ConflictValidationAgent()
+        agent = conflict_agent
         
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
         large_team = [f"person{i}@company.com" for i in range(25)]
         
         result = await agent.validate_event({
             "title": "All Hands",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "14:00",
             "end_time": "15:00",
             "attendees": ",".join(large_team)
@@ -211,15 +263,13 @@ class TestConflictValidationAgent:
         assert len(result["blocking_issues"]) > 0
     
     @pytest.mark.asyncio
-    async def test_parallel_validation(self):
+    async def test_parallel_validation(self, conflict_agent, tomorrow_str):
         """Test that validations run in parallel"""
-        agent = ConflictValidationAgent()
-        
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        agent = conflict_agent
         
         result = await agent.validate_event({
             "title": "Team Meeting",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "14:00",
             "end_time": "15:00",
             "attendees": "alice@example.com"
@@ -229,7 +279,7 @@ class TestConflictValidationAgent:
         assert len(result["validations"]) == 4
         
         # Verify all dimensions present
-        dimensions = set(result["validations"].keys())
+        dimensions = {v.dimension for v in result["validations"]}
         expected = {
             ValidationDimension.CALENDAR_CONFLICTS,
             ValidationDimension.ROOM_AVAILABILITY,
@@ -239,18 +289,108 @@ class TestConflictValidationAgent:
         assert dimensions == expected
     
     @pytest.mark.asyncio
-    async def test_reasoning_integration(self):
-        """Test integration with ReasoningEngine"""
-        from scheduler_agent.reasoning_engine import ReasoningEngine, ThoughtType
+    async def test_freebusy_sent_before_other_validators(self, tomorrow_str):
+        """Test that the FreeBusy request is sent before the CPU-only validators run"""
+        order = []
+        service = MagicMock()
+        service.freebusy().query().execute.side_effect = lambda: (
+            order.append("freebusy-submitted") or {"calendars": {}}
+        )
+        agent = ConflictValidationAgent()
+        check_policies_sync = agent._validate_policies_sync
+        
+        def validate_policies(event, parsed):
+            order.append("policy-validator-ran")
+            return check_policies_sync(event, parsed)
+        
+        agent._validate_policies_sync = validate_policies
+        
+        with patch(
+            "scheduler_agent.parallel_execution.availability_checker.get_calendar_service",
+            return_value=service
+        ):
+            await agent.validate_event({
+                "title": "Team Meeting",
+                "date": tomorrow_str,
+                "start_time": "14:00",
+                "end_time": "15:00",
+                "attendees": "alice@example.com"
+            })
+        
+        assert order == ["freebusy-submitted", "policy-validator-ran"]
+    
+    @pytest.mark.asyncio
+    async def test_no_attendees_skips_calendar_check(self, conflict_agent, tomorrow_str):
+        """Test that events without attendees still report every dimension"""
+        agent = conflict_agent
+        
+        result = await agent.validate_event({
+            "title": "Focus Time",
+            "date": tomorrow_str,
+            "start_time": "10:00",
+            "end_time": "11:00",
+            "attendees": ""
+        })
+        
+        assert len(result["validations"]) == 4
+        calendar = result["validations"][ValidationDimension.CALENDAR_CONFLICTS]
+        assert calendar.passed
+        assert calendar.warnings == []
+    
+    def test_parse_event_mixed_separators(self):
+        """Test that attendees split on commas, semicolons and whitespace"""
+        parsed = ConflictValidationAgent._parse_event({
+            "attendees": "a@example.com; b@example.com,c@example.com  d@example.com,",
+            "start_time": "09:30",
+        })
         
+        assert parsed["attendee_list"] == [
+            "a@example.com", "b@example.com", "c@example.com", "d@example.com"
+        ]
+        assert parsed["start_hour"] == 9
+    
+    @pytest.mark.asyncio
+    async def test_conflict_reported_after_booking(self, tomorrow_str):
+        """Test that validating a slot just booked sees the new conflict"""
+        from scheduler_agent.tools import events
+        
+        service = MagicMock()
+        service.calendars().get().execute.return_value = {"id": "me@example.com"}
+        service.events().insert().execute.return_value = {"id": "evt1"}
+        service.freebusy().query().execute.side_effect = [
+            {"calendars": {"bob@example.com": {"busy": []}}},
+            {"calendars": {"bob@example.com": {"busy": [{"start": "s", "end": "e"}]}}},
+        ]
+        event = {
+            "title": "Sync",
+            "date": tomorrow_str,
+            "start_time": "14:00",
+            "end_time": "15:00",
+            "attendees": "bob@example.com",
+        }
+        agent = ConflictValidationAgent()
+        
+        with patch(
+            "scheduler_agent.parallel_execution.availability_checker.get_calendar_service",
+            return_value=service
+        ), patch.object(events, "get_calendar_service", return_value=service):
+            before = await agent.validate_event(event)
+            events.create_event("Sync", tomorrow_str, "14:00", "15:00", "bob@example.com")
+            after = await agent.validate_event(event)
+        
+        assert before["validations"][ValidationDimension.CALENDAR_CONFLICTS].passed
+        calendar = after["validations"][ValidationDimension.CALENDAR_CONFLICTS]
+        assert calendar.issues == ["Attendee bob@example.com has 1 conflict(s)"]
+    
+    @pytest.mark.asyncio
+    async def test_reasoning_integration(self, tomorrow_str):
+        """Test integration with ReasoningEngine"""
         engine = ReasoningEngine(enabled=True)
         agent = ConflictValidationAgent(reasoning_engine=engine)
         
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
-        
         result = await agent.validate_event({
             "title": "Team Meeting",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "14:00",
             "end_time": "15:00",
             "attendees": "alice@example.com"
@@ -268,15 +408,13 @@ class TestIntegrationScenarios:
     """Test realistic validation scenarios"""
     
     @pytest.mark.asyncio
-    async def test_typical_team_meeting(self):
+    async def test_typical_team_meeting(self, conflict_agent, tomorrow_str):
         """Test validating a typical team meeting"""
-        agent = ConflictValidationAgent()
-        
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        agent = conflict_agent
         
         result = await agent.validate_event({
             "title": "Sprint Planning",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "10:00",
             "end_time": "12:00",  # 2 hours - OK
             "attendees": "alice@example.com, bob@example.com, carol@example.com, dave@example.com",
@@ -287,16 +425,15 @@ class TestIntegrationScenarios:
         assert result["execution_time"] > 0
     
     @pytest.mark.asyncio
-    async def test_problematic_event(self):
+    async def test_problematic_event(self, conflict_agent, tomorrow_str):
         """Test event with multiple problems"""
-        agent = ConflictValidationAgent()
+        agent = conflict_agent
         
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
         large_team = [f"person{i}@company.com" for i in range(30)]
         
         result = await agent.validate_event({
             "title": "Marathon Planning",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "08:00",
             "end_time": "20:00",  # 12 hours!
             "attendees": ",".join(large_team)  # 30 people!
@@ -307,15 +444,13 @@ class TestIntegrationScenarios:
         assert total_problems >= 2
     
     @pytest.mark.asyncio
-    async def test_performance_under_2_seconds(self):
+    async def test_performance_under_2_seconds(self, conflict_agent, tomorrow_str):
         """Test that validation completes quickly"""
-        agent = ConflictValidationAgent()
-        
-        tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+        agent = conflict_agent
         
         result = await agent.validate_event({
             "title": "Quick Test",
-            "date": tomorrow,
+            "date": tomorrow_str,
             "start_time": "14:00",
             "end_time": "15:00",
             "attendees": ",".join([f"p{i}@company.com" for i in range(5)])